@@ -0,0 +1,66 @@
+"""
+Toggles a source bound to many dependents, comparing the binding engine behind Linked.link/visible
+with the previous approach of one lambda connection per dependent.
+
+    python -m benchmarks.binding_toggle [--dependents 1000] [--toggles 20]
+"""
+import argparse
+import time
+
+from benchmarks.common import application, report
+
+
+def build(dependents: int, legacy: bool):
+    from comps.Elements import Field, Horizontal, Text, Toggle, Vertical, Window
+    source = Toggle().check(True)
+    rows = []
+    for n in range(dependents // 2):
+        field, label = Field(f"field {n}"), Text(f"label {n}")
+        if legacy:
+            field.setEnabled(source.isChecked())
+            source.stateChanged.connect(lambda x, field=field: field.setEnabled(x))
+            label.setVisible(source.isChecked())
+            source.stateChanged.connect(lambda x, label=label: label.setVisible(x))
+        else:
+            field.link(source)
+            label.visible(source)
+        rows.append(Horizontal(label, field))
+    window = Window(Vertical(source, *rows))
+    window.resize(800, 600)
+    window.show()
+    return window, source
+
+
+def run(dependents: int, toggles: int, legacy: bool) -> tuple[float, float]:
+    """Returns the mean time of the toggle itself and of the toggle followed by the repaint"""
+    app = application()
+    window, source = build(dependents, legacy)
+    app.processEvents()
+    applying = total = 0.0
+    for _ in range(toggles):
+        start = time.perf_counter()
+        source.toggle()
+        applied = time.perf_counter()
+        app.processEvents()
+        applying += applied - start
+        total += time.perf_counter() - start
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return applying / toggles, total / toggles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dependents", type=int, default=1000)
+    parser.add_argument("--toggles", type=int, default=20)
+    args = parser.parse_args()
+    rows = []
+    for name, legacy in (("lambda per dependent", True), ("binding engine", False)):
+        applying, total = run(args.dependents, args.toggles, legacy)
+        rows.append((name, args.dependents, f"{applying * 1000:.1f} ms", f"{total * 1000:.1f} ms"))
+    report(("binding", "dependents", "toggle", "toggle + repaint"), rows)
+
+
+if __name__ == "__main__":
+    main()
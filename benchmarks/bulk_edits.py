@@ -0,0 +1,61 @@
+"""
+Removes and replaces entries of a VirtualListWidget of a million entries in bulk: 100k scattered entries with
+remove_many, the entries matching a regular expression with remove_where and 10k entries with replace_all, with and
+without a FilterBar applied. Compares the removal with popping the same entries one at a time, measured on a
+sample and scaled.
+
+    python -m benchmarks.bulk_edits [--items 1000000] [--remove 100000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.common import application, report, timed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000000, help="entries of the list")
+    parser.add_argument("--remove", type=int, default=100000, help="entries to remove")
+    args = parser.parse_args()
+    app = application()
+    from comps import Elements
+    random.seed(0)
+    items = [f"user{n}@{random.choice(['example.com', 'mail.net', 'inbox.org'])}" for n in range(args.items)]
+    rows = []
+    for filtered in (False, True):
+        view = Elements.VirtualListWidget(*items)
+        view.resize(400, 600)
+        view.show()
+        bar = Elements.FilterBar(view) if filtered else None
+
+        def settle() -> None:
+            # the time the filter takes to catch up is part of the operation
+            while bar is not None and bar.model.is_searching():
+                app.processEvents()
+            app.processEvents()
+        if bar is not None:
+            bar.field.setText("mail")
+        settle()
+        label = "filtered" if filtered else "plain"
+        doomed = random.sample(range(view.count()), args.remove)
+        removed, _ = timed(lambda: (view.remove_many(doomed), settle()))
+        rows.append((label, f"remove_many {args.remove}", f"{removed * 1000:.0f} ms"))
+        count = view.count()
+        matched, _ = timed(lambda: (view.remove_where(r"9@inbox"), settle()))
+        rows.append((label, f"remove_where ({count - view.count()} matches)", f"{matched * 1000:.0f} ms"))
+        mapping = {view.text(row): f"renamed{row}" for row in random.sample(range(view.count()), 10000)}
+        replaced, _ = timed(lambda: (view.replace_all(mapping), settle()))
+        rows.append((label, "replace_all 10000", f"{replaced * 1000:.0f} ms"))
+        sample = sorted(random.sample(range(view.count()), 200), reverse=True)
+        start = time.perf_counter()
+        for row in sample:
+            view.pop(row)
+        single = (time.perf_counter() - start) / len(sample) * args.remove
+        rows.append((label, f"pop {args.remove} one at a time", f"~{single * 1000:.0f} ms"))
+        view.deleteLater()
+    report(("list", "operation", "time"), rows)
+
+
+if __name__ == "__main__":
+    main()
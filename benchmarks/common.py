@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def application():
+    """Returns the running QApplication, creating an offscreen one if needed"""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+def rss() -> int:
+    """Returns the resident memory of the process in bytes (the peak one where the current one is not available)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[float, Any]:
+    """Calls fn and returns the elapsed seconds along with its result"""
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def isolated(module: str, *args: Any) -> Dict[str, Any]:
+    """Runs `python -m module --child args` in a fresh interpreter and returns the JSON it printed last"""
+    output = subprocess.run([sys.executable, "-m", module, "--child", *map(str, args)],
+                            cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def emit(result: Dict[str, Any]) -> None:
+    """Prints the result of a child run for `isolated`"""
+    print(json.dumps(result), flush=True)
+
+
+def mib(n: float) -> str:
+    return f"{n / 2**20:.1f} MiB"
+
+
+def report(headers: Sequence[str], rows: List[Sequence[Any]]) -> None:
+    """Prints rows as an aligned table"""
+    table = [list(map(str, headers))] + [list(map(str, row)) for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    for n, row in enumerate(table):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if n == 0:
+            print("  ".join("-" * width for width in widths))
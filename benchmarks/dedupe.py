@@ -0,0 +1,82 @@
+"""
+Merges two text files of a million lines each, half of the second one already in the first, into a unique
+VirtualListWidget, and reports the time to load and merge them, the time of `contains` and `index_of`, and what
+checking the entries of the second file with a scan of the list would take instead.
+
+    python -m benchmarks.dedupe [--lines 1000000] [--overlap 0.5]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.common import application, mib, report, rss, timed
+
+
+def lines_of(path: str, batch: int = 50000):
+    with open(path, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    for start in range(0, len(lines), batch):
+        yield lines[start:start + batch]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=1000000, help="lines of each file")
+    parser.add_argument("--overlap", type=float, default=0.5, help="share of the second file found in the first")
+    args = parser.parse_args()
+    app = application()
+    from comps import Elements
+    random.seed(0)
+    first = [f"user{n}:{random.randrange(10**9)}" for n in range(args.lines)]
+    shared = int(args.lines * args.overlap)
+    second = random.sample(first, shared) + [f"other{n}:{random.randrange(10**9)}" for n in range(args.lines - shared)]
+    random.shuffle(second)
+    paths = []
+    for lines in (first, second):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        paths.append(file.name)
+    try:
+        view = Elements.VirtualListWidget(unique=True)
+        before = rss()
+        loaded, _ = timed(lambda: [view.add(*batch) for batch in lines_of(paths[0])])
+        merged, _ = timed(lambda: [view.add(*batch) for batch in lines_of(paths[1])])
+        memory = rss() - before
+        probes = random.sample(first, 1000) + random.sample(second, 1000)
+        contains, _ = timed(lambda: [view.contains(probe) for probe in probes])
+        view.pop(0)
+        # the first lookup after a removal numbers the shifted rows again, the next ones are direct
+        renumber, _ = timed(lambda: view.index_of(first[-1]))
+        index_of, _ = timed(lambda: [view.index_of(probe) for probe in probes])
+        # the rows shifted by an insertion are numbered again, the entry after it has to be found one row further
+        shifted = view.list_model.items[1]
+        view.list_model.insert(1, "inserted")
+        inserted = "ok" if view.index_of(shifted) == 2 and view.index_of("inserted") == 1 else "wrong"
+        # a scan per entry, measured on a sample and scaled to the whole second file
+        items = view.list_model.items
+        sample = second[:20]
+        start = time.perf_counter()
+        for line in sample:
+            _ = line in items
+        scan = (time.perf_counter() - start) / len(sample) * len(second)
+        expected = len(set(first) | set(second))
+        report(("step", "result"), [
+            ("load the first file", f"{loaded * 1000:.0f} ms"),
+            ("merge the second file", f"{merged * 1000:.0f} ms"),
+            ("entries", f"{view.count()} ({'ok' if view.count() == expected else f'expected {expected}'})"),
+            ("memory", mib(memory)),
+            ("contains", f"{contains / len(probes) * 1e6:.2f} us"),
+            ("index_of", f"{index_of / len(probes) * 1e6:.2f} us"),
+            ("index_of after a removal", f"{renumber * 1000:.0f} ms once"),
+            ("index_of after an insertion", inserted),
+            ("merge with a scan per entry", f"~{scan:.0f} s"),
+        ])
+    finally:
+        for path in paths:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
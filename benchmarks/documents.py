@@ -0,0 +1,76 @@
+"""
+Loads a large text file into MultilineField and PlainMultilineField, each in a fresh interpreter, and reports
+the time to load it, the latency of typing in it and the time to save it back, along with the memory it took.
+
+    python -m benchmarks.documents [--size 50] [--keys 50]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import application, emit, isolated, mib, report, rss
+
+
+def child(kind: str, path: str, keys: int) -> None:
+    app = application()
+    from PyQt6.QtCore import QEvent, Qt
+    from PyQt6.QtGui import QKeyEvent
+    from comps import Elements
+    field = getattr(Elements, kind)()
+    field.resize(800, 600)
+    field.show()
+    app.processEvents()
+    before = rss()
+    start = time.perf_counter()
+    loader = field.load(path)
+    loader.start()
+    while loader.is_running():
+        app.processEvents()
+    loaded = time.perf_counter()
+    memory = rss() - before
+    # type at the end of the document, each key press is followed by the repaint it causes
+    field.moveCursor(field.textCursor().MoveOperation.End)
+    latencies = []
+    for _ in range(keys):
+        key = time.perf_counter()
+        app.sendEvent(field, QKeyEvent(QEvent.Type.KeyPress, Qt.Key.Key_A, Qt.KeyboardModifier.NoModifier, "a"))
+        field.repaint()
+        latencies.append(time.perf_counter() - key)
+    start_save = time.perf_counter()
+    field.save(path + ".out")
+    saved = time.perf_counter()
+    os.remove(path + ".out")
+    latencies.sort()
+    emit({"load": loaded - start, "key": latencies[len(latencies) // 2], "worst key": latencies[-1],
+          "save": saved - start_save, "memory": memory})
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        child(sys.argv[-3], sys.argv[-2], int(sys.argv[-1]))
+        return
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=50, help="megabytes of text")
+    parser.add_argument("--keys", type=int, default=50, help="key presses to time")
+    args = parser.parse_args()
+    line = "{n}: the quick brown fox jumps over the lazy dog, {n} times\n"
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        n = 0
+        while file.tell() < args.size * 2**20:
+            file.write("".join(line.format(n=n + i) for i in range(10000)))
+            n += 10000
+    try:
+        rows = []
+        for kind in ("MultilineField", "PlainMultilineField"):
+            run = isolated("benchmarks.documents", kind, file.name, args.keys)
+            rows.append((kind, *(f"{run[phase] * 1000:.1f} ms" for phase in ("load", "key", "worst key", "save")),
+                         mib(run["memory"])))
+        report(("field", "load", "key (median)", "key (worst)", "save", "memory"), rows)
+    finally:
+        os.remove(file.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Exports a VirtualListWidget of a million entries to every format with comps.exporters.Exporter, each in a fresh
+interpreter, and reports how long the GUI thread was blocked taking the snapshot, the longest frame the event loop
+went without while the file was written, and the write throughput. Excel is skipped without openpyxl.
+
+    python -m benchmarks.export [--rows 1000000] [--excel-rows 100000] [--formats text csv json excel]
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import application, emit, isolated, report
+
+
+def child(format: str, rows: int) -> None:
+    app = application()
+    from PyQt6.QtCore import QTimer
+    from comps.Elements import VirtualListWidget
+    from comps.exporters import Exporter
+    widget = VirtualListWidget(*(f"user{n}@example.com" for n in range(rows)))
+    path = os.path.join(tempfile.mkdtemp(), "export")
+    start = time.perf_counter()
+    exporter = Exporter(widget, path, format)
+    snapshot = time.perf_counter() - start
+    # a 1 ms timer records the longest time the event loop could not run
+    ticks = [time.perf_counter()]
+    gaps = []
+    timer = QTimer()
+    timer.timeout.connect(lambda: (gaps.append(time.perf_counter() - ticks[-1]), ticks.append(time.perf_counter())))
+    timer.start(1)
+    errors = []
+    exporter.failed.connect(errors.append)
+    exporter.start()
+    while exporter.is_running():
+        app.processEvents()
+    total = time.perf_counter() - start
+    if errors:
+        raise RuntimeError(errors[0])
+    size = os.path.getsize(path)
+    os.remove(path)
+    emit({"snapshot": snapshot, "stall": max(gaps, default=0), "total": total, "size": size})
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        child(sys.argv[-2], int(sys.argv[-1]))
+        return
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--excel-rows", type=int, default=100_000, help="openpyxl writes about 100k rows a second")
+    parser.add_argument("--formats", nargs="+", default=["text", "csv", "json", "excel"])
+    args = parser.parse_args()
+    rows = []
+    for format in args.formats:
+        if format == "excel" and importlib.util.find_spec("openpyxl") is None:
+            continue
+        count = args.excel_rows if format == "excel" else args.rows
+        run = isolated("benchmarks.export", format, count)
+        rows.append((format, count, f"{run['snapshot'] * 1000:.1f} ms", f"{run['stall'] * 1000:.1f} ms",
+                     f"{run['total'] * 1000:.0f} ms", f"{run['size'] / 2**20 / run['total']:.1f} MiB/s"))
+    report(("format", "rows", "snapshot", "longest stall", "total", "throughput"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Types queries one key at a time into a FilterBar over a VirtualListWidget of a million entries, and reports for
+every key the time until the first matches are shown, the time until all of them are found (spread over frames
+so the window keeps responding) and the time a plain scan of every entry takes for the same query, which holds the
+window for all of it. Then appends, removes and changes entries while a query is applied.
+
+    python -m benchmarks.filtering [--items 1000000]
+"""
+import argparse
+import random
+import re
+import time
+
+from benchmarks.common import application, report, timed
+
+QUERIES = ["user9", "@exa", r"^user\d+7@"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000000, help="entries of the list")
+    args = parser.parse_args()
+    app = application()
+    from comps import Elements
+    random.seed(0)
+    domains = ["example.com", "mail.net", "inbox.org", "post.io"]
+    items = [f"user{random.randrange(10**7)}@{random.choice(domains)}" for _ in range(args.items)]
+    view = Elements.VirtualListWidget(*items)
+    built, bar = timed(lambda: Elements.FilterBar(view))
+    view.resize(400, 600)
+    view.show()
+    app.processEvents()
+    print(f"index of {args.items} entries built in {built * 1000:.0f} ms")
+
+    rows = []
+    for query in QUERIES:
+        regex = query.startswith("^")
+        bar.regex.setChecked(regex)
+        pattern = re.compile(query, re.IGNORECASE) if regex else None
+        for end in range(1, len(query) + 1) if not regex else [len(query)]:
+            text = query[:end]
+            start = time.perf_counter()
+            # the key press runs the first slice of the search, the repaint shows its matches
+            bar.field.setText(text)
+            view.viewport().repaint()
+            shown = time.perf_counter() - start
+            while bar.model.is_searching():
+                app.processEvents()
+            complete = time.perf_counter() - start
+            if pattern is not None:
+                naive, _ = timed(lambda: [n for n, item in enumerate(items) if pattern.search(item)])
+            else:
+                lowered = text.lower()
+                naive, _ = timed(lambda: [n for n, item in enumerate(items) if lowered in item.lower()])
+            rows.append((text, bar.model.rowCount(), f"{shown * 1000:.1f} ms", f"{complete * 1000:.1f} ms",
+                         f"{naive * 1000:.1f} ms"))
+    report(("query", "matches", "first shown", "all found", "naive scan"), rows)
+
+    bar.regex.setChecked(False)
+    bar.field.setText("user9")
+    while bar.model.is_searching():
+        app.processEvents()
+    batch = [f"user{random.randrange(10**7)}@{random.choice(domains)}" for _ in range(10000)]
+    appended, _ = timed(lambda: view.add(*batch))
+    popped, _ = timed(lambda: [view.pop(random.randrange(view.count())) for _ in range(100)])
+    changed, _ = timed(lambda: [view.change_at(random.randrange(view.count()), "user9 changed") for _ in range(100)])
+    report(("while filtered", "time"), [("append 10000 entries", f"{appended * 1000:.1f} ms"),
+                                        ("pop 100 entries", f"{popped * 1000:.1f} ms"),
+                                        ("change 100 entries", f"{changed * 1000:.1f} ms")])
+
+
+if __name__ == "__main__":
+    main()
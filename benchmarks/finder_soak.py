@@ -0,0 +1,56 @@
+"""
+Soak test of the Finder registry: opens and closes an "Add Proxy"-like dialog over and over,
+and prints the resident memory and the registry stats along the way, both should stay flat.
+
+    python -m benchmarks.finder_soak [--rounds 5000] [--every 500] [--unique]
+
+With --unique every dialog uses new ids, as dialogs bound to records would.
+"""
+import argparse
+import gc
+
+from benchmarks.common import application, mib, report, rss
+
+
+def dialog(suffix: str):
+    from comps.Elements import Button, ComboBox, Field, Heading, Toggle, Vertical
+    win = Vertical().id(f"add-proxy{suffix}")
+    win.add(
+        Heading("Add a new proxy"),
+        [ComboBox(["HTTP", "HTTPS"]).id(f"proxy-type{suffix}"), Field("Proxy IP").id(f"proxy-ip{suffix}"),
+         Field("Proxy port").id(f"proxy-port{suffix}")],
+        [Toggle().id(f"proxy-auth{suffix}"), Field("Proxy username").link(f"proxy-auth{suffix}"),
+         Field("Proxy password").link(f"proxy-auth{suffix}")],
+        [Button("OK"), Button("Cancel")]
+    ).padding(5)
+    return win
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5000)
+    parser.add_argument("--every", type=int, default=500)
+    parser.add_argument("--unique", action="store_true")
+    args = parser.parse_args()
+    app = application()
+    from PyQt6.QtCore import QEvent
+    from comps.Elements import Finder
+    rows = []
+    start = rss()
+    for n in range(1, args.rounds + 1):
+        win = dialog(f"-{n}" if args.unique else "")
+        win.show()
+        app.processEvents()
+        win.close()
+        win.deleteLater()
+        win = None
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        if n % args.every == 0:
+            gc.collect()
+            stats = Finder.stats()
+            rows.append((n, mib(rss()), mib(rss() - start), len(Finder.elements), stats["live"], stats["dead"]))
+    report(("round", "rss", "growth", "entries", "live", "dead"), rows)
+
+
+if __name__ == "__main__":
+    main()
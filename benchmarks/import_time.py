@@ -0,0 +1,76 @@
+"""
+Imports modules in fresh interpreters under `python -X importtime` and reports the cold start of each one,
+along with the imported packages taking the most time.
+
+    python -m benchmarks.import_time [--modules comps comps.Elements main] [--repeat 5] [--top 15]
+
+The time of a package is the time spent in its own modules, the interpreter start up left out,
+so the packages add up to the total.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from benchmarks.common import ROOT, report
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+Timings = List[Tuple[str, int, int, int]]
+
+
+def import_time(module: str) -> Timings:
+    """Returns the (name, depth, self, cumulative) microseconds of the modules imported by `import module`"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True).stderr
+    timings = []
+    for line in stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            timings.append((name, len(indent) // 2, int(own), int(cumulative)))
+    # the modules are listed after the ones they import, the last top-level ones are imported by the -c command
+    start = len(timings)
+    while start and not (timings[start - 1][1] == 0 and timings[start - 1][0] in ("site", "sitecustomize")):
+        start -= 1
+    return timings[start:]
+
+
+def packages(timings: Timings) -> Dict[str, int]:
+    """Returns the microseconds spent in the modules of each top-level package"""
+    totals: Dict[str, int] = {}
+    for name, _, own, _ in timings:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + own
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=["comps", "comps.styles", "comps.Elements", "main"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    rows, best = [], {}
+    for module in args.modules:
+        # the best run is the one with the least noise, the first run also warms up the disk cache
+        runs = [import_time(module) for _ in range(args.repeat)]
+        best[module] = min(runs, key=lambda run: sum(packages(run).values()))
+        totals = packages(best[module])
+        heavy = [package for package in ("PyQt6", "numpy", "pandas") if package in totals]
+        rows.append((module, len(best[module]), f"{sum(totals.values()) / 1000:.1f} ms", " ".join(heavy) or "-"))
+    report(("import", "modules", "total", "heavy packages"), rows)
+    # the slowest imports of each module, what they import included
+    for module, timings in best.items():
+        print(f"\n{module}")
+        slowest = sorted(timings, key=lambda timing: timing[3], reverse=True)[:args.top]
+        report(("module", "self", "cumulative"), [(name, f"{own / 1000:.1f} ms", f"{cumulative / 1000:.1f} ms")
+                                                  for name, _, own, cumulative in slowest])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Imports a generated table as CSV, JSON and Excel into a DataTable, each in a fresh interpreter, twice: the first
+open parses the file and writes its cache, the second reads the cache. Reports the time until the table is filled,
+the longest the event loop was held up meanwhile, and the memory it took.
+
+    python -m benchmarks.imports [--rows 200000] [--excel-rows 50000]
+"""
+import argparse
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.common import application, emit, isolated, mib, report, rss
+
+
+def child(path: str, cache_dir: str) -> None:
+    app = application()
+    from PyQt6.QtCore import QTimer
+    from comps import Elements
+    from comps.importers import Importer
+    Importer.cache_dir = cache_dir
+    table = Elements.DataTable()
+    table.resize(800, 600)
+    table.show()
+    app.processEvents()
+    # a timer firing as often as it can, the largest gap between two ticks is the longest stall
+    ticks = [time.perf_counter()]
+    timer = QTimer()
+    timer.setInterval(1)
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    before = rss()
+    start = time.perf_counter()
+    importer = Importer(path, table)
+    timer.start()
+    importer.start()
+    while importer.is_running():
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+    timer.stop()
+    Importer.pool().shutdown()
+    stall = max((b - a for a, b in zip(ticks[1:], ticks[2:])), default=0.0)
+    emit({"time": elapsed, "stall": stall, "memory": rss() - before, "rows": table.table_model.rowCount(),
+          "cached": importer.from_cache})
+
+
+def generate(directory: str, rows: int, excel_rows: int) -> dict:
+    heads = ["id", "name", "email", "score"]
+    data = [(n, f"user{n}", f"user{n}@example.com", n * 0.5) for n in range(rows)]
+    paths = {}
+    paths["csv"] = os.path.join(directory, "table.csv")
+    with open(paths["csv"], "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(heads)
+        writer.writerows(data)
+    paths["json"] = os.path.join(directory, "table.json")
+    with open(paths["json"], "w") as file:
+        json.dump([dict(zip(heads, row)) for row in data], file)
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        return paths
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(heads)
+    for row in data[:excel_rows]:
+        sheet.append(row)
+    paths["excel"] = os.path.join(directory, "table.xlsx")
+    workbook.save(paths["excel"])
+    return paths
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        child(sys.argv[-2], sys.argv[-1])
+        return
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000, help="rows of the CSV and JSON tables")
+    parser.add_argument("--excel-rows", type=int, default=50000, help="rows of the Excel table")
+    args = parser.parse_args()
+    directory = tempfile.mkdtemp()
+    try:
+        cache_dir = os.path.join(directory, "cache")
+        rows = []
+        for format, path in generate(directory, args.rows, args.excel_rows).items():
+            for _ in ("parse", "cache"):
+                run = isolated("benchmarks.imports", path, cache_dir)
+                rows.append((format, "cache" if run["cached"] else "parse", run["rows"], f"{run['time'] * 1000:.0f} ms",
+                             f"{run['stall'] * 1000:.1f} ms", mib(run["memory"])))
+        report(("format", "read", "rows", "time", "longest stall", "memory"), rows)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Builds main.MainWindow with per-widget stylesheets and with the StyleRegistry compiling a single
+application stylesheet, each in a fresh interpreter.
+
+    python -m benchmarks.main_window [--repeat 5]
+"""
+import argparse
+import sys
+import time
+
+from benchmarks.common import application, emit, isolated, report
+
+
+def child(registry: bool) -> None:
+    app = application()
+    from comps.stylesheets import StyleRegistry
+    import main
+    StyleRegistry.enable(registry)
+    start = time.perf_counter()
+    window = main.MainWindow()
+    built = time.perf_counter()
+    StyleRegistry.flush()
+    styled = time.perf_counter()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    emit({"construct": built - start, "style": styled - built, "show": shown - styled, "total": shown - start})
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        child(sys.argv[-1] == "registry")
+        return
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rows = []
+    for mode in ("widget", "registry"):
+        runs = [isolated("benchmarks.main_window", mode) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["total"])
+        rows.append((mode, *(f"{best[phase] * 1000:.1f} ms" for phase in ("construct", "style", "show", "total"))))
+    report(("stylesheets", "construct", "style", "show", "total"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Builds main.MainWindow, every page included, with lists and tuples nested as Horizontal/Vertical widgets
+and as plain layouts, each in a fresh interpreter, and reports the number of widgets and the construction time.
+
+    python -m benchmarks.nesting [--repeat 5]
+"""
+import argparse
+import sys
+import time
+
+from benchmarks.common import application, emit, isolated, report
+
+
+def child(nest: bool) -> None:
+    app = application()
+    import main
+    from comps.Elements import BaseContainer, NavigationBar
+    BaseContainer.nest_layouts = nest
+    NavigationBar.build_on_demand = False
+    start = time.perf_counter()
+    window = main.MainWindow()
+    built = time.perf_counter()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    emit({"widgets": len(app.allWidgets()), "construct": built - start, "show": shown - built, "total": shown - start})
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        child(sys.argv[-1] == "layouts")
+        return
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rows = []
+    for mode in ("widgets", "layouts"):
+        runs = [isolated("benchmarks.nesting", mode) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["total"])
+        rows.append((mode, best["widgets"], *(f"{best[phase] * 1000:.1f} ms" for phase in ("construct", "show", "total"))))
+    report(("nesting", "widgets", "construct", "show", "total"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Starts main.MainWindow with every NavigationBar page built up front and with pages built on demand,
+each in a fresh interpreter, and reports the time to the first painted frame and the memory it took.
+
+    python -m benchmarks.startup [--repeat 5]
+"""
+import argparse
+import sys
+import time
+
+from benchmarks.common import application, emit, isolated, mib, report, rss
+
+
+def child(on_demand: bool) -> None:
+    app = application()
+    import main
+    from comps.Elements import NavigationBar
+    NavigationBar.build_on_demand = on_demand
+    before = rss()
+    start = time.perf_counter()
+    window = main.MainWindow()
+    built = time.perf_counter()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    emit({"construct": built - start, "show": shown - built, "total": shown - start, "memory": rss() - before})
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        child(sys.argv[-1] == "on-demand")
+        return
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rows = []
+    for mode in ("eager", "on-demand"):
+        runs = [isolated("benchmarks.startup", mode) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["total"])
+        rows.append((mode, *(f"{best[phase] * 1000:.1f} ms" for phase in ("construct", "show", "total")),
+                     mib(min(run["memory"] for run in runs))))
+    report(("pages", "construct", "show", "total", "memory"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Times the life cycle of comps components under the offscreen platform: construction, first show (polish),
+style application, relayout and teardown, across a range of sizes, every case in a fresh interpreter.
+
+    python -m benchmarks.suite [--cases Button Table ...] [--sizes 10 100 1000] [--repeat 3]
+                               [--output results.json] [--baseline baseline.json] [--threshold 0.25]
+
+A component case builds `size` instances of the component in a window, the Table and ListWidget cases fill a single
+component with `size` rows, MainWindow ignores the size. With --baseline the results are compared with a previous
+--output file and the command fails if a phase got slower by more than the threshold.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import application, emit, isolated, report
+
+Phases = Dict[str, float]
+PHASES = ("construct", "show", "style", "relayout", "teardown", "toggle", "repaint")
+
+
+class Clock:
+    """Times the phases of a case, processing the pending events at the end of each one"""
+
+    def __init__(self) -> None:
+        self.app = application()
+        self.phases: Phases = {}
+
+    def phase(self, name: str, fn: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = fn()
+        self.app.processEvents()
+        self.phases[name] = time.perf_counter() - start
+        return result
+
+
+def life_cycle(build: Callable[[], Any], clock: Clock) -> Phases:
+    """Runs the common phases on the window returned by build, along with the widgets to style"""
+    from PyQt6 import sip
+    from comps.styles import Style
+    window, widgets = clock.phase("construct", build)
+    window.resize(800, 600)
+    clock.phase("show", window.show)
+    style = Style().backgroundColor("#fafafa").border("1px solid #ddd").padding("2px")
+    # the widgets without the fluent styling, such as MenuBar, take the same style as a style sheet
+    clock.phase("style", lambda: [widget.set_style(style) if hasattr(widget, "set_style")
+                                  else widget.setStyleSheet(style.to_str()) for widget in widgets])
+    clock.phase("relayout", lambda: window.resize(1024, 768))
+    clock.phase("teardown", lambda: sip.delete(window))
+    return clock.phases
+
+
+def components() -> Dict[str, Callable[[], Any]]:
+    """The factories of the component cases"""
+    from comps import Elements as e
+    return {
+        "Label": lambda: e.Label("label"),
+        "Heading": lambda: e.Heading("heading"),
+        "Text": lambda: e.Text("text"),
+        "Button": lambda: e.Button("button"),
+        "CheckBox": lambda: e.CheckBox("check box"),
+        "RadioButton": lambda: e.RadioButton("radio button"),
+        "ComboBox": lambda: e.ComboBox(["first", "second", "third"]),
+        "Field": lambda: e.Field("placeholder"),
+        "MultilineField": lambda: e.MultilineField(),
+        "Slider": lambda: e.Slider(),
+        "ProgressBar": lambda: e.ProgressBar(),
+        "SpinBox": lambda: e.SpinBox(),
+        "Dial": lambda: e.Dial(),
+        "Toggle": lambda: e.Toggle(),
+        "GroupBox": lambda: e.GroupBox(("content", e.Button("button")), "title"),
+        "Horizontal": lambda: e.Horizontal(e.Text("left"), e.Spacer(), e.Text("right")),
+        "Vertical": lambda: e.Vertical(e.Text("top"), e.Text("bottom")),
+        "HDivider": lambda: e.HDivider(),
+        "NavigationLink": lambda: e.NavigationLink("link"),
+        "DataTable": lambda: e.DataTable(e.Column("head", "a", "b", "c")),
+        "VirtualListWidget": lambda: e.VirtualListWidget("a", "b", "c"),
+        "Grid": lambda: e.Grid(e.Text("first"), e.Text("second")),
+        "Stacked": lambda: e.Stacked(e.Text("front"), e.Text("back")),
+        "ScrollableContainer": lambda: e.ScrollableContainer((e.Text("top"), e.Text("bottom"))),
+        "Tabs": lambda: e.Tabs(e.Tab(e.Text("first"), "first"), e.Tab(e.Text("second"), "second")),
+        "NavigationBar": lambda: e.NavigationBar(e.NavigationLink("home").target(lambda: e.Text("home")),
+                                                 e.NavigationLink("other").target(lambda: e.Text("other"))),
+        "MenuBar": lambda: e.MenuBar(e.Menu("file", e.Action("open", lambda: None, "Ctrl+O"), e.Separator(),
+                                            e.Action("quit", lambda: None, "Ctrl+Q")),
+                                     e.Menu("edit", e.Action("copy", lambda: None, "Ctrl+C"))),
+        "SourceView": source_view,
+        "MultilineAssistedField": lambda: e.MultilineAssistedField("notes", True, ["{name}"], "notes"),
+        "LoginForm": lambda: e.LoginForm(),
+    }
+
+
+def source_view() -> Any:
+    """A SourceView over a small ColumnTableModel, as the previews fill it"""
+    from comps.Elements import SourceView
+    from comps.models import ColumnTableModel, pack
+    model = ColumnTableModel()
+    model.append_columns([pack(["a", "b", "c"]), pack(["1", "2", "3"])], ["letter", "digit"])
+    return SourceView().set_source(model, columns=True)
+
+
+def component(name: str, size: int) -> Phases:
+    from comps.Elements import Vertical, Window
+    factory = components()[name]
+
+    def build():
+        widgets = [factory() for _ in range(size)]
+        return Window(Vertical(*widgets)), widgets
+    return life_cycle(build, Clock())
+
+
+def main_window(size: int) -> Phases:
+    import main
+
+    def build():
+        window = main.MainWindow()
+        return window, []
+    phases = life_cycle(build, Clock())
+    del phases["style"]
+    return phases
+
+
+def table(size: int, columns: int = 5) -> Phases:
+    from comps.Elements import Column, Table, Window
+
+    def build():
+        widget = Table(*[Column(f"column {c}", *[f"cell {r}:{c}" for r in range(size)]) for c in range(columns)])
+        return Window(widget), [widget]
+    return life_cycle(build, Clock())
+
+
+def list_widget(size: int) -> Phases:
+    from comps.Elements import ListWidget, Window
+
+    def build():
+        widget = ListWidget(*[f"item {n}" for n in range(size)])
+        return Window(widget), [widget]
+    return life_cycle(build, Clock())
+
+
+def toggle_repaint(size: int) -> Phases:
+    from comps.Elements import Toggle, Vertical, Window
+    clock = Clock()
+    toggles = [Toggle() for _ in range(size)]
+    window = Window(Vertical(*toggles))
+    window.show()
+    clock.app.processEvents()
+    clock.phase("toggle", lambda: [toggle.toggle() for toggle in toggles])
+    clock.phase("repaint", lambda: [toggle.repaint() for toggle in toggles])
+    return clock.phases
+
+
+CASES: Dict[str, Callable[[int], Phases]] = {
+    "MainWindow": main_window,
+    "Table": table,
+    "ListWidget": list_widget,
+    "ToggleRepaint": toggle_repaint,
+}
+SIZES: Dict[str, List[int]] = {
+    "MainWindow": [1],
+    "Table": [100, 1000, 10000],
+    "ListWidget": [100, 1000, 10000],
+}
+
+
+def run_case(case: str, size: int) -> Phases:
+    if case in CASES:
+        return CASES[case](size)
+    return component(case, size)
+
+
+def all_cases() -> List[str]:
+    return list(CASES) + list(components())
+
+
+def measure(cases: List[str], sizes: List[int] | None, repeat: int) -> Dict[str, Phases]:
+    """Runs every case in its own interpreter, keeping the best time of each phase"""
+    results: Dict[str, Phases] = {}
+    for case in cases:
+        for size in sizes if sizes and case != "MainWindow" else SIZES.get(case, [10, 100, 1000]):
+            name = f"{case}/{size}"
+            runs = [isolated("benchmarks.suite", case, size) for _ in range(repeat)]
+            results[name] = {phase: min(run[phase] for run in runs) for phase in runs[0]}
+            print(name, *(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in results[name].items()),
+                  sep="  ", file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, Phases], baseline: Dict[str, Phases], threshold: float, floor: float) -> bool:
+    """Prints the results next to the baseline and returns whether a phase regressed"""
+    rows, regressed = [], False
+    for name, phases in results.items():
+        for phase, seconds in phases.items():
+            before = baseline.get(name, {}).get(phase)
+            if before is None:
+                rows.append((name, phase, "-", f"{seconds * 1000:.1f} ms", "-", "new"))
+                continue
+            ratio = seconds / before if before > 0 else float("inf")
+            slower = ratio > 1 + threshold and seconds - before > floor
+            regressed |= slower
+            rows.append((name, phase, f"{before * 1000:.1f} ms", f"{seconds * 1000:.1f} ms", f"{ratio:.2f}x",
+                         "REGRESSION" if slower else "ok"))
+    report(("case", "phase", "baseline", "current", "ratio", "status"), rows)
+    return regressed
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        case, size = sys.argv[-2], int(sys.argv[-1])
+        emit(run_case(case, size))
+        return
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", choices=all_cases(), default=all_cases())
+    parser.add_argument("--sizes", type=int, nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="writes the results to this JSON file")
+    parser.add_argument("--baseline", help="compares the results with this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="tolerated slowdown, 0.25 is 25%%")
+    parser.add_argument("--floor", type=float, default=0.002, help="ignored slowdown in seconds, for the tiny phases")
+    args = parser.parse_args()
+    results = measure(args.cases, args.sizes, args.repeat)
+    if args.output:
+        from PyQt6.QtCore import QT_VERSION_STR
+        with open(args.output, "w") as file:
+            json.dump({"python": platform.python_version(), "qt": QT_VERSION_STR, "platform": platform.platform(),
+                       "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        if compare(results, baseline, args.threshold, args.floor):
+            sys.exit(1)
+    else:
+        columns = [phase for phase in PHASES if any(phase in phases for phases in results.values())]
+        report(("case", *columns), [(name, *(f"{phases[phase] * 1000:.1f} ms" if phase in phases else "-"
+                                           for phase in columns)) for name, phases in results.items()])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Refreshes a VirtualListWidget of 100k entries with new versions of its entries, 10, 100 and 1000 scattered edits
+away (a third insertions, a third removals, a third moves), with and without a FilterBar applied. Compares `change`,
+which applies the difference, with a reset of the model and with the former clear and refill of a ListWidget, and
+checks the selected entries stay selected and the top visible entry, when it is kept, stays on top.
+
+    python -m benchmarks.sync [--items 100000]
+"""
+import argparse
+import random
+
+from benchmarks.common import application, report, timed
+
+
+def edited(items: list, edits: int) -> list:
+    items = list(items)
+    for n in range(edits):
+        kind = n % 3
+        if kind == 0:
+            items.insert(random.randrange(len(items) + 1), f"new{random.randrange(10**9)}@example.com")
+        elif kind == 1:
+            items.pop(random.randrange(len(items)))
+        else:
+            items.insert(random.randrange(len(items)), items.pop(random.randrange(len(items))))
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100000, help="entries of the list")
+    args = parser.parse_args()
+    app = application()
+    from PyQt6.QtCore import QItemSelectionModel, QPoint
+    from comps import Elements
+    random.seed(0)
+    items = [f"user{n}@example.com" for n in range(args.items)]
+    rows = []
+    for filtered in (False, True):
+        view = Elements.VirtualListWidget(*items)
+        view.resize(400, 600)
+        view.show()
+        bar = Elements.FilterBar(view) if filtered else None
+
+        def settle() -> None:
+            while bar is not None and bar.model.is_searching():
+                app.processEvents()
+            app.processEvents()
+        if bar is not None:
+            bar.field.setText("7")
+        settle()
+        label = "filtered" if filtered else "plain"
+        for edits in (10, 100, 1000):
+            current = view.list_model.items[:]
+            # keeps the selected entries out of the edits, so they all have to stay selected
+            model = view.model()
+            middle = model.rowCount() // 2
+            view.scrollTo(model.index(middle, 0))
+            selected = [middle + offset for offset in (0, 3, 5)]
+            for row in selected:
+                view.selectionModel().select(model.index(row, 0), QItemSelectionModel.SelectionFlag.Select)
+            app.processEvents()
+            texts = {model.index(row, 0).data() for row in selected}
+            top = view.indexAt(QPoint(0, 0)).data()
+            wanted = [item for item in edited(current, edits) if item not in texts]
+            wanted[len(wanted) // 2:len(wanted) // 2] = sorted(texts)
+            changed, _ = timed(lambda: (view.change(*wanted), settle()))
+            kept = {index.data() for index in view.selectionModel().selectedIndexes()}
+            on_top = top not in wanted or view.indexAt(QPoint(0, 0)).data() == top
+            staying = "kept" if kept == texts and on_top else "lost"
+            rows.append((label, edits, "change", f"{changed * 1000:.1f} ms", staying))
+            view.list_model.reset(current)
+            settle()
+            reset, _ = timed(lambda: (view.list_model.reset(wanted), settle()))
+            rows.append((label, edits, "reset", f"{reset * 1000:.1f} ms", "lost"))
+            view.clearSelection()
+        view.deleteLater()
+    widget = Elements.ListWidget()
+    widget.addItems(items)
+    wanted = edited(items, 100)
+    refilled, _ = timed(lambda: (widget.clear(), widget.addItems(wanted), app.processEvents()))
+    rows.append(("ListWidget", 100, "clear and refill", f"{refilled * 1000:.1f} ms", "lost"))
+    widget.clear()
+    widget.addItems(items)
+    chosen = next(item for item in items[len(items) // 2:] if item in wanted)
+    widget.setCurrentRow(items.index(chosen))
+    changed, _ = timed(lambda: (widget.change(*wanted), app.processEvents()))
+    staying = "kept" if [item.text() for item in widget.selectedItems()] == [chosen] else "lost"
+    rows.append(("ListWidget", 100, "change", f"{changed * 1000:.1f} ms", staying))
+    report(("list", "edits", "refresh", "time", "selection and scroll"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares fill time and memory of Table (one QTableWidgetItem per cell) and DataTable (columnar model).
+
+Every measurement runs in its own interpreter so that memory deltas do not leak between cases.
+
+    python -m benchmarks.table_fill [--sizes 10000 100000 1000000] [--columns 3]
+"""
+import argparse
+import gc
+import sys
+
+from benchmarks.common import application, emit, isolated, mib, report, rss, timed
+
+
+def child(implementation: str, rows: int, columns: int) -> None:
+    app = application()
+    from comps.Elements import Column, DataTable, Table
+    cls = {"Table": Table, "DataTable": DataTable}[implementation]
+    data = [[f"user{row}_{column}@example.com" for row in range(rows)] for column in range(columns)]
+    gc.collect()
+    before = rss()
+
+    def fill():
+        table = cls(*[Column(f"column {c}", *values) for c, values in enumerate(data)])
+        table.resize(800, 600)
+        table.show()
+        app.processEvents()
+        return table
+
+    elapsed, table = timed(fill)
+    gc.collect()
+    emit({"fill": elapsed, "memory": rss() - before, "rows": table.model().rowCount()})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--columns", type=int, default=3)
+    parser.add_argument("--child", nargs=3)
+    args = parser.parse_args()
+    if args.child:
+        implementation, rows, columns = args.child
+        return child(implementation, int(rows), int(columns))
+    results = []
+    for size in args.sizes:
+        for implementation in ("Table", "DataTable"):
+            result = isolated("benchmarks.table_fill", implementation, size, args.columns)
+            results.append((implementation, size, f"{result['fill']:.3f} s", mib(result["memory"])))
+            print(*results[-1], sep="  ", file=sys.stderr)
+    report(("component", "rows", "fill", "memory"), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,276 @@
+import bisect
+import re
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from enum import Enum
+from itertools import count
 
 from comps.styles import Style
 from .styles import QSS, Style, ButtonStyles
-from typing import Callable, List, Self, Tuple, Union, overload, Any
-from PyQt6.QtCore import (Qt, QSize, QPoint, QPointF, QRectF,QMargins,QThread)
-from PyQt6.QtGui import (QIcon, QAction, QKeyEvent, QColor, QBrush, QPaintEvent, QPen, QPainter)
+from .models import ColumnTableModel, ListModel, diff
+from .binding import Bindings
+from .scheduling import coalesce
+from .stylesheets import StyleRegistry, StyleRules, apply_style_sheet
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, MutableSequence, NamedTuple, Sequence, Self, Tuple, Union, overload, Any
+from PyQt6.QtCore import (Qt, QSize, QPoint, QPointF, QRect, QRectF,QMargins,QThread, QTimer, QAbstractItemModel, QModelIndex,
+                          QPersistentModelIndex)
+from PyQt6.QtGui import (QIcon, QAction, QKeyEvent, QColor, QBrush, QPaintEvent, QPen, QPainter, QPixmap, QPixmapCache)
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QCheckBox, QLabel,
     QPushButton, QHBoxLayout, QTextEdit, QLineEdit, QLayout, QTabWidget,
     QGridLayout, QStackedLayout, QComboBox, QFileDialog, QScrollArea,
     QDialog, QRadioButton, QSizePolicy, QSlider, QProgressBar,
     QSpinBox, QDial, QMenuBar, QMenu, QMainWindow, QTableWidget,
     QTableWidgetItem, QListWidget, QListWidgetItem, QButtonGroup,
-    QGroupBox, QFrame)
+    QGroupBox, QFrame, QTableView, QHeaderView, QPlainTextEdit, QWIDGETSIZE_MAX)
 
 
 from PyQt6.QtCore import pyqtSlot as Slot
+from PyQt6 import sip
+
+if TYPE_CHECKING:
+    # imported on first use, comps.sources pulls in numpy
+    from .filtering import FilterModel
+    from .loaders import TextLoader
+    from .sources import MappedLines
 
 
 ButtonGroup = QButtonGroup
 
 
+class _Entry(NamedTuple):
+    ref: "weakref.ref[QWidget]"
+    id: str
+    cls: type
+    name: str
+    scope: str
+
+
 class Finder:
-    elements = {}
+    """
+    Registry of the identified elements.
+
+    Elements are held through weak references and forgotten as soon as they are destroyed,
+    so registering an element never keeps it (or its deleted C++ counterpart) alive.
+
+    Several elements can share an id: `get` returns the latest one (preferring the current scope, see `scope`),
+    `find` returns all of them. Entries are indexed by id, id prefix, class, accessibleName and scope,
+    so queries only visit the entries they return.
+    """
+    elements: Dict[str, "weakref.ref[QWidget]"] = {}
+    _entries: Dict[int, _Entry] = {}
+    _by_id: Dict[str, Dict[int, None]] = {}
+    _by_class: Dict[type, Dict[int, None]] = {}
+    _by_name: Dict[str, Dict[int, None]] = {}
+    _by_scope: Dict[str, Dict[int, None]] = {}
+    _ids: List[str] = []
+    _scopes: List[str] = []
+    _tokens = count()
 
     @staticmethod
     def add(element: 'Identifiable|QWidget'):
-        """Adds an element to the map
+        """Adds an element to the map, in the current scope
 
         Args:
             element (QWidget): what element to add
         """
-        Finder.elements[element.objectName()] = element
+        Finder._drop(getattr(element, "_finder_token", None))
+        token = next(Finder._tokens)
+        element._finder_token = token  # type: ignore
+        entry = _Entry(weakref.ref(element), element.objectName(), type(element), element.accessibleName(),
+                       Finder._scopes[-1] if Finder._scopes else "")
+        Finder._entries[token] = entry
+        if entry.id not in Finder._by_id:
+            bisect.insort(Finder._ids, entry.id)
+        Finder._by_id.setdefault(entry.id, {})[token] = None
+        Finder._by_class.setdefault(entry.cls, {})[token] = None
+        Finder._by_name.setdefault(entry.name, {})[token] = None
+        Finder._by_scope.setdefault(entry.scope, {})[token] = None
+        Finder.elements[entry.id] = entry.ref
+        element.destroyed.connect(lambda *_: Finder._drop(token))
 
     @staticmethod
     def remove(element: QWidget | Any | str):
         """removes an element from the map
 
         Args:
-            element (QWidget): what element to remove
+            element (QWidget | str): what element to remove, an id removes every element using it
         """
         if isinstance(element, QWidget):
-            Finder.elements.pop(element.objectName(), None)
+            Finder._drop(getattr(element, "_finder_token", None))
         else:
-            Finder.elements.pop(element, None)
+            for token in list(Finder._by_id.get(element, ())):
+                Finder._drop(token)
 
     @staticmethod
-    def get(id_: str) -> QWidget|Any:
+    def rename(element: QWidget):
+        """Updates the accessibleName index after the accessibleName of a registered element changed
+
+        Args:
+            element (QWidget): the element to update
+        """
+        token = getattr(element, "_finder_token", None)
+        entry = Finder._entries.get(token)  # type: ignore
+        name = element.accessibleName()
+        if entry is None or entry.name == name:
+            return
+        # the element keeps its scope, its place among the elements sharing its id and its connection to destroyed
+        members = Finder._by_name[entry.name]
+        del members[token]  # type: ignore
+        if not members:
+            del Finder._by_name[entry.name]
+        Finder._entries[token] = entry._replace(name=name)  # type: ignore
+        Finder._by_name.setdefault(name, {})[token] = None  # type: ignore
+
+    @staticmethod
+    def get(id_: str, under: QWidget | None = None) -> QWidget|Any:
         """Gets an element from the map
 
         Args:
             id_ (str): what element to get
+            under (QWidget, optional): only look for the element among the descendants of this widget. Defaults to None.
+
+        Raises:
+            KeyError: if no living element has that id
 
         Returns:
-            QWidget: the element
+            QWidget: the element, the latest one registered if several share the id
+        """
+        if under is None and not Finder._scopes:
+            ref = Finder.elements.get(id_)
+            element = ref() if ref is not None else None
+            if element is None or sip.isdeleted(element):
+                raise KeyError(id_)
+            return element
+        found = Finder.find(id_, under=under)
+        if Finder._scopes:
+            found = [e for e in found if Finder._entries[e._finder_token].scope == Finder._scopes[-1]] or found
+        if not found:
+            raise KeyError(id_)
+        return found[-1]
+
+    @staticmethod
+    def find(id_: str | None = None, prefix: str | None = None, cls: type | str | None = None,
+             name: str | None = None, under: QWidget | str | None = None, scope: str | None = None) -> List[QWidget|Any]:
+        """Finds the living elements matching every given criterion, in registration order
+
+        Args:
+            id_ (str, optional): the id of the elements. Defaults to None.
+            prefix (str, optional): the beginning of the id of the elements. Defaults to None.
+            cls (type | str, optional): the class of the elements (subclasses included) or its name. Defaults to None.
+            name (str, optional): the accessibleName of the elements. Defaults to None.
+            under (QWidget | str, optional): a widget (or its id) the elements must descend from. Defaults to None.
+            scope (str, optional): the scope the elements were registered in. Defaults to None.
+
+        Returns:
+            List[QWidget]: the elements found
+        """
+        candidates: List[Dict[int, None]] = []
+        if id_ is not None:
+            candidates.append(Finder._by_id.get(id_, {}))
+        if prefix is not None:
+            start = bisect.bisect_left(Finder._ids, prefix)
+            tokens: Dict[int, None] = {}
+            for i in range(start, len(Finder._ids)):
+                if not Finder._ids[i].startswith(prefix):
+                    break
+                tokens.update(Finder._by_id[Finder._ids[i]])
+            candidates.append(tokens)
+        if cls is not None:
+            tokens = {}
+            for kind, members in Finder._by_class.items():
+                if kind.__name__ == cls if isinstance(cls, str) else issubclass(kind, cls):
+                    tokens.update(members)
+            candidates.append(tokens)
+        if name is not None:
+            candidates.append(Finder._by_name.get(name, {}))
+        if scope is not None:
+            candidates.append(Finder._by_scope.get(scope, {}))
+        if isinstance(under, str):
+            under = Finder.get(under)
+        if not candidates and under is not None:
+            # only the descendants are visited, other criteria narrow the candidates before their ancestry is checked
+            tokens = {}
+            for child in under.findChildren(QWidget):
+                token = getattr(child, "_finder_token", None)
+                if token in Finder._entries:
+                    tokens[token] = None
+            candidates.append(tokens)
+        if not candidates:
+            candidates.append(Finder._entries)  # type: ignore
+        smallest = min(candidates, key=len)
+        found = []
+        for token in sorted(smallest):
+            if any(token not in other for other in candidates if other is not smallest):
+                continue
+            entry = Finder._entries[token]
+            element = entry.ref()
+            if element is None or sip.isdeleted(element):
+                continue
+            if under is not None and not under.isAncestorOf(element):
+                continue
+            found.append(element)
+        return found
+
+    @staticmethod
+    @contextmanager
+    def scope(name: str) -> Iterator[None]:
+        """Registers the elements identified inside the `with` block in their own scope,
+        `get` then prefers the elements of that scope, so two windows can use the same ids
+
+        Args:
+            name (str): the name of the scope
         """
-        return Finder.elements[id_]
+        Finder._scopes.append(name)
+        try:
+            yield
+        finally:
+            Finder._scopes.pop()
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        """Counts the entries of the map
+
+        Returns:
+            Dict[str, int]: the number of "live" entries and of "dead" ones, whose element is gone but which were not removed yet
+        """
+        dead = sum(1 for entry in Finder._entries.values() if Finder._dead(entry.ref))
+        return {"live": len(Finder._entries) - dead, "dead": dead}
+
+    @staticmethod
+    def prune() -> int:
+        """Removes the dead entries from the map
+
+        Returns:
+            int: how many entries were removed
+        """
+        dead = [token for token, entry in Finder._entries.items() if Finder._dead(entry.ref)]
+        for token in dead:
+            Finder._drop(token)
+        return len(dead)
+
+    @staticmethod
+    def _dead(ref: "weakref.ref[QWidget]") -> bool:
+        element = ref()
+        return element is None or sip.isdeleted(element)
+
+    @staticmethod
+    def _drop(token: int | None):
+        entry = Finder._entries.pop(token, None)  # type: ignore
+        if entry is None:
+            return
+        for index, key in ((Finder._by_id, entry.id), (Finder._by_class, entry.cls), (Finder._by_name, entry.name),
+                           (Finder._by_scope, entry.scope)):
+            members = index[key]  # type: ignore
+            del members[token]  # type: ignore
+            if not members:
+                del index[key]  # type: ignore
+        if entry.id not in Finder._by_id:
+            del Finder._ids[bisect.bisect_left(Finder._ids, entry.id)]
+            if Finder.elements.get(entry.id) is entry.ref:
+                del Finder.elements[entry.id]
+        elif Finder.elements.get(entry.id) is entry.ref:
+            Finder.elements[entry.id] = Finder._entries[next(reversed(Finder._by_id[entry.id]))].ref
 
 
 class Alignable:
@@ -104,6 +320,7 @@ class Identifiable:
             Self: the widget
         """
         self.setAccessibleName(name)
+        Finder.rename(self)  # type: ignore
         return self
 
     def identify(self, name: str | None = None, objectName: str | None = None) -> Self:
@@ -128,6 +345,7 @@ class TextValueEditable:
     keyReleaseEvent: Callable
     textChanged: Any
     setPlaceholderText: Callable
+    toPlainText: Callable
     """
     something which supports the editability of a text value, meaning it can be changed or altered by the user if enabled
     """
@@ -153,6 +371,25 @@ class TextValueEditable:
         self.textChanged.emit(text)
         return self
 
+    def change_listener(self, callback: Callable[[str], None], debounce: int = 0, throttle: int = 0,
+                        leading: bool | None = None) -> Self:
+        """
+        Adds a listener called with the new text when the text changes.
+
+        Args:
+        - callback: A function to call with the new text.
+        - debounce: Optional. Calls the function once the text stopped changing for this many milliseconds.
+        - throttle: Optional. Calls the function at most once every this many milliseconds while the text changes.
+        - leading: Optional. Calls the function on the first change of a burst too, by default only when throttling.
+
+        Returns:
+        - itself: Returns itself after adding the listener.
+        """
+        listener = coalesce(callback, debounce, throttle, leading, self)  # type: ignore
+        # QLineEdit sends the text along, QTextEdit does not
+        self.textChanged.connect(lambda *args: listener(args[0] if args else self.toPlainText()))
+        return self
+
     def set_placeholder(self, text: str) -> Self:
         """
         sets the placeholder text of the widget
@@ -161,6 +398,59 @@ class TextValueEditable:
         return self
 
 
+class Documented:
+    document: Callable
+    textCursor: Callable
+    """
+    something which edits a text document, which can be read from and written to a file without going through a single string
+    """
+
+    def blocks(self) -> Iterator[str]:
+        """
+        yields the text of every block (paragraph) of the document, the lines toPlainText would join with newlines
+        """
+        block = self.document().firstBlock()
+        while block.isValid():
+            yield block.text().replace("\u2028", "\n").replace("\xa0", " ")
+            block = block.next()
+
+    def save(self, path: str, encoding: str = "utf-8") -> Self:
+        """
+        writes the text of the document to a file, block by block
+
+        Args:
+        - path: The file to write.
+        - encoding: Optional. The encoding of the file.
+        """
+        with open(path, "w", encoding=encoding) as file:
+            for n, text in enumerate(self.blocks()):
+                if n:
+                    file.write("\n")
+                file.write(text)
+        return self
+
+    def load(self, path: str, encoding: str = "utf-8") -> "TextLoader":
+        """
+        inserts the content of a file at the cursor, in pieces read on a worker thread.
+        The undo history is turned off until the file is loaded, otherwise it would hold a copy of every piece.
+
+        Args:
+        - path: The file to read.
+        - encoding: Optional. The encoding of the file.
+
+        Returns:
+        - The loader, to start (and track) by the caller.
+        """
+        from .loaders import TextLoader
+        document = self.document()
+        undo = document.isUndoRedoEnabled()
+        document.setUndoRedoEnabled(False)
+        cursor = self.textCursor()
+        loader = TextLoader(path, cursor.insertText, encoding=encoding, parent=self)  # type: ignore
+        loader.ended.connect(lambda: document.setUndoRedoEnabled(undo))
+        return loader
+
+
 class AnyMenu:
     addSeparator: Callable
     addAction: Callable
@@ -274,16 +564,14 @@ class Stylable:
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         """Sets the style or QSS of the widget"""
         if isinstance(style, QSS):
-            self.setStyleSheet(style.to_str())
+            self.apply_style_sheet(style.to_str())
         else:
-            self.setStyleSheet(f"{self.accessibleName()}{(
-                '#'+self.objectName()) if self.objectName() != '' else ''}{{{style.to_str()}}}")
+            self.apply_style_sheet(Stylable.rule(self.accessibleName(), self.objectName(), "", style.to_str()))
         return self
 
     def add_style(self, style: Union[Style, QSS]) -> Self:
         """Adds a style or QSS to the widget, it will keep the old one"""
-        self.setStyleSheet(self.styleSheet() + style.to_str())
-        return self
+        return self.merge_style_sheet(style.to_str())
 
     def add_qss(self, style_sheet: str) -> Self:
         """adds a raw qss description to the stylesheet
@@ -294,16 +582,56 @@ class Stylable:
         Returns:
             itself: returns itself
         """
-        self.setStyleSheet(self.styleSheet() + style_sheet)
-        return self
+        return self.merge_style_sheet(style_sheet)
 
     def addTo(self, target: str, style: Style) -> Self:
         """Adds a style to a target inside of the element itself, it could be for example the pane of a tabwidget
         """
-        self.setStyleSheet(f"{self.accessibleName()}{(
-            '#'+self.objectName()) if self.objectName() != '' else ''}{target}{{{style.to_str()}}}")
+        self.apply_style_sheet(Stylable.rule(self.accessibleName(), self.objectName(), target, style.to_str()))
+        return self
+
+    def style_sheet(self) -> str:
+        """Returns the stylesheet of the widget, also when it is applied through the StyleRegistry"""
+        if StyleRegistry.enabled:
+            return StyleRegistry.style_sheet(self)  # type: ignore
+        return self.styleSheet()
+
+    def merge_style_sheet(self, style_sheet: str) -> Self:
+        """merges a stylesheet into the one of the widget, the properties it sets replace the ones of the same selector
+        instead of piling up, and the widget is only restyled if the result changed
+
+        Args:
+            style_sheet (str): the stylesheet to merge
+
+        Returns:
+            itself: returns itself
+        """
+        current = self.style_sheet()
+        rules: StyleRules | None = getattr(self, "_style_rules", None)
+        if rules is None or rules.text != current:
+            rules = self._style_rules = StyleRules(current)
+        if rules.merge(style_sheet) != current:
+            self.apply_style_sheet(rules.text)
         return self
 
+    def apply_style_sheet(self, style_sheet: str) -> Self:
+        """Sets the stylesheet of the widget, through the StyleRegistry when it is enabled
+
+        Args:
+            style_sheet (str): the stylesheet to apply
+
+        Returns:
+            itself: returns itself
+        """
+        apply_style_sheet(self, style_sheet)  # type: ignore
+        return self
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def rule(name: str, object_name: str, target: str, body: str) -> str:
+        """Builds the rule `name#object_name target{body}`, widgets sharing a selector and a style share the same text"""
+        return f"{name}{('#' + object_name) if object_name != '' else ''}{target}{{{body}}}"
+
 
 class Attributable:
     setAttribute: Callable
@@ -337,24 +665,21 @@ class Linked:
         """
         if isinstance(chbox, str):
             chbox = Finder.get(chbox)
-        self.setEnabled(chbox.isChecked())
-        chbox.stateChanged.connect(lambda x: self.setEnabled(x))
+        Bindings.bind(chbox, self, Bindings.enabled)  # type: ignore
         return self
 
     def visible(self, chbox: Union["CheckBox",str]):
         """Sets the visibility of the widget to the state of the checkbox"""
         if isinstance(chbox, str):
             chbox = Finder.get(chbox)
-        self.setVisible(chbox.isChecked())
-        chbox.stateChanged.connect(lambda x: self.setVisible(x))
+        Bindings.bind(chbox, self, Bindings.visible)  # type: ignore
         return self
 
     def notVisible(self, chbox: Union["CheckBox", str]):
         """Sets the visibility of the widget to the state of the checkbox"""
         if isinstance(chbox, str):
             chbox = Finder.get(chbox)
-        self.setVisible(not chbox.isChecked())
-        chbox.stateChanged.connect(lambda x: self.setVisible(not x))
+        Bindings.bind(chbox, self, Bindings.hidden)  # type: ignore
         return self
 
 
@@ -409,6 +734,7 @@ class Iconizable:
 class Ranged:
     setMaximum: Callable
     setMinimum: Callable
+    valueChanged: Any
 
     def min(self, m: int) -> Self:
         """Sets the minimum value for the object.
@@ -434,6 +760,22 @@ class Ranged:
         self.setMaximum(m)
         return self
 
+    def valueChange(self, fn: Callable[[int], None], debounce: int = 0, throttle: int = 0,
+                    leading: bool | None = None) -> Self:
+        """Adds a listener called with the new value.
+
+        Args:
+            fn (Callable): The listener.
+            debounce (int): Optional. Calls the listener once the value stopped changing for this many milliseconds.
+            throttle (int): Optional. Calls the listener at most once every this many milliseconds while the value changes.
+            leading (bool): Optional. Calls the listener on the first change of a burst too, by default only when throttling.
+
+        Returns:
+            itself: Returns itself after adding the listener.
+        """
+        self.valueChanged.connect(coalesce(fn, debounce, throttle, leading, self))  # type: ignore
+        return self
+
 
 class Sizable:
     setFixedWidth: Callable[[int], None]
@@ -510,6 +852,45 @@ class Stretch:
 Spacer = Stretch
 
 
+class Keyed:
+    """
+    Gives an item of a container a key, so that `BaseContainer.render` keeps its widget across renders.
+
+    Args:
+    - key: Any hashable value identifying the item among its siblings.
+    - item: The item, as accepted by `BaseContainer.add`, or a factory returning one:
+      the factory is only called when the key appears.
+    """
+    __slots__ = ("key", "item")
+
+    def __init__(self, key: Any, item: Any) -> None:
+        self.key = key
+        self.item = item
+
+
+class NestedLayout:
+    """
+    A layout standing in for a Horizontal or Vertical container nested in another one.
+
+    It takes space in its parent like the Expanding container widget it replaces would,
+    without the cost of a widget (see `BaseContainer.nest_layouts`).
+    """
+
+    def expandingDirections(self) -> Qt.Orientation:
+        return Qt.Orientation.Horizontal | Qt.Orientation.Vertical
+
+    def maximumSize(self) -> QSize:
+        return QSize(QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
+
+
+class HorizontalLayout(NestedLayout, QHBoxLayout):
+    pass
+
+
+class VerticalLayout(NestedLayout, QVBoxLayout):
+    pass
+
+
 class BaseContainer(QWidget, BasicElement, Linked):
     """
     A base container widget that combines features from QWidget, BasicElement, and Linked.
@@ -525,7 +906,11 @@ class BaseContainer(QWidget, BasicElement, Linked):
     - add: Overloaded method to add widgets, layouts, or stretches to the container.
     - layout_padding: Sets the padding around the container's layout.
     - content_gap: Sets the gap between items within the container's layout.
+
+    Nested lists and tuples become nested layouts when the container has a box layout, set `nest_layouts` to False
+    to get Horizontal and Vertical widgets instead (needed to style them or to reach them as widgets).
     """
+    nest_layouts = True
 
     def __init__(self, *items: Union[QWidget, QLayout, Stretch, "GroupBox", Tuple, List, Any],
                  parent=None,
@@ -566,38 +951,202 @@ class BaseContainer(QWidget, BasicElement, Linked):
         Returns:
         - itself: Returns the container itself after adding the items.
         """
+        BaseContainer.fill(self.lyt, items, self.nest_layouts)
+        return self
+
+    @staticmethod
+    def fill(layout: QLayout, items: Iterable[Any], nest: bool = True) -> None:
+        """
+        Adds items to a layout the way `add` does.
+
+        Args:
+        - layout: The layout to fill.
+        - items: The items to add.
+        - nest: Optional. Turns lists and tuples into nested layouts rather than Horizontal and Vertical widgets,
+          only for box layouts.
+        """
+        boxed = isinstance(layout, QHBoxLayout) or isinstance(layout, QVBoxLayout)
         for item in items:
             if item is None:
                 continue
+            elif isinstance(item, Keyed):
+                BaseContainer.fill(layout, (item.item() if callable(item.item) else item.item,), nest)
             elif isinstance(item, QWidget):
-                self.lyt.addWidget(item)
+                layout.addWidget(item)
             elif isinstance(item, QLayout):
-                if isinstance(self.lyt, QHBoxLayout) or isinstance(self.lyt, QVBoxLayout):
-                    self.lyt.addLayout(item)
+                if boxed:
+                    layout.addLayout(item)  # type: ignore
+            elif isinstance(item, (list, tuple)) and nest and boxed:
+                layout.addLayout(BaseContainer.nested(item))  # type: ignore
             elif isinstance(item, list):
-                self.lyt.addWidget(Horizontal(*item))
+                layout.addWidget(Horizontal(*item))
             elif isinstance(item, tuple):
-                self.lyt.addWidget(Vertical(*item))
+                layout.addWidget(Vertical(*item))
             elif isinstance(item, str):
-                self.lyt.addWidget(Text(item, Text.Type.P1))
+                layout.addWidget(Text(item, Text.Type.P1))
             else:
-                if isinstance(self.lyt, QHBoxLayout) or isinstance(self.lyt, QVBoxLayout):
-                    self.lyt.addStretch()
-        return self
+                if boxed:
+                    layout.addStretch()  # type: ignore
 
-    def remove(self, item: QWidget) -> Self:
+    @staticmethod
+    def nested(items: List | Tuple) -> QLayout:
+        """
+        Returns a HorizontalLayout for a list and a VerticalLayout for a tuple, filled with the items.
+        """
+        layout = HorizontalLayout() if isinstance(items, list) else VerticalLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        BaseContainer.fill(layout, items)
+        return layout
+
+    def remove(self, item: QWidget, delete: bool = False) -> Self:
         """
         Removes a widget from the container.
 
         Args:
         - item: The widget to remove.
+        - delete: Optional. Deletes the widget too, otherwise it stays a child of the container.
 
         Returns:
         - itself: Returns the container itself after removing the widget.
         """
         self.lyt.removeWidget(item)
+        if delete:
+            item.hide()
+            item.deleteLater()
         return self
 
+    def render(self, *spec: Union[QWidget, QLayout, Tuple, List, str, Stretch, Keyed, None]) -> Self:
+        """
+        Makes the content of the container match a spec, using the vocabulary of `add`.
+
+        The spec is compared with the previous one: items matching a previous item keep their widget,
+        texts are updated in place, nested lists and tuples are rendered recursively,
+        and only the widgets of new items are created, the ones of gone items deleted and the others moved.
+        Items match by key when given one with `Keyed`, by identity for widgets and layouts and by kind and position
+        otherwise. A layout is shown through a bare widget holding it. Any other item raises a TypeError, before
+        anything changes. The first render replaces whatever was added to the container before.
+
+        Args:
+        - spec: The items the container should show.
+
+        Returns:
+        - itself: Returns the container itself after rendering.
+        """
+        if not isinstance(self.lyt, (QHBoxLayout, QVBoxLayout, QStackedLayout)):
+            raise TypeError(f"{self.__class__.__name__} can not render, it needs a box or stacked layout")
+        # the whole spec is checked before anything changes, a copy of the previous items is used up as they match
+        entries = BaseContainer._entries(spec)
+        previous: Dict[Any, Tuple[str, QWidget | None]] = dict(getattr(self, "_rendered", {}))
+        rendered: Dict[Any, Tuple[str, QWidget | None]] = {}
+        order: List[QWidget | None] = []
+        for key, kind, item in entries:
+            entry = previous.pop(key, None)
+            if entry is not None and entry[0] == kind and (kind != "widget" or entry[1] is item) \
+                    and (kind != "layout" or entry[1].layout() is item):  # type: ignore
+                widget = entry[1]
+                BaseContainer._update(widget, item)
+            else:
+                if entry is not None:
+                    previous[key] = entry
+                widget = BaseContainer._create(item() if kind == "factory" else item)
+            rendered[key] = (kind, widget)
+            order.append(widget)
+        if isinstance(self.lyt, QStackedLayout):
+            order = [widget for widget in order if widget is not None]
+        kept = {id(widget) for widget in order if widget is not None}
+        for index in reversed(range(self.lyt.count())):
+            widget = self.lyt.itemAt(index).widget()
+            if widget is None or id(widget) not in kept:
+                self._discard(self.lyt.takeAt(index), previous)
+        for index, widget in enumerate(order):
+            current = self.lyt.itemAt(index)
+            if current is not None and (current.widget() is widget if widget is not None else current.spacerItem() is not None):
+                continue
+            if widget is None:
+                self.lyt.insertStretch(index)  # type: ignore
+            else:
+                self.lyt.removeWidget(widget)
+                self.lyt.insertWidget(index, widget)  # type: ignore
+        self._rendered = rendered
+        return self
+
+    @staticmethod
+    def _entries(spec: Sequence[Any]) -> List[Tuple[Any, str, Any]]:
+        # the key, kind and item of every item of a spec, raises ValueError when a key is used twice at any depth
+        entries = []
+        keys = set()
+        for position, item in enumerate(spec):
+            if item is None:
+                continue
+            key = None
+            if isinstance(item, Keyed):
+                key = ("key", item.key)
+                item = item.item
+            kind = BaseContainer._kind(item)
+            if key is None:
+                key = (kind, id(item)) if kind in ("widget", "layout") else (kind, position)
+            if key in keys:
+                raise ValueError(f"the key {key[1]!r} is used twice")
+            if kind in ("list", "tuple"):
+                BaseContainer._entries(item)
+            keys.add(key)
+            entries.append((key, kind, item))
+        return entries
+
+    @staticmethod
+    def _kind(item: Any) -> str:
+        if isinstance(item, QWidget):
+            return "widget"
+        if isinstance(item, list):
+            return "list"
+        if isinstance(item, tuple):
+            return "tuple"
+        if isinstance(item, str):
+            return "text"
+        if isinstance(item, QLayout):
+            return "layout"
+        if (callable(item) and not isinstance(item, type)) or (isinstance(item, type) and issubclass(item, QWidget)):
+            return "factory"
+        if isinstance(item, Stretch) or item is Stretch:
+            return "stretch"
+        raise TypeError(f"a container can not render {item!r}")
+
+    @staticmethod
+    def _create(item: Any) -> QWidget | None:
+        if isinstance(item, QWidget):
+            return item
+        if isinstance(item, list):
+            return Horizontal().render(*item)
+        if isinstance(item, tuple):
+            return Vertical().render(*item)
+        if isinstance(item, str):
+            return Text(item, Text.Type.P1)
+        if isinstance(item, QLayout):
+            # a layout is shown through a bare widget holding it
+            holder = QWidget()
+            holder.setLayout(item)
+            return holder
+        return None
+
+    @staticmethod
+    def _update(widget: QWidget | None, item: Any) -> None:
+        if isinstance(item, str) and widget.text() != item:  # type: ignore
+            widget.setText(item)  # type: ignore
+        elif isinstance(item, (list, tuple)):
+            widget.render(*item)  # type: ignore
+
+    def _discard(self, layout_item: Any, previous: Dict[Any, Tuple[str, QWidget | None]]) -> None:
+        widget = layout_item.widget() if layout_item is not None else None
+        if widget is None:
+            return
+        if any(entry[1] is widget and entry[0] == "widget" for entry in previous.values()):
+            # widgets given by the caller are only taken out, they belong to the caller
+            widget.setParent(None)
+        else:
+            widget.hide()
+            widget.deleteLater()
+
     def layout_padding(self, padding: int) -> Self:
         """
         Sets the padding around the container's layout.
@@ -804,7 +1353,7 @@ class Tabs(QTabWidget, BasicElement, Linked, Padded):
 
     def __init__(self, *elements: Tab, parent: QWidget | None = None, style: Style | None = None) -> None:
         super().__init__(parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         for element in elements:
             self.add(element)
@@ -900,7 +1449,7 @@ class Label(QLabel, BasicElement, Linked, Iconizable):
 
     def __init__(self, text: str, parent=None, style: Style | None = None):
         super().__init__(text=text, parent=parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         self.setOpenExternalLinks(True)
         self.setWordWrap(True)
@@ -964,7 +1513,7 @@ class Button(QPushButton, BasicElement, Linked, Clickable, Iconizable):
 
     def __init__(self, text: str, parent=None, style: Style | None = None):
         super().__init__(text=text, parent=parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
 
 
@@ -980,14 +1529,14 @@ class CheckBox(QCheckBox, BasicElement, Checkable, Linked, Iconizable):
 
     def __init__(self, text: str, parent=None, style: Style | None = None):
         super().__init__(text=text, parent=parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
     def enableCondition(self, other:Union["CheckBox",str]):
         if isinstance(other, str):
             other = Finder.get(other)
         self.setEnabled(other.isChecked())
-        # add listener for then other value changes and set the same
-        other.stateChanged.connect(lambda x: (self.setChecked(other.isChecked()),self.setCheckable(other.isChecked())))
+        # follow the other value when it changes
+        Bindings.bind(other, self, Bindings.follow, apply=False)
         return self
 
 
@@ -1007,7 +1556,7 @@ class RadioButton(QRadioButton, BasicElement, Checkable, TextEditable, Linked, I
 
     def __init__(self, text: str, parent=None, style: Style | None = None):
         super().__init__(text=text, parent=parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
 
     def assign(self, group: QButtonGroup) -> Self:
@@ -1044,7 +1593,7 @@ class ComboBox(QComboBox, BasicElement, TextEditable, Linked):
 
     def __init__(self, items: List[str]|Tuple[str], style: Style | None = None):
         super().__init__()
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.add(*items)
 
     def get(self) -> str:
@@ -1095,17 +1644,21 @@ class ComboBox(QComboBox, BasicElement, TextEditable, Linked):
         super().clear()
         return self
 
-    def change_listener(self, callback: Callable[[str], None]) -> Self:
+    def change_listener(self, callback: Callable[[str], None], debounce: int = 0, throttle: int = 0,
+                        leading: bool | None = None) -> Self:
         """
         Adds a change listener to the combo box.
 
         Args:
         - callback: A function to call when the combo box changes.
+        - debounce: Optional. Calls the function once the selection stopped changing for this many milliseconds.
+        - throttle: Optional. Calls the function at most once every this many milliseconds while the selection changes.
+        - leading: Optional. Calls the function on the first change of a burst too, by default only when throttling.
 
         Returns:
         - itself: Returns itself after adding the listener.
         """
-        self.currentIndexChanged.connect(callback)
+        self.currentIndexChanged.connect(coalesce(callback, debounce, throttle, leading, self))
         return self
 
 
@@ -1121,7 +1674,7 @@ class Field(QLineEdit, BasicElement, TextEditable, Linked, TextValueEditable):
 
     def __init__(self, placeholder: str | None = None, parent: QWidget | None = None, style: Style | None = None):
         super().__init__(parent=parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         if placeholder:
             self.setPlaceholderText(placeholder)
         self.setAccessibleName(self.__class__.__name__)
@@ -1136,7 +1689,7 @@ class Field(QLineEdit, BasicElement, TextEditable, Linked, TextValueEditable):
         return self.text()
 
 
-class MultilineField(QTextEdit, BasicElement, TextEditable, Linked, TextValueEditable):
+class MultilineField(QTextEdit, BasicElement, TextEditable, Linked, TextValueEditable, Documented):
     """
     Represents a multi-line text input field with additional features.
 
@@ -1147,12 +1700,35 @@ class MultilineField(QTextEdit, BasicElement, TextEditable, Linked, TextValueEdi
 
     def __init__(self, parent=None, style=None):
         super().__init__(parent=parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         self.setSizePolicy(QSizePolicy.Policy.Expanding,
                            QSizePolicy.Policy.Expanding)
 
 
+class PlainMultilineField(QPlainTextEdit, BasicElement, TextEditable, Linked, TextValueEditable, Documented):
+    """
+    Represents a multi-line plain text input field, for large documents.
+
+    Unlike MultilineField, it has no rich text: the document only holds lines of text, and only the visible ones
+    are laid out, so editing stays responsive with files of tens of megabytes.
+
+    Args:
+    - parent: Optional. The parent widget.
+    - style: Optional. The style to apply to the field.
+    """
+
+    def __init__(self, parent=None, style=None):
+        super().__init__(parent=parent)
+        self.apply_style_sheet(style.to_str() if style else "")
+        self.setAccessibleName(self.__class__.__name__)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding,
+                           QSizePolicy.Policy.Expanding)
+
+    def setText(self, text: str) -> None:
+        self.setPlainText(text)
+
+
 class Slider(QSlider, BasicElement, Linked, Ranged):
     """
     Represents a slider widget with additional features.
@@ -1164,7 +1740,7 @@ class Slider(QSlider, BasicElement, Linked, Ranged):
 
     def __init__(self, parent=None, style: Style | None = None):
         super().__init__(parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
 
 
@@ -1179,7 +1755,7 @@ class ProgressBar(QProgressBar, BasicElement, Linked, Ranged):
 
     def __init__(self, parent=None, style: Style | None = None):
         super().__init__(parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
 
 
@@ -1194,14 +1770,10 @@ class SpinBox(QSpinBox, BasicElement, Linked, TextEditable, Ranged):
 
     def __init__(self, parent=None, style: Style | None = None):
         super().__init__(parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         self.setValue
 
-    def valueChange(self, fn: Callable) -> Self:
-        self.valueChanged.connect(fn)
-        return self
-
     def set_value(self, value: int) -> Self:
         self.setValue(value)
         return self
@@ -1218,7 +1790,7 @@ class Dial(QDial, BasicElement, Linked, Ranged):
 
     def __init__(self, parent=None, style: Style | None = None):
         super().__init__(parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         self.setValue
 
@@ -1308,7 +1880,7 @@ class Window(QMainWindow, BasicElement):
 
     def __init__(self, child: QWidget | Tuple | List | None = None, parent=None, style: Style | None = None):
         super().__init__(parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         if child:
             if isinstance(child, list):
@@ -1372,8 +1944,7 @@ class ScrollableContainer(Vertical, BasicElement):
 
         # Set up the main layout
         self.scroll_area.setObjectName("scroll-area")
-        self.scroll_area.setStyleSheet(
-            "QScrollArea#scroll-area{background-color:transparent}")
+        apply_style_sheet(self.scroll_area, "QScrollArea#scroll-area{background-color:transparent}")
         self.add(self.scroll_area)
 
         # Ensure the content expands to fill the available space
@@ -1417,16 +1988,17 @@ class GroupBox(QGroupBox, BasicElement, Padded, Linked):
 
     def __init__(self, content: BaseContainer | Tuple | List, title: str, parent=None, style: Style | None = None):
         super().__init__(title, parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         if isinstance(content, BaseContainer):
             self.setLayout(content.layout())
-        elif isinstance(content, tuple):
-            l = Vertical(*content)
-            self.setLayout(l.layout())
-        elif isinstance(content, list):
-            l = Horizontal(*content)
-            self.setLayout(l.layout())
+        elif isinstance(content, (tuple, list)):
+            # filled in place, a container widget would only be left behind once its layout is taken
+            layout = QHBoxLayout() if isinstance(content, list) else QVBoxLayout()
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(0)
+            BaseContainer.fill(layout, content, BaseContainer.nest_layouts)
+            self.setLayout(layout)
 
     def layout_padding(self, p0_: int) -> Self:
         self.layout().setContentsMargins(p0_, p0_, p0_, p0_)
@@ -1456,9 +2028,34 @@ class ItemCheckable(QTableWidgetItem):
 
 
 class Toggle(CheckBox):
+    """
+    Represents a switch, a check box drawn as a bar with a handle sliding from one end to the other.
+
+    The bar and the handle are rendered once per size, device pixel ratio, colours and handle position into pixmaps
+    shared by every toggle, and the handles of every toggle are animated by a single timer.
+
+    Args:
+    - parent: Optional. The parent widget.
+    - bar_color: Optional. The colour of the bar when unchecked.
+    - checked_color: Optional. The colour of the handle when checked, the bar takes a lighter one.
+    - handle_color: Optional. The colour of the handle when unchecked.
+
+    Methods:
+    - pressed: Sets a function to be called with the new state when the toggle is switched.
+    - pixmap: Returns the rendered bar and handle for a size.
+    - handle_position: Moves the handle, from 0 (unchecked) to 1 (checked).
+    - pulse_radius: Sets the radius of the pulse drawn around the handle while it moves.
+    """
+    frames = 8
+    """The steps the handle takes from one end to the other, 0 switches without animating"""
+    interval = 16
+    """The milliseconds between two steps"""
 
     _transparent_pen = QPen(Qt.GlobalColor.transparent)
     _light_grey_pen = QPen(Qt.GlobalColor.lightGray)
+    _pulse_color = QColor("#44999999")
+    _ticker: QTimer | None = None
+    _animating: "weakref.WeakSet[Toggle]" = weakref.WeakSet()
 
     def __init__(self,
                  parent=None,
@@ -1470,21 +2067,35 @@ class Toggle(CheckBox):
 
         self.setMaximumWidth(50)
 
-        # Save our properties on the object via self, so we can access them later
-        # in the paintEvent.
-        self._bar_brush = QBrush(bar_color)
-        self._bar_checked_brush = QBrush(QColor(checked_color).lighter())
-
-        self._handle_brush = QBrush(handle_color)
-        self._handle_checked_brush = QBrush(QColor(checked_color))
+        # the brushes are shared by the toggles of the same colours, the colours are part of the pixmap keys
+        checked = QColor(checked_color)
+        pulse = QColor(checked)
+        pulse.setAlpha(self._pulse_color.alpha())
+        self._colors = tuple(QColor(color).rgba() for color in (bar_color, checked.lighter(), handle_color, checked))
+        self._bar_brush, self._bar_checked_brush, self._handle_brush, self._handle_checked_brush = map(Toggle.brush, self._colors)
+        self._pulse_brush = Toggle.brush(self._pulse_color.rgba())
+        self._pulse_checked_brush = Toggle.brush(pulse.rgba())
 
         # Setup the rest of the widget.
 
         self.setContentsMargins(8, 0, 8, 0)
         self._handle_position = 0
+        self._target = 0
+        self._pulse_radius = 0
 
         self.stateChanged.connect(self._handle_state_change)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def brush(rgba: int) -> QBrush:
+        """
+        Returns the brush shared by the toggles for a colour.
+
+        Args:
+        - rgba: The colour, as returned by QColor.rgba.
+        """
+        return QBrush(QColor.fromRgba(rgba))
+
     def sizeHint(self):
         return QSize(48, 35)
 
@@ -1494,9 +2105,45 @@ class Toggle(CheckBox):
     def paintEvent(self, e: QPaintEvent):
 
         contRect = self.contentsRect()
-        handleRadius = round(0.24 * contRect.height())
+        if contRect.isEmpty():
+            return
 
         p = QPainter(self)
+        if self._pulse_radius:
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            p.setPen(self._transparent_pen)
+            p.setBrush(self._pulse_checked_brush if self.isChecked() else self._pulse_brush)
+            handleRadius = round(0.24 * contRect.height())
+            trailLength = contRect.width() - 2 * handleRadius
+            center = QPointF(contRect.x() + handleRadius + trailLength * self._handle_position, contRect.center().y())
+            p.drawEllipse(center, self._pulse_radius, self._pulse_radius)
+        p.drawPixmap(contRect.topLeft(), self.pixmap(contRect.size()))
+        p.end()
+
+    def pixmap(self, size: QSize) -> QPixmap:
+        """
+        Returns the bar and the handle in their current state, rendered at the device pixel ratio of the toggle.
+
+        Args:
+        - size: The size of the contents of the toggle.
+        """
+        ratio = self.devicePixelRatioF()
+        key = (f"comps.Toggle:{size.width()}x{size.height()}@{ratio}:{self._colors}:"
+               f"{self.isChecked():d}:{round(self._handle_position, 4)}")
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(size * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            p = QPainter(pixmap)
+            self._paint(p, QRect(QPoint(0, 0), size))
+            p.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _paint(self, p: QPainter, contRect: QRect) -> None:
+        handleRadius = round(0.24 * contRect.height())
+
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         p.setPen(self._transparent_pen)
@@ -1526,15 +2173,54 @@ class Toggle(CheckBox):
             QPointF(xPos, barRect.center().y()),
             handleRadius, handleRadius)
 
-        p.end()
+    def pressed(self, func: Callable[[bool], None], debounce: int = 0, throttle: int = 0,
+                leading: bool | None = None) -> Self:
+        """
+        Sets a function to be called with the new state when the toggle is switched.
 
-    def pressed(self, func: Callable[[bool], None]) -> Self:
-        self.stateChanged.connect(lambda *x: func(self._handle_position == 1))
+        Args:
+        - func: The function to call.
+        - debounce: Optional. Calls the function once the toggle stopped switching for this many milliseconds.
+        - throttle: Optional. Calls the function at most once every this many milliseconds while the toggle switches.
+        - leading: Optional. Calls the function on the first switch of a burst too, by default only when throttling.
+        """
+        listener = coalesce(func, debounce, throttle, leading, self)
+        self.stateChanged.connect(lambda *x: listener(self.isChecked()))
         return self
 
     @Slot(int)
     def _handle_state_change(self, value):
-        self._handle_position = 1 if value else 0
+        self._target = 1 if value else 0
+        if not Toggle.frames or not self.isVisible():
+            self._pulse_radius = 0
+            self.handle_position(self._target)
+            return
+        Toggle._animating.add(self)
+        if Toggle._ticker is None:
+            Toggle._ticker = QTimer()
+            Toggle._ticker.timeout.connect(Toggle._tick)
+        if not Toggle._ticker.isActive():
+            Toggle._ticker.start(Toggle.interval)
+
+    @staticmethod
+    def _tick() -> None:
+        """Moves every animating handle one step towards its end, and stops the timer once they all got there"""
+        step = 1 / max(Toggle.frames, 1)
+        for toggle in list(Toggle._animating):
+            if sip.isdeleted(toggle):
+                Toggle._animating.discard(toggle)
+                continue
+            start, end = 1 - toggle._target, toggle._target
+            position = min(end, toggle._handle_position + step) if end else max(end, toggle._handle_position - step)
+            if position == end:
+                Toggle._animating.discard(toggle)
+                toggle.pulse_radius(0)
+            else:
+                # the pulse grows around the handle as it moves away from where it started
+                toggle.pulse_radius(round(0.24 * toggle.contentsRect().height()) * (1 + abs(position - start)))
+            toggle.handle_position(position)
+        if not Toggle._animating:
+            Toggle._ticker.stop()
 
     def _get_handle_position(self):
         return self._handle_position
@@ -1551,8 +2237,8 @@ class Toggle(CheckBox):
     def _get_pulse_radius(self):
         return self._pulse_radius
 
-    def _pulse_radius(self, pos):
-        self._pulse_radius = pos
+    def pulse_radius(self, radius):
+        self._pulse_radius = radius
         self.update()
 
 class Table(QTableWidget, BasicElement, Linked):
@@ -1578,7 +2264,7 @@ class Table(QTableWidget, BasicElement, Linked):
 
     def __init__(self, *columns, parent=None, style: Style | None = None) -> None:
         super().__init__(parent=parent)
-        self.setStyleSheet(style.to_str() if style else "")
+        self.apply_style_sheet(style.to_str() if style else "")
         self.setAccessibleName(self.__class__.__name__)
         self.clicked_function = None
         for column in columns:
@@ -1596,6 +2282,8 @@ class Table(QTableWidget, BasicElement, Linked):
         - None: Returns nothing.
         """
         self.setColumnCount(self.columnCount()+1)
+        if len(column.items) > self.rowCount():
+            self.setRowCount(len(column.items))
         if column.head is not None:
             self.setHorizontalHeaderItem(
                 self.columnCount()-1, QTableWidgetItem(column.head))
@@ -1608,6 +2296,159 @@ class Table(QTableWidget, BasicElement, Linked):
                 self.setCellWidget(i, self.columnCount()-1, data)
 
 
+class DataTable(QTableView, BasicElement, Linked):
+    """
+    Represents a table view backed by a columnar model, made for tables with a large number of rows.
+
+    Unlike Table, no item is allocated per cell: each column is kept in compact storage
+    and display data is only produced for the visible cells.
+
+    Args:
+    - columns: The initial columns of the table.
+    - parent: Optional. The parent widget.
+    - style: Optional. The style to apply to the table.
+
+    Methods:
+    - add_column: Adds a new column with the specified header text and data to the table.
+    - add_rows: Adds rows at the bottom of the table.
+    - set_cell_data: Sets the data for a specific cell in the table.
+    - get: Gets the data of a specific cell in the table.
+    """
+
+    def __init__(self, *columns: Column, parent=None, style: Style | None = None) -> None:
+        super().__init__(parent)
+        self.apply_style_sheet(style.to_str() if style else "")
+        self.setAccessibleName(self.__class__.__name__)
+        self.table_model = ColumnTableModel(self)
+        self.setModel(self.table_model)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column in columns:
+            self.add_column(column)
+
+    def add_column(self, column: Column) -> Self:
+        """
+        Adds a new column to the table with the specified header text and data.
+
+        Args:
+        - column: The column to add, QTableWidgetItem values are stored as their text
+          and QWidget values are shown as index widgets.
+
+        Returns:
+        - itself: Returns itself after adding the column.
+        """
+        head = column.head.text() if isinstance(column.head, QTableWidgetItem) else column.head
+        widgets = {}
+        values = column.items
+        if not all(isinstance(item, str) for item in values):
+            values = []
+            for i, item in enumerate(column.items):
+                if isinstance(item, QWidget):
+                    widgets[i] = item
+                    values.append("")
+                elif isinstance(item, QTableWidgetItem):
+                    values.append(item.text())
+                else:
+                    values.append(item)
+        index = self.table_model.add_column(head, values)
+        for row, widget in widgets.items():
+            self.setIndexWidget(self.table_model.index(row, index), widget)
+        return self
+
+    def add_rows(self, *rows: List | Tuple) -> Self:
+        """
+        Adds rows at the bottom of the table.
+
+        Args:
+        - rows: The rows to add, each one holding its values in column order.
+
+        Returns:
+        - itself: Returns itself after adding the rows.
+        """
+        self.table_model.add_rows(rows)
+        return self
+
+    def set_cell_data(self, row: int, column: int, value: Any) -> Self:
+        """
+        Sets the data for a specific cell in the table.
+
+        Args:
+        - row: The row of the cell.
+        - column: The column of the cell.
+        - value: The value to set.
+
+        Returns:
+        - itself: Returns itself after setting the data.
+        """
+        self.table_model.set_cell_data(row, column, value)
+        return self
+
+    def get(self, row: int, column: int) -> Any:
+        """
+        Gets the data of a specific cell in the table.
+
+        Args:
+        - row: The row of the cell.
+        - column: The column of the cell.
+
+        Returns:
+        - The value of the cell, None if the cell is empty.
+        """
+        values = self.table_model.columns[column]
+        return values[row] if row < len(values) else None
+
+
+class SourceView(QTableView, BasicElement, Linked):
+    """
+    Represents a read-only table over a data source read lazily, such as MappedLines, or over a ready model
+    such as the ColumnTableModel an Importer fills.
+
+    Args:
+    - source: Optional. The source to show.
+    - columns: Optional. Splits the lines of the source into fields, the first line being the header.
+    - parent: Optional. The parent widget.
+    - style: Optional. The style to apply to the view.
+
+    Methods:
+    - set_source: Shows another source.
+    """
+
+    def __init__(self, source: "MappedLines | None" = None, columns: bool = False, parent=None, style: Style | None = None) -> None:
+        super().__init__(parent)
+        self.apply_style_sheet(style.to_str() if style else "")
+        self.setAccessibleName(self.__class__.__name__)
+        self.setWordWrap(False)
+        self.source_model: QAbstractItemModel | None = None
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        if source is not None:
+            self.set_source(source, columns)
+
+    def set_source(self, source: "MappedLines | QAbstractItemModel", columns: bool = False) -> Self:
+        """
+        Shows another source.
+
+        Args:
+        - source: The source to show, or the model to show.
+        - columns: Optional. Splits the lines of the source into fields, the first line being the header,
+          for a model, shows its header.
+
+        Returns:
+        - itself: Returns itself after setting the source.
+        """
+        previous = self.source_model
+        if isinstance(source, QAbstractItemModel):
+            self.source_model = source
+        else:
+            from .sources import SourceTableModel
+            self.source_model = SourceTableModel(source, columns, self)
+        self.setModel(self.source_model)
+        self.horizontalHeader().setVisible(columns)
+        if previous is not None and previous.parent() is self:
+            previous.deleteLater()
+        return self
+
+
 class LoginForm(Vertical):
     """
     Represents a login form with predefined structure.
@@ -1642,11 +2483,29 @@ class LoginForm(Vertical):
 
 
 class MultilineAssistedField(Vertical):
-    def __init__(self, denom: str, importFromFile: bool, suggestions: List[str], identificator: str, parent=None, style: Style | None = None):
+    """
+    Represents a multi-line text field with suggestions to insert and optional file import and export.
+
+    Args:
+    - denom: The label of the field, also used by the file buttons.
+    - importFromFile: Shows the buttons importing and exporting the text.
+    - suggestions: The texts the suggestions box inserts.
+    - identificator: The id of the field.
+    - parent: Optional. The parent widget.
+    - style: Optional. The style to apply to the field.
+    - plain_text: Optional. Edits the text with a PlainMultilineField instead of a MultilineField,
+      for large documents.
+    """
+
+    def __init__(self, denom: str, importFromFile: bool, suggestions: List[str], identificator: str, parent=None,
+                 style: Style | None = None, plain_text: bool = False):
         super().__init__(parent=parent, style=style)
-        self.textField = MultilineField()
+        self.textField = PlainMultilineField() if plain_text else MultilineField()
         self.suggestions = ComboBox(
             suggestions).change_listener(self.combobox_listener_call)
+        self.loader: "TextLoader | None" = None
+        self.progress = ProgressBar()
+        self.progress.hide()
         self.set_name("MultilineAssistedField")
         self.id(identificator)
         self.add(
@@ -1658,6 +2517,7 @@ class MultilineAssistedField(Vertical):
                         Vertical(
                             Button("Import "+denom).action(self.load),
                             Button("Export "+denom).action(self.export),
+                            self.progress,
                         ), "File options"
                     ) if importFromFile else None,
                     GroupBox(
@@ -1682,15 +2542,18 @@ class MultilineAssistedField(Vertical):
         path, _ = QFileDialog.getOpenFileName(
             self, "Open file", "", "Text files (*.txt)")
         if path:
-            with open(path, "r") as f:
-                self.textField.insertPlainText(f.read())
+            if self.loader is not None:
+                self.loader.cancel()
+            self.loader = self.textField.load(path).track(self.progress)
+            self.loader.ended.connect(self.progress.hide)
+            self.progress.show()
+            self.loader.start()
 
     def export(self):
         path, _ = QFileDialog.getSaveFileName(
             self, "Save file", "", "Text files (*.txt)")
         if path:
-            with open(path, "w") as f:
-                f.write(self.textField.toPlainText())
+            self.textField.save(path)
 
 
 class ListWidget(QListWidget, BasicElement, Linked, Padded):
@@ -1703,8 +2566,21 @@ class ListWidget(QListWidget, BasicElement, Linked, Padded):
         return self
 
     def change(self, *items: str) -> Self:
-        self.clear()
-        self.addItems(items)
+        """
+        Replaces the entries with the given ones through the fewest removals, insertions and moves (see diff),
+        so the selection and the scroll position follow the entries that stay.
+
+        Returns:
+        - itself: Returns itself after changing the entries.
+        """
+        model = self.model()
+        for kind, row, argument in diff([self.item(n).text() for n in range(self.count())], items):
+            if kind == "remove":
+                model.removeRows(row, argument)
+            elif kind == "insert":
+                self.insertItems(row, argument)
+            else:
+                model.moveRow(QModelIndex(), row, QModelIndex(), argument + 1 if argument > row else argument)
         return self
 
     def change_at(self, index: int, item: str) -> Self:
@@ -1723,27 +2599,282 @@ class ListWidget(QListWidget, BasicElement, Linked, Padded):
         return self
 
 
+class VirtualListWidget(QTableView, BasicElement, Linked, Padded):
+    """
+    Represents a list with the same API as ListWidget, backed by a ListModel instead of one QListWidgetItem per entry.
+
+    Adding a batch of entries is a single model insertion, and only the visible rows are ever displayed,
+    which keeps lists of hundreds of thousands of entries cheap.
+    It is a single column QTableView without headers: QListView lays out every row again after each insertion,
+    while fixed height rows let the table only look at the visible ones.
+
+    Args:
+    - items: Initial entries of the list.
+    - parent: Optional. The parent widget.
+    - storage: Optional. The mutable sequence holding the entries (see ListModel).
+    - unique: Optional. Skips the entries already in the list when adding or changing entries (see ListModel).
+    """
+
+    def __init__(self, *items: str, parent: QWidget | None = None, storage: MutableSequence[str] | None = None,
+                 unique: bool = False) -> None:
+        super().__init__(parent)
+        self.setAccessibleName(self.__class__.__name__)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 4)
+        self.list_model = ListModel(items, storage, self, unique)
+        self.setModel(self.list_model)
+
+    def add(self, *items: str | QListWidgetItem | None) -> Self:
+        if set(map(type, items)) <= {str}:
+            self.list_model.append(items)
+            return self
+        self.list_model.append([item.text() if isinstance(item, QListWidgetItem) else item
+                                for item in items if item is not None])
+        return self
+
+    def change(self, *items: str) -> Self:
+        """
+        Replaces the entries with the given ones through the fewest removals, insertions and moves
+        (see ListModel.sync), so the selection follows the entries that stay and the top visible entry stays on top.
+
+        Returns:
+        - itself: Returns itself after changing the entries.
+        """
+        top = QPersistentModelIndex(self.indexAt(QPoint(0, 0)))
+        self.list_model.sync(items)
+        if top.isValid() and top.row() != self.indexAt(QPoint(0, 0)).row():
+            self.scrollTo(self.model().index(top.row(), 0), QTableView.ScrollHint.PositionAtTop)
+        return self
+
+    def change_at(self, index: int, item: str) -> Self:
+        if 0 <= index < self.count():
+            self.list_model.replace(index, item)
+        else:
+            self.list_model.insert(index, item)
+        return self
+
+    def pop(self, index: int) -> str | None:
+        return self.list_model.take(index)
+
+    def remove(self, index: int) -> Self:
+        self.list_model.take(index)
+        return self
+
+    def remove_many(self, indices: Iterable[int]) -> Self:
+        """
+        Removes the entries at the given indices at once (see ListModel.remove_many).
+
+        Returns:
+        - itself: Returns itself after removing the entries.
+        """
+        self.list_model.remove_many(indices)
+        return self
+
+    def remove_where(self, predicate: Callable[[str], Any] | str | re.Pattern) -> Self:
+        """
+        Removes at once the entries matching a predicate, or a regular expression given as a string or compiled.
+
+        Returns:
+        - itself: Returns itself after removing the entries.
+        """
+        self.list_model.remove_where(predicate)
+        return self
+
+    def replace_all(self, mapping: Dict[str, str]) -> Self:
+        """
+        Replaces every entry which is a key of a mapping by its value at once (see ListModel.replace_all).
+
+        Returns:
+        - itself: Returns itself after replacing the entries.
+        """
+        self.list_model.replace_all(mapping)
+        return self
+
+    def selected_rows(self) -> List[int]:
+        """
+        Returns the indices of the selected entries in the list, whatever model the view shows, in order.
+        """
+        model = self.model()
+        rows = [row for selection in self.selectionModel().selection()
+                for row in range(selection.top(), selection.bottom() + 1)]
+        if model is not self.list_model:
+            # the rows of a proxy, such as the one of a FilterBar
+            rows = [model.mapToSource(model.index(row, 0)).row() for row in rows]  # type: ignore
+        return sorted(set(rows))
+
+    def set_unique(self, unique: bool = True) -> Self:
+        """
+        Turns the unique mode on or off, turning it on removes the duplicated entries.
+
+        Returns:
+        - itself: Returns itself after changing the mode.
+        """
+        self.list_model.set_unique(unique)
+        return self
+
+    def contains(self, item: str) -> bool:
+        """
+        Tells whether the list holds an entry, in constant time in unique mode.
+        """
+        return self.list_model.contains(item)
+
+    def index_of(self, item: str) -> int:
+        """
+        Returns the index of an entry, -1 when the list does not hold it.
+        """
+        return self.list_model.index_of(item)
+
+    def count(self) -> int:
+        """
+        Returns the number of entries in the list.
+        """
+        return len(self.list_model.items)
+
+    def text(self, index: int) -> str:
+        """
+        Returns the entry at the given index.
+        """
+        return self.list_model.items[index]
+
+    def texts(self) -> List[str]:
+        """
+        Returns a copy of all the entries of the list.
+        """
+        return list(self.list_model.items)
+
+
+class FilterBar(Horizontal):
+    """
+    A search field filtering a VirtualListWidget as the query is typed, through a FilterModel set on the list.
+
+    The model keeps an index of the list in step with add, change_at, pop and remove, and shows the matches as they
+    are found, so each key press costs a few milliseconds however long the list.
+
+    Args:
+    - list: The list to filter.
+    - placeholder: Optional. The placeholder text of the field.
+    - parent: Optional. The parent widget.
+    - style: Optional. The style to apply to the filter bar.
+    """
+
+    def __init__(self, list: VirtualListWidget, placeholder: str = "Filter", parent=None, style: Style | None = None):
+        from .filtering import FilterModel
+        self.field = Field(placeholder).change_listener(lambda _: self.apply())
+        self.regex = CheckBox("Regex")
+        self.regex.toggled.connect(lambda _: self.apply())
+        self.matches = Text("", Text.Type.P3)
+        super().__init__(self.field, self.regex, self.matches, parent=parent, style=style)
+        self.set_name("FilterBar")
+        self.list = list
+        self.model: "FilterModel" = FilterModel(list.list_model, list)
+        self.model.filtered.connect(self._count)
+        list.setModel(self.model)
+
+    def apply(self) -> Self:
+        """
+        Filters the list with the current query.
+
+        Returns:
+        - itself: Returns itself after starting the search.
+        """
+        try:
+            self.model.filter(self.field.get(), self.regex.isChecked())
+        except re.error as e:
+            self.matches.setText(f"Invalid pattern: {e}")
+        return self
+
+    def clear(self) -> Self:
+        """
+        Empties the query, which shows the whole list.
+
+        Returns:
+        - itself: Returns itself after clearing the query.
+        """
+        self.field.clear()
+        return self
+
+    def _count(self, matches: int) -> None:
+        self.matches.setText("" if self.model.query is None else f"{matches} of {self.list.count()}")
+
+
 class NavigationLink(Button):
+    link_style = Style().add("Button#nav-link", "padding:0px;")
+
     def __init__(self, text: str, icon: QIcon | None = None, dest: QWidget | None = None):
         super().__init__(text, icon)
         self.dest = dest
+        self.factory: Callable[[], QWidget | List | Tuple] | None = None
         self.id("nav-link")
-        self.set_style(Style().add("Button#nav-link", "padding:0px;"))
+        self.set_style(NavigationLink.link_style)
         self.set_style(ButtonStyles.NavPrimary)
 
-    def target(self, target: QWidget | List | Tuple) -> Self:
+    def target(self, target: QWidget | List | Tuple | Callable[[], QWidget | List | Tuple]) -> Self:
+        """
+        Sets the page shown by the link.
+
+        Args:
+        - target: The page, or a factory building it: the NavigationBar then builds the page the first time
+          the link is navigated to, and may build it again if the page was evicted (see `NavigationBar.keep`).
+
+        Returns:
+        - itself: Returns itself after setting the target.
+        """
+        if callable(target):
+            self.factory = target
+            self.dest = None
+        else:
+            self.factory = None
+            self.dest = NavigationLink.page(target)
+        return self
+
+    def build(self) -> QWidget | None:
+        """
+        Returns the page of the link, building it first if needed.
+        """
+        if self.dest is None and self.factory is not None:
+            self.dest = NavigationLink.page(self.factory())
+        return self.dest
+
+    def is_lazy(self) -> bool:
+        """
+        Tells whether the page of the link is built by a factory.
+        """
+        return self.factory is not None
+
+    @staticmethod
+    def page(target: QWidget | List | Tuple) -> QWidget:
         if isinstance(target, List):
-            target = Horizontal(*target)
+            return Horizontal(*target)
         elif isinstance(target, Tuple):
-            target = Vertical(*target)
-        self.dest = target
-        return self
+            return Vertical(*target)
+        return target
 
 
 class NavigationBar(Horizontal, BasicElement):
-    def __init__(self, *items: NavigationLink | QWidget, parent: QWidget | None = None) -> None:
+    """
+    A sidebar of NavigationLinks next to the page of the selected one.
+
+    Pages given as factories (see `NavigationLink.target`) are only built when their link is selected.
+
+    Args:
+    - items: The links and other widgets of the sidebar.
+    - parent: Optional. The parent widget.
+    - keep: Optional. How many built pages from factories are kept alive at most, the least recently shown ones are
+      deleted beyond that and built again when needed. None keeps every page.
+    """
+    build_on_demand = True
+
+    def __init__(self, *items: NavigationLink | QWidget, parent: QWidget | None = None, keep: int | None = None) -> None:
         super().__init__(parent)
         self.items = items
+        self.keep = keep
+        self.built: Dict[int, NavigationLink] = {}
         self.set_name("NavigationContainer")
         self.sidebar = Vertical(*items).setW(200)
         self.sidebar.set_name("NavigationSidebar")
@@ -1751,22 +2882,25 @@ class NavigationBar(Horizontal, BasicElement):
                             QSizePolicy.Policy.Expanding)
         self.sidebar.align(Qt.AlignmentFlag.AlignTop)
         self.content_bar = Stacked()
-        for i, item in enumerate(items):
-            if isinstance(item, NavigationLink) and item.dest:
-                self.content_bar.add(item.dest)
-                item.action(lambda *a, item=item: self.change(item))
-            self.sidebar.add(item)
+        self.new(*items)
         self.add(self.sidebar, self.content_bar)
 
     def change(self, item: NavigationLink) -> None:
+        if item.dest is None and item.is_lazy():
+            self.content_bar.add(item.build())
         if item.dest:
             self.content_bar.currentWidget(item.dest)
+            self._used(item)
 
     def new(self, *items: NavigationLink | QWidget) -> Self:
-        # get the last index in the dictionary self.orders
         for i, item in enumerate(items):
-            if isinstance(item, NavigationLink) and item.dest:
-                self.content_bar.add(item.dest)
+            if isinstance(item, NavigationLink) and (item.dest or item.is_lazy()):
+                # the first page is shown right away, so it is built right away
+                if item.dest is None and (not NavigationBar.build_on_demand or self.content_bar.lyt.count() == 0):
+                    item.build()
+                if item.dest:
+                    self.content_bar.add(item.dest)
+                    self._used(item)
                 item.action(lambda *a, item=item: self.change(item))
             self.sidebar.add(item)
         return self
@@ -1775,6 +2909,24 @@ class NavigationBar(Horizontal, BasicElement):
         self.change(self.items[index])  # type: ignore
         return self
 
+    def _used(self, item: NavigationLink) -> None:
+        if not item.is_lazy():
+            return
+        self.built.pop(id(item), None)
+        self.built[id(item)] = item
+        if self.keep is None:
+            return
+        current = self.content_bar.lyt.currentWidget()
+        for key, link in list(self.built.items()):
+            if len(self.built) <= self.keep:
+                return
+            if link.dest is current:
+                continue
+            del self.built[key]
+            self.content_bar.lyt.removeWidget(link.dest)
+            link.dest.deleteLater()  # type: ignore
+            link.dest = None
+
 
 class Divider(QFrame, BasicElement):
     def __init__(self, orientation: Qt.Orientation = Qt.Orientation.Vertical, parent: QWidget | None = None) -> None:
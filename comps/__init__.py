@@ -1 +1,49 @@
-from .Elements import *
\ No newline at end of file
+"""
+The components are exposed lazily: `import comps` imports nothing else, and a name is looked up in its module,
+which is imported on first use. `comps.Style` only imports `comps.styles`, `comps.Button` imports `comps.Elements`
+and with it PyQt6.QtWidgets, `comps.MappedLines` imports numpy.
+"""
+import importlib
+from typing import Any, Dict, List
+
+_MODULES: Dict[str, str] = {
+    "Properties": "styles", "FrozenProperties": "styles", "QSS": "styles", "FrozenQSS": "styles",
+    "Style": "styles", "FrozenStyle": "styles", "TextStyles": "styles", "PaddingStyles": "styles",
+    "MarginStyles": "styles", "OpacityStyles": "styles", "BorderRadiusStyles": "styles",
+    "TabWidgetStyles": "styles", "ButtonStyles": "styles",
+    "PackedStrings": "models", "ColumnTableModel": "models", "ListModel": "models",
+    "BackgroundTask": "loaders", "LineLoader": "loaders", "TextLoader": "loaders",
+    "MappedLines": "sources", "SourceTableModel": "sources",
+    "Bindings": "binding",
+    "StyleRules": "stylesheets", "StyleRegistry": "stylesheets",
+    "Profiler": "profiling",
+    "FilterModel": "filtering", "TextIndex": "filtering",
+    "Importer": "importers", "Columns": "importers",
+    "Exporter": "exporters", "Snapshot": "exporters", "snapshot": "exporters",
+    "Coalesced": "scheduling", "Scheduler": "scheduling", "coalesce": "scheduling",
+}
+"""The names which do not need comps.Elements, every other name is looked up in it"""
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        # `from comps import *` exports what `from .Elements import *` used to
+        names = [n for n in dir(importlib.import_module(".Elements", __name__)) if not n.startswith("_")]
+        globals()["__all__"] = names
+        return names
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_MODULES.get(name, 'Elements')}", __name__)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        # the submodules imported by comps.Elements are set on the package by the import itself
+        if name not in globals():
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        return globals()[name]
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODULES))
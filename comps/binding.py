@@ -0,0 +1,141 @@
+import weakref
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Tuple
+from PyQt6 import sip
+from PyQt6.QtWidgets import QAbstractButton, QLayout, QWidget
+
+Effect = Callable[[QWidget, bool], None]
+
+
+class Fanout:
+    """
+    The dependents of a single source, updated through one connection to its stateChanged signal.
+
+    Dependents are held weakly and dropped when they are destroyed.
+    An update applies every effect in one pass with the layouts around the dependents disabled,
+    then activates them once: otherwise Qt activates every ancestor layout each time a dependent is shown.
+
+    Args:
+    - source: The checkable widget driving the dependents.
+    """
+
+    def __init__(self, source: QAbstractButton) -> None:
+        self.source = weakref.ref(source)
+        self.dependents: Dict[int, Tuple["weakref.ref[QWidget]", Effect]] = {}
+        source.stateChanged.connect(self.apply)  # type: ignore
+
+    def add(self, dependent: QWidget, effect: Effect) -> None:
+        token = next(Bindings._tokens)
+        self.dependents[token] = (weakref.ref(dependent), effect)
+        dependent.destroyed.connect(lambda *_: self.dependents.pop(token, None))
+
+    def apply(self, state: int) -> None:
+        checked = bool(state)
+        targets: List[Tuple[QWidget, Effect]] = []
+        for token, (ref, effect) in list(self.dependents.items()):
+            widget = ref()
+            if widget is None or sip.isdeleted(widget):
+                del self.dependents[token]
+            else:
+                targets.append((widget, effect))
+        if len(targets) == 1:
+            targets[0][1](targets[0][0], checked)
+            return
+        layouts = Bindings.layouts_around(widget for widget, _ in targets)
+        for layout in layouts:
+            layout.setEnabled(False)
+        try:
+            for widget, effect in targets:
+                effect(widget, checked)
+        finally:
+            for layout in layouts:
+                layout.setEnabled(True)
+            for layout in layouts:
+                layout.activate()
+
+
+class Bindings:
+    """
+    The binding engine behind Linked.link/visible/notVisible and CheckBox.enableCondition.
+
+    Every source gets a single Fanout, connected once, whatever the number of dependents.
+    """
+    _tokens = count()
+
+    @staticmethod
+    def enabled(widget: QWidget, checked: bool) -> None:
+        """Enables the widget while the source is checked"""
+        widget.setEnabled(checked)
+
+    @staticmethod
+    def visible(widget: QWidget, checked: bool) -> None:
+        """Shows the widget while the source is checked"""
+        widget.setVisible(checked)
+
+    @staticmethod
+    def hidden(widget: QWidget, checked: bool) -> None:
+        """Hides the widget while the source is checked"""
+        widget.setVisible(not checked)
+
+    @staticmethod
+    def follow(widget: QWidget, checked: bool) -> None:
+        """Makes a checkable widget follow the state of the source"""
+        widget.setChecked(checked)  # type: ignore
+        widget.setCheckable(checked)  # type: ignore
+
+    @staticmethod
+    def bind(source: QAbstractButton, dependent: QWidget, effect: Effect, apply: bool = True) -> None:
+        """
+        Makes the dependent follow the checked state of the source.
+
+        Args:
+        - source: The checkable widget driving the dependent.
+        - dependent: The widget to update.
+        - effect: What to do to the dependent when the state changes, for example `Bindings.enabled` or `Bindings.visible`.
+        - apply: Optional. Applies the effect right away with the current state.
+        """
+        fanout = Bindings.fanout(source)
+        fanout.add(dependent, effect)
+        if apply:
+            effect(dependent, source.isChecked())
+
+    @staticmethod
+    def fanout(source: QAbstractButton) -> Fanout:
+        """
+        Returns the Fanout of a source, creating it on first use.
+        """
+        fanout = getattr(source, "_fanout", None)
+        if fanout is None:
+            fanout = Fanout(source)
+            source._fanout = fanout  # type: ignore
+        return fanout
+
+    @staticmethod
+    def layouts_around(widgets: Iterable[QWidget]) -> List[QLayout]:
+        """
+        Returns the enabled layouts of the visible ancestors of the widgets, outermost first.
+
+        These are the layouts Qt activates synchronously every time one of the widgets is shown.
+        """
+        found: Dict[int, QLayout] = {}
+        for widget in widgets:
+            parent = widget.parentWidget()
+            while parent is not None and parent.isVisible():
+                layout = parent.layout()
+                if layout is not None:
+                    if id(layout) in found:
+                        break
+                    if layout.isEnabled():
+                        found[id(layout)] = layout
+                if parent.isWindow():
+                    break
+                parent = parent.parentWidget()
+        return sorted(found.values(), key=Bindings._depth)
+
+    @staticmethod
+    def _depth(layout: QLayout) -> int:
+        depth, widget = 0, layout.parentWidget()
+        while widget is not None and not widget.isWindow():
+            depth += 1
+            widget = widget.parentWidget()
+        return depth
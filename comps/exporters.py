@@ -0,0 +1,243 @@
+import copy
+import csv
+import json
+import os
+from itertools import zip_longest
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QListWidget, QTableWidget
+from .loaders import BackgroundTask, read_csv, read_text
+from .models import ColumnTableModel, ListModel
+
+Batches = Iterator[List[Sequence[Any]]]
+
+EXTENSIONS = {".csv": "csv", ".json": "json", ".xlsx": "excel", ".txt": "text"}
+FILTERS = {
+    "text": "Plain text (*.txt)",
+    "csv": "Comma separated values (*.csv)",
+    "json": "JSON (*.json)",
+    "excel": "Excel workbook (*.xlsx)",
+}
+"""The file dialog filter of every format"""
+_ALIASES = {"plain text": "text", "txt": "text", "xlsx": "excel"}
+EXCEL_ROWS = 1 << 20
+
+
+class Snapshot:
+    """
+    A copy of the data of a list or a table, taken on the GUI thread and read from a worker thread.
+
+    The columns are copied as they are stored, which for a list, an array or PackedStrings is a memory copy,
+    and the rows are only built, a batch at a time, while they are written.
+
+    Args:
+    - columns: The values of every column, shorter columns are padded with empty strings.
+    - heads: Optional. The header of every column.
+    """
+
+    def __init__(self, columns: List[Sequence[Any]], heads: List[str] | None = None) -> None:
+        self.columns = columns
+        self.heads = heads
+
+    def __len__(self) -> int:
+        return max(map(len, self.columns), default=0)
+
+    def rows(self, start: int, stop: int) -> List[Sequence[Any]]:
+        """
+        Returns the rows between two indexes.
+        """
+        return list(zip_longest(*(column[start:stop] for column in self.columns), fillvalue=""))
+
+
+def snapshot(source: Any) -> Snapshot:
+    """
+    Copies the data of a list or a table.
+
+    Args:
+    - source: A VirtualListWidget, a DataTable, a ListWidget, a Table, their models or a sequence of strings.
+    """
+    model = getattr(source, "list_model", getattr(source, "table_model", source))
+    if isinstance(model, ListModel):
+        return Snapshot([copy.copy(model.items)])
+    if isinstance(model, ColumnTableModel):
+        heads = None
+        if any(head is not None for head in model.heads):
+            heads = [head if head is not None else str(n + 1) for n, head in enumerate(model.heads)]
+        return Snapshot([copy.copy(column) for column in model.columns], heads)
+    if isinstance(source, QListWidget):
+        return Snapshot([[source.item(row).text() for row in range(source.count())]])  # type: ignore
+    if isinstance(source, QTableWidget):
+        heads = [(item.text() if (item := source.horizontalHeaderItem(column)) else str(column + 1))
+                 for column in range(source.columnCount())]
+        columns = [[(item.text() if (item := source.item(row, column)) else "") for row in range(source.rowCount())]
+                   for column in range(source.columnCount())]
+        return Snapshot(columns, heads)
+    return Snapshot([list(source)])
+
+
+def format_of(path: str, name: str | None = None) -> str:
+    """
+    Returns the export format for a name, such as "CSV", "Excel" or "Plain text", or a file dialog filter,
+    or when there is none or it is unknown, for the extension of the path.
+    """
+    if name:
+        name = name.strip().lower()
+        name = _ALIASES.get(name, name)
+        if name in WRITERS:
+            return name
+        for known, text in FILTERS.items():
+            if text.lower() == name:
+                return known
+    return EXTENSIONS.get(os.path.splitext(path)[1].lower(), "text")
+
+
+def write_text(path: str, heads: List[str] | None, batches: Batches, encoding: str) -> Iterator[None]:
+    """One line per row, fields separated by tabs, without the header, line breaks in values become spaces"""
+    with open(path, "w", encoding=encoding, buffering=1 << 20) as file:
+        for batch in batches:
+            if batch and len(batch[0]) == 1:
+                lines = [str(row[0]) for row in batch]
+            else:
+                lines = ["\t".join(map(str, row)) for row in batch]
+            lines.append("")
+            text = "\n".join(lines)
+            if len(text.splitlines()) != len(batch):
+                # a line break inside a value would split its row when read back, it is written as a space
+                text = "\n".join(" ".join(line.splitlines()) for line in lines)
+            file.write(text)
+            yield
+
+
+def write_csv(path: str, heads: List[str] | None, batches: Batches, encoding: str) -> Iterator[None]:
+    with open(path, "w", encoding=encoding, newline="", buffering=1 << 20) as file:
+        writer = csv.writer(file)
+        if heads:
+            writer.writerow(heads)
+        for batch in batches:
+            writer.writerows(batch)
+            yield
+
+
+def write_json(path: str, heads: List[str] | None, batches: Batches, encoding: str) -> Iterator[None]:
+    """An array of objects when there are headers, of strings for a single column, of arrays otherwise"""
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    with open(path, "w", encoding=encoding, buffering=1 << 20) as file:
+        file.write("[")
+        separator = "\n"
+        for batch in batches:
+            if not batch:
+                continue
+            if heads:
+                values = [encode(dict(zip(heads, row))) for row in batch]
+            elif len(batch[0]) == 1:
+                values = [encode(row[0]) for row in batch]
+            else:
+                values = [encode(list(row)) for row in batch]
+            file.write(separator + ",\n".join(values))
+            separator = ",\n"
+            yield
+        file.write("\n]\n")
+
+
+def write_excel(path: str, heads: List[str] | None, batches: Batches, encoding: str) -> Iterator[None]:
+    """A single sheet, written row by row by openpyxl in write-only mode"""
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ImportError("exporting to Excel needs openpyxl (pip install openpyxl)") from None
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    rows = 0
+    if heads:
+        sheet.append(heads)
+        rows += 1
+    for batch in batches:
+        rows += len(batch)
+        if rows > EXCEL_ROWS:
+            raise ValueError(f"an Excel sheet holds at most {EXCEL_ROWS} rows")
+        for row in batch:
+            sheet.append(row)
+        yield
+    workbook.save(path)
+
+
+WRITERS: Dict[str, Callable[[str, List[str] | None, Batches, str], Iterator[None]]] = {
+    "text": write_text,
+    "csv": write_csv,
+    "json": write_json,
+    "excel": write_excel,
+}
+"""The writer of every format, a generator writing the batches it is given and yielding after each of them"""
+
+
+class Exporter(BackgroundTask):
+    """
+    Writes a list or a table to a file on a worker thread, as CSV, JSON, Excel or plain text.
+
+    The data is copied when the exporter is created (see `snapshot`), so the list can change while it is written.
+    Rows are written in batches with buffered writes, the progress is reported after every batch,
+    and a cancelled export removes the file it was writing.
+
+    Args:
+    - source: The data, anything `snapshot` accepts or a Snapshot, or the path of a text or CSV file,
+      read while it is written (the first line of a CSV file is its header).
+    - path: The file to write.
+    - format: Optional. "csv", "json", "excel" or "text" (see `format_of`), by default the one of the path extension.
+    - encoding: Optional. The encoding of the written file, Excel files are always utf-8.
+    - batch_size: Optional. How many rows are written at once.
+    - parent: Optional. The parent object.
+
+    Example:
+        Exporter(list_widget, "users.csv", parent=window).track(progress_bar).start()
+    """
+
+    def __init__(self, source: Any, path: str, format: str | None = None, encoding: str = "utf-8",
+                 batch_size: int = 2000, parent: QObject | None = None) -> None:
+        super().__init__(self._write, lambda _: None, parent)
+        self.path = path
+        self.format = format_of(path, format)
+        self.encoding = encoding
+        self.batch_size = batch_size
+        self.source = source if isinstance(source, (str, Snapshot)) else snapshot(source)
+
+    def _write(self, task: BackgroundTask) -> Iterator[None]:
+        if isinstance(self.source, str):
+            heads, batches = self._read(task, self.source)
+        else:
+            heads, batches = self.source.heads, self._batches(task, self.source)
+        try:
+            yield from WRITERS[self.format](self.path, heads, batches, self.encoding)
+        finally:
+            if task.is_cancelled() and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _batches(self, task: BackgroundTask, data: Snapshot) -> Batches:
+        total = len(data)
+        for start in range(0, total, self.batch_size):
+            if task.is_cancelled():
+                return
+            stop = min(start + self.batch_size, total)
+            yield data.rows(start, stop)
+            task.report(stop, total)
+
+    def _read(self, task: BackgroundTask, source: str) -> Tuple[List[str] | None, Batches]:
+        columns = source.lower().endswith(".csv")
+        heads = None
+        if columns:
+            with open(source, encoding="utf-8", errors="replace", newline="") as file:
+                heads = next(csv.reader(file), None)
+
+        def batches() -> Batches:
+            # read_csv and read_text report the progress and stop once the task is cancelled
+            if columns:
+                skip = heads is not None
+                for rows in read_csv(task, source, self.batch_size):
+                    if skip:
+                        rows, skip = rows[1:], False
+                    yield rows
+                return
+            for text in read_text(task, source):
+                lines = text.splitlines()
+                for start in range(0, len(lines), self.batch_size):
+                    yield [(line,) for line in lines[start:start + self.batch_size]]
+        return heads, batches()
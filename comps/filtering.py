@@ -0,0 +1,652 @@
+import re
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterator, List, Pattern, Sequence, Tuple
+from PyQt6.QtCore import QAbstractProxyModel, QModelIndex, QObject, QTimer, pyqtSignal as Signal
+from .models import ListModel
+
+Matcher = str | Pattern[str]
+"""A lower case substring or a compiled regular expression ignoring case"""
+
+
+def matcher(text: str, regex: bool = False) -> Matcher | None:
+    """
+    Returns what a query looks for, None for an empty query.
+
+    Args:
+    - text: The query.
+    - regex: Optional. Reads the query as a regular expression, raises re.error when it is not a valid one.
+    """
+    if not text:
+        return None
+    if regex:
+        return re.compile(text, re.IGNORECASE | re.MULTILINE)
+    return text.lower()
+
+
+class TextIndex:
+    """
+    A substring index over a sequence of strings, kept in step with it through `inserted`, `removed` and `changed`.
+
+    The strings are folded to lower case and joined with newlines, one text per block of consecutive rows.
+    A query first looks for itself in every block, a single search in C each, and only splits the blocks it occurs
+    in to find the matching rows. Blocks hold a variable number of rows, so inserting or removing rows only touches
+    the blocks they fall in, which are joined again when a search next reads them.
+
+    Args:
+    - items: The indexed strings, read again from wherever they change.
+    """
+    block_size = 4096
+    """How many rows a block holds, blocks grow up to twice as many before they are split"""
+
+    def __init__(self, items: Sequence[str]) -> None:
+        self.items = items
+        self.blocks: List[str | None] = []
+        """The text of every block, None until a search needs it again after a change"""
+        self.counts: List[int] = []
+        self._size = 0
+        self._starts: List[int] | None = None
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def rebuild(self) -> None:
+        """
+        Indexes all the strings again.
+        """
+        self.counts = []
+        self.blocks = []
+        self._size = 0
+        self._starts = None
+        if len(self.items):
+            self._refold(0, -1, len(self.items))
+            for block in range(len(self.blocks)):
+                self._text(block)
+
+    def starts(self) -> List[int]:
+        """
+        Returns the first row of every block.
+        """
+        if self._starts is None:
+            self._starts = list(accumulate(self.counts[:-1], initial=0)) if self.counts else []
+        return self._starts
+
+    def inserted(self, first: int, count: int) -> None:
+        """
+        Indexes rows inserted in the strings.
+
+        Args:
+        - first: The row of the first inserted string.
+        - count: How many strings were inserted.
+        """
+        if not self.counts:
+            self.rebuild()
+            return
+        # rows inserted at the end go to the last block
+        block = max(0, bisect_right(self.starts(), first) - 1)
+        self._refold(block, block, self.counts[block] + count)
+
+    def removed(self, first: int, count: int) -> None:
+        """
+        Drops rows removed from the strings.
+
+        Args:
+        - first: The row of the first removed string.
+        - count: How many strings were removed.
+        """
+        starts = self.starts()
+        stop = first + count
+        block = last = max(0, bisect_right(starts, first) - 1)
+        left = 0
+        while last < len(self.counts) and starts[last] < stop:
+            end = starts[last] + self.counts[last]
+            left += self.counts[last] - (min(stop, end) - max(first, starts[last]))
+            last += 1
+        self._refold(block, last - 1, left)
+
+    def changed(self, first: int, last: int) -> None:
+        """
+        Indexes again rows whose strings were replaced.
+
+        Args:
+        - first: The first replaced row.
+        - last: The last replaced row.
+        """
+        starts = self.starts()
+        block = max(0, bisect_right(starts, first) - 1)
+        end = max(block, bisect_right(starts, last) - 1)
+        self._refold(block, end, sum(self.counts[block:end + 1]))
+
+    def moved(self, first: int, target: int) -> None:
+        """
+        Follows a string moved to another row, only the blocks it leaves and joins change.
+
+        Args:
+        - first: The row the string was at.
+        - target: The row it is at now.
+        """
+        starts = self.starts()
+        source = max(0, bisect_right(starts, first) - 1)
+        block = max(0, bisect_right(starts, target) - 1)
+        if block == source:
+            self.changed(min(first, target), max(first, target))
+            return
+        # the rows between the two blocks only slide by one, their blocks keep the same text
+        self.counts[source] -= 1
+        self.counts[block] += 1
+        self._starts = None
+        for refolded in sorted((source, block), reverse=True):
+            self._refold(refolded, refolded, self.counts[refolded])
+
+    def search(self, query: Matcher, first: int = 0, stop: int | None = None) -> Iterator[List[int]]:
+        """
+        Finds the rows matching a query, in order.
+
+        Args:
+        - query: What to look for (see `matcher`).
+        - first: Optional. The first row to look at.
+        - stop: Optional. The row to stop before, the end by default.
+
+        Yields:
+        - The matching rows of every block, possibly none, so a caller can stop between two blocks.
+        """
+        starts = self.starts()
+        stop = len(self) if stop is None else stop
+        plain = isinstance(query, str)
+        for block in range(max(0, bisect_right(starts, first) - 1), len(self.blocks)):
+            begin = starts[block]
+            if begin >= stop:
+                return
+            text = self._text(block)
+            if plain:
+                rows = [begin + n for n, line in enumerate(text.split("\n")) if query in line] if query in text else []
+            else:
+                rows = [begin + n for n, line in enumerate(text.split("\n")) if query.search(line)] \
+                    if query.search(text) else []  # type: ignore
+            if rows and (rows[0] < first or rows[-1] >= stop):
+                rows = [row for row in rows if first <= row < stop]
+            yield rows
+
+    def refine(self, query: Matcher, rows: Sequence[int]) -> Iterator[List[int]]:
+        """
+        Finds the rows matching a query among the ones a broader query found, which is faster while they are few.
+
+        Yields:
+        - The matching rows, a block of candidates at a time.
+        """
+        items = self.items
+        for start in range(0, len(rows), self.block_size):
+            chunk = rows[start:start + self.block_size]
+            if isinstance(query, str):
+                yield [row for row in chunk if query in items[row].lower()]
+            else:
+                yield [row for row in chunk if query.search(items[row].lower())]
+
+    def matches(self, query: Matcher, row: int) -> bool:
+        """
+        Tells whether a single row matches a query.
+        """
+        text = self.items[row].lower()
+        return query in text if isinstance(query, str) else query.search(text) is not None
+
+    def _refold(self, first: int, last: int, count: int) -> None:
+        # the blocks first to last now hold count rows, as one block or as many as it takes, to be joined again
+        if count > 2 * self.block_size:
+            counts = [min(self.block_size, count - offset) for offset in range(0, count, self.block_size)]
+        else:
+            counts = [count] if count else []
+        self._size += count - sum(self.counts[first:last + 1])
+        self.counts[first:last + 1] = counts
+        self.blocks[first:last + 1] = [None] * len(counts)
+        self._starts = None
+
+    def _text(self, block: int) -> str:
+        # the rows of a block folded to lower case and joined, a newline in a row would count as two rows
+        text = self.blocks[block]
+        if text is None:
+            begin, size = self.starts()[block], self.counts[block]
+            values = self.items[begin:begin + size]
+            text = "\n".join(values)
+            if text.count("\n") != size - 1:
+                text = "\n".join(value.replace("\n", " ") for value in values)
+            text = self.blocks[block] = text.lower()
+        return text
+
+
+class Matches:
+    """
+    The source rows matching a query, in order, kept in blocks that each hold their rows less an offset.
+
+    Rows inserted in or removed from the list move every match after them. Only the block they fall in is rewritten,
+    the blocks after it just change their offset, so an edit costs a block and a pass over the offsets rather than
+    a pass over every match.
+
+    Args:
+    - rows: Optional. The first matches, in order.
+    """
+    block_size = 512
+    """How many matches a block holds, blocks grow up to twice as many before they are split"""
+
+    def __init__(self, rows: Sequence[int] = ()) -> None:
+        self.blocks: List[array] = []
+        self.offsets: List[int] = []
+        """What every block adds to the rows it holds"""
+        self._size = 0
+        self._starts: List[int] | None = None
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        for block, offset in zip(self.blocks, self.offsets):
+            yield from (block if not offset else (row + offset for row in block))
+
+    def __getitem__(self, position: int) -> int:
+        if position < 0:
+            position += self._size
+        if not 0 <= position < self._size:
+            raise IndexError("match position out of range")
+        block, index = self._locate(position)
+        return self.blocks[block][index] + self.offsets[block]
+
+    def tolist(self) -> List[int]:
+        """
+        Returns the matching rows as a list.
+        """
+        return [row + offset for block, offset in zip(self.blocks, self.offsets) for row in block]
+
+    def starts(self) -> List[int]:
+        """
+        Returns the position of the first match of every block.
+        """
+        if self._starts is None:
+            self._starts = list(accumulate(map(len, self.blocks[:-1]), initial=0)) if self.blocks else []
+        return self._starts
+
+    def bisect_left(self, row: int) -> int:
+        """
+        Returns the position of the first match at or after a row.
+        """
+        block = bisect_left(range(len(self.blocks)), row, key=self._first) - 1
+        if block < 0:
+            return 0
+        return self.starts()[block] + bisect_left(self.blocks[block], row - self.offsets[block])
+
+    def bisect_right(self, row: int) -> int:
+        """
+        Returns the position of the first match after a row.
+        """
+        block = bisect_right(range(len(self.blocks)), row, key=self._first) - 1
+        if block < 0:
+            return 0
+        return self.starts()[block] + bisect_right(self.blocks[block], row - self.offsets[block])
+
+    def extend(self, rows: Sequence[int]) -> None:
+        """
+        Adds matches after the last one.
+
+        Args:
+        - rows: The added rows, in order and after every match.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        if self.blocks and len(self.blocks[-1]) < self.block_size:
+            room, offset = self.block_size - len(self.blocks[-1]), self.offsets[-1]
+            self.blocks[-1].extend(row - offset for row in rows[:room])
+            self._size += len(rows[:room])
+            rows = rows[room:]
+        for start in range(0, len(rows), self.block_size):
+            self.blocks.append(array("q", rows[start:start + self.block_size]))
+            self.offsets.append(0)
+        self._size += len(rows)
+        self._starts = None
+
+    def insert(self, position: int, rows: Sequence[int]) -> None:
+        """
+        Adds matches at a position.
+
+        Args:
+        - position: Where the first added match goes.
+        - rows: The added rows, in order and in place there.
+        """
+        if not self.blocks:
+            self.extend(rows)
+            return
+        block, index = self._locate(position)
+        offset = self.offsets[block]
+        self.blocks[block][index:index] = array("q", [row - offset for row in rows])
+        self._size += len(rows)
+        self._starts = None
+        if len(self.blocks[block]) > 2 * self.block_size:
+            held = self.blocks[block]
+            split = [held[start:start + self.block_size] for start in range(0, len(held), self.block_size)]
+            self.blocks[block:block + 1] = split
+            self.offsets[block:block + 1] = [offset] * len(split)
+
+    def delete(self, start: int, stop: int) -> None:
+        """
+        Removes the matches from a position up to another one.
+
+        Args:
+        - start: The position of the first removed match.
+        - stop: The position after the last removed match.
+        """
+        if stop <= start:
+            return
+        starts = self.starts()
+        first = block = bisect_right(starts, start) - 1
+        while block < len(self.blocks) and starts[block] < stop:
+            del self.blocks[block][max(0, start - starts[block]):stop - starts[block]]
+            block += 1
+        # emptied blocks are dropped
+        kept = [(rows, offset) for rows, offset in zip(self.blocks[first:block], self.offsets[first:block]) if rows]
+        self.blocks[first:block] = [rows for rows, _ in kept]
+        self.offsets[first:block] = [offset for _, offset in kept]
+        self._size -= stop - start
+        self._starts = None
+
+    def shift(self, start: int, offset: int, stop: int | None = None) -> None:
+        """
+        Moves the matches from a position on by a number of rows, after rows were inserted or removed before them.
+
+        Args:
+        - start: The position of the first moved match.
+        - offset: How many rows they move by, negative to move them up.
+        - stop: Optional. The position after the last moved match, the end by default.
+        """
+        stop = self._size if stop is None else stop
+        if stop <= start or not offset:
+            return
+        starts = self.starts()
+        first, last = bisect_right(starts, start) - 1, bisect_right(starts, stop - 1) - 1
+        # the blocks in between only change their offset, the ones the range starts and ends in may move some rows
+        self.offsets[first + 1:last] = [value + offset for value in self.offsets[first + 1:last]]
+        for block in sorted({first, last}):
+            rows = self.blocks[block]
+            low, high = max(0, start - starts[block]), min(len(rows), stop - starts[block])
+            if low == 0 and high == len(rows):
+                self.offsets[block] += offset
+            else:
+                rows[low:high] = array("q", [row + offset for row in rows[low:high]])
+
+    def _locate(self, position: int) -> Tuple[int, int]:
+        # the block a position falls in and its index there, the position after the last match goes to the last block
+        block = bisect_right(self.starts(), position) - 1
+        return block, position - self.starts()[block]
+
+    def _first(self, block: int) -> int:
+        # the first match of a block, no block is ever empty
+        return self.blocks[block][0] + self.offsets[block]
+
+
+class FilterModel(QAbstractProxyModel):
+    """
+    A proxy showing the rows of a ListModel which match a query, found through a TextIndex of the list.
+
+    The matches are shown as they are found, the search runs for at most `budget` milliseconds per frame so typing
+    stays responsive however long the list, and a query extending the previous one only looks at its matches when
+    they are few. Changes of the list are applied to the index and the matches as they happen.
+
+    Args:
+    - source: The list model to filter.
+    - parent: Optional. The parent object.
+    - budget: Optional. Milliseconds per frame the search may use.
+
+    Signals:
+    - filtered(int): The search ended, with the number of matching rows.
+    """
+    filtered = Signal(int)
+    narrowing = 0.125
+    """Searches the previous matches rather than the index when they are at most this share of the rows"""
+
+    def __init__(self, source: ListModel, parent: QObject | None = None, budget: int = 10) -> None:
+        super().__init__(parent)
+        self.budget = budget / 1000
+        self.query: Matcher | None = None
+        self.rows: Matches | None = None
+        """The matching source rows in order, None when there is no query and every row is shown"""
+        self._search: Iterator[List[int]] | None = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._next)
+        self.text_index = TextIndex(source.items)
+        self.setSourceModel(source)
+        source.rowsAboutToBeInserted.connect(self._inserting)
+        source.rowsInserted.connect(self._inserted)
+        source.rowsAboutToBeRemoved.connect(self._removing)
+        source.rowsRemoved.connect(self._removed)
+        source.rowsAboutToBeMoved.connect(self._moving)
+        source.rowsMoved.connect(self._moved)
+        source.dataChanged.connect(self._changed)
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self._reset)
+
+    def filter(self, text: str, regex: bool = False) -> None:
+        """
+        Shows the rows matching a query, or all of them for an empty one.
+
+        Args:
+        - text: The query, matched ignoring case anywhere in the rows.
+        - regex: Optional. Reads the query as a regular expression, raises re.error when it is not a valid one.
+        """
+        query = matcher(text, regex)
+        previous, rows = self.query, self.rows
+        self.query = query
+        narrow = (isinstance(query, str) and isinstance(previous, str) and previous in query
+                  and rows is not None and self._search is None and len(rows) <= len(self.text_index) * self.narrowing)
+        self._start(rows.tolist() if narrow else None)
+
+    def is_searching(self) -> bool:
+        """
+        Tells whether the matches are still being looked for.
+        """
+        return self._search is not None
+
+    def source_row(self, row: int) -> int:
+        """
+        Returns the row of the list shown at a row of the proxy.
+        """
+        return row if self.rows is None else self.rows[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.text_index) if self.rows is None else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 1
+
+    def index(self, row: int, column: int = 0, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or column != 0 or not 0 <= row < self.rowCount():
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, child: QModelIndex | None = None):  # type: ignore
+        # the QObject parent without arguments, no parent for the rows of a list
+        return QObject.parent(self) if child is None else QModelIndex()
+
+    def mapToSource(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self.source_row(index.row()), 0)
+
+    def mapFromSource(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        row = index.row()
+        if self.rows is not None:
+            position = self.rows.bisect_left(row)
+            if position == len(self.rows) or self.rows[position] != row:
+                return QModelIndex()
+            row = position
+        return self.createIndex(row, 0)
+
+    def _start(self, candidates: Sequence[int] | None = None) -> None:
+        self._timer.stop()
+        self.beginResetModel()
+        if self.query is None:
+            self.rows, self._search = None, None
+        else:
+            self.rows = Matches()
+            self._search = (self.text_index.refine(self.query, candidates) if candidates is not None
+                            else self.text_index.search(self.query))
+        self.endResetModel()
+        if self._search is None:
+            self.filtered.emit(self.rowCount())
+        else:
+            # the first results are shown before the next paint
+            self._next()
+
+    def _next(self) -> None:
+        assert self._search is not None and self.rows is not None
+        deadline = time.perf_counter() + self.budget
+        found: List[int] = []
+        done = True
+        for rows in self._search:
+            found += rows
+            if time.perf_counter() >= deadline:
+                done = False
+                break
+        if found:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(found) - 1)
+            self.rows.extend(found)
+            self.endInsertRows()
+        if done:
+            self._search = None
+            self._timer.stop()
+            self.filtered.emit(len(self.rows))
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def _inserting(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self.rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        self.text_index.inserted(first, last - first + 1)
+        if self.rows is None:
+            self.endInsertRows()
+            return
+        if self._search is not None:
+            self._start()
+            return
+        assert self.query is not None
+        position = self.rows.bisect_left(first)
+        self.rows.shift(position, last - first + 1)
+        if last - first < self.text_index.block_size:
+            # a few rows are matched one by one rather than joining their block again
+            found = [row for row in range(first, last + 1) if self.text_index.matches(self.query, row)]
+        else:
+            found = [row for rows in self.text_index.search(self.query, first, last + 1) for row in rows]
+        if found:
+            self.beginInsertRows(QModelIndex(), position, position + len(found) - 1)
+            self.rows.insert(position, found)
+            self.endInsertRows()
+            self.filtered.emit(len(self.rows))
+
+    def _removing(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self.rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            return
+        if self._search is not None:
+            return
+        start, stop = self.rows.bisect_left(first), self.rows.bisect_right(last)
+        if stop > start:
+            self.beginRemoveRows(QModelIndex(), start, stop - 1)
+            self.rows.delete(start, stop)
+            self.endRemoveRows()
+
+    def _removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        self.text_index.removed(first, last - first + 1)
+        if self.rows is None:
+            self.endRemoveRows()
+        elif self._search is not None:
+            self._start()
+        else:
+            self.rows.shift(self.rows.bisect_left(first), first - last - 1)
+            self.filtered.emit(len(self.rows))
+
+    def _moving(self, parent: QModelIndex, first: int, last: int, destination: QModelIndex, row: int) -> None:
+        if self.rows is None:
+            self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), row)
+
+    def _moved(self, parent: QModelIndex, first: int, last: int, destination: QModelIndex, row: int) -> None:
+        count = last - first + 1
+        target = row if row < first else row - count
+        if count == 1:
+            self.text_index.moved(first, target)
+        else:
+            self.text_index.changed(min(first, target), max(last, target + count - 1))
+        if self.rows is None:
+            self.endMoveRows()
+            return
+        if self._search is not None or count > 1:
+            self._start()
+            return
+        # the moved string keeps its text so it still matches or not, the matches it passes slide by one
+        rows = self.rows
+        position = rows.bisect_left(first)
+        shown = position < len(rows) and rows[position] == first
+        if first < target:
+            stop = rows.bisect_right(target)
+            moving = shown and stop != position + 1
+            if moving:
+                self.beginMoveRows(QModelIndex(), position, position, QModelIndex(), stop)
+            if shown:
+                rows.delete(position, position + 1)
+                rows.shift(position, -1, stop - 1)
+                rows.insert(stop - 1, [target])
+            else:
+                rows.shift(position, -1, stop)
+        else:
+            start = rows.bisect_left(target)
+            moving = shown and start != position
+            if moving:
+                self.beginMoveRows(QModelIndex(), position, position, QModelIndex(), start)
+            if shown:
+                rows.delete(position, position + 1)
+                rows.shift(start, 1, position)
+                rows.insert(start, [target])
+            else:
+                rows.shift(start, 1, position)
+        if moving:
+            self.endMoveRows()
+
+    def _changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: Sequence[int] = ()) -> None:
+        first, last = top_left.row(), bottom_right.row()
+        self.text_index.changed(first, last)
+        if self.rows is None:
+            self.dataChanged.emit(self.index(first), self.index(last), list(roles))
+            return
+        if self._search is not None or last - first >= self.text_index.block_size:
+            self._start()
+            return
+        assert self.query is not None
+        for row in range(first, last + 1):
+            position = self.rows.bisect_left(row)
+            shown = position < len(self.rows) and self.rows[position] == row
+            if self.text_index.matches(self.query, row):
+                if shown:
+                    self.dataChanged.emit(self.index(position), self.index(position), list(roles))
+                else:
+                    self.beginInsertRows(QModelIndex(), position, position)
+                    self.rows.insert(position, [row])
+                    self.endInsertRows()
+            elif shown:
+                self.beginRemoveRows(QModelIndex(), position, position)
+                self.rows.delete(position, position + 1)
+                self.endRemoveRows()
+        self.filtered.emit(len(self.rows))
+
+    def _reset(self) -> None:
+        self.text_index.rebuild()
+        self._search = None
+        self.rows = None if self.query is None else Matches()
+        self.endResetModel()
+        if self.query is not None:
+            self._start()
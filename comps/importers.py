@@ -0,0 +1,328 @@
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import struct
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Callable, Iterator, List, MutableSequence, NamedTuple, Sequence, Tuple
+from PyQt6.QtCore import QObject
+from . import workbooks
+from .exporters import format_of
+from .loaders import BackgroundTask, read_csv, read_text
+from .models import ColumnTableModel, ListModel, PackedStrings, pack
+
+MAGIC = b"COMPSCOL1\n"
+"""The first bytes of a cache file, to change along with its layout"""
+
+
+class Columns(NamedTuple):
+    """
+    A batch of rows given column by column, as an Importer hands them to its consumer.
+    Every column is an array('q'), an array('d') or a PackedStrings (see `models.pack`), all of the same length.
+    """
+    heads: List[str] | None
+    columns: List[MutableSequence]
+
+    @property
+    def rows(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+
+def to_columns(rows: Sequence[Sequence[Any]], width: int) -> List[MutableSequence]:
+    """
+    Turns rows into columns in compact storage, mixed columns are stored as strings and missing cells are empty.
+    """
+    columns = []
+    for n in range(width):
+        values = [row[n] if n < len(row) else None for row in rows]
+        column = pack(values)
+        if isinstance(column, list):
+            column = PackedStrings("" if value is None else str(value) for value in values)
+        columns.append(column)
+    return columns
+
+
+def json_rows(data: Any) -> Tuple[List[str] | None, List[Sequence[Any]]]:
+    """
+    Returns the headers and the rows of a parsed JSON document:
+    - an array of objects gives a column per key, an array of arrays a column per index, an array of values one column;
+    - an object gives a key column, and a column per key of its values if they are objects, a value column otherwise.
+    Nested values are kept as JSON text.
+    """
+    def cell(value: Any) -> Any:
+        return value if value is None or type(value) in (str, int, float) else json.dumps(value, ensure_ascii=False)
+
+    def keys(objects: List[dict]) -> List[str]:
+        return list(dict.fromkeys(key for item in objects for key in item))
+
+    if isinstance(data, dict):
+        values = list(data.values())
+        if values and all(isinstance(value, dict) for value in values):
+            heads = keys(values)
+            return ["key", *heads], [(key, *(cell(value.get(head)) for head in heads)) for key, value in data.items()]
+        return ["key", "value"], [(key, cell(value)) for key, value in data.items()]
+    if not isinstance(data, list):
+        return None, [(cell(data),)]
+    if data and all(isinstance(item, dict) for item in data):
+        heads = keys(data)
+        return heads, [tuple(cell(item.get(head)) for head in heads) for item in data]
+    if data and all(isinstance(item, list) for item in data):
+        return None, [tuple(map(cell, item)) for item in data]
+    return None, [(cell(item),) for item in data]
+
+
+def write_chunk(file: BinaryIO, chunk: Columns) -> None:
+    """
+    Appends a batch to a cache file: the length of a JSON header, the header, then the raw blocks of every column.
+    """
+    layout, blocks = [], []
+    for column in chunk.columns:
+        if isinstance(column, array):
+            layout.append([column.typecode, len(column) * column.itemsize])
+            blocks.append(column.tobytes())
+        else:
+            ends, buffer = column.buffers()  # type: ignore
+            layout.append(["s", len(ends) * ends.itemsize, len(buffer)])
+            blocks += [ends.tobytes(), buffer]
+    header = json.dumps({"heads": chunk.heads, "columns": layout}).encode()
+    file.write(struct.pack("<I", len(header)) + header)
+    for block in blocks:
+        file.write(block)
+
+
+def read_chunks(file: BinaryIO) -> Iterator[Columns]:
+    """
+    Yields the batches of a cache file written with `write_chunk`, up to its end record.
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a cache file")
+    while True:
+        raw = file.read(4)
+        if len(raw) < 4:
+            raise ValueError("truncated cache file")
+        header = json.loads(file.read(struct.unpack("<I", raw)[0]))
+        if header.get("end"):
+            return
+        columns: List[MutableSequence] = []
+        for kind, *sizes in header["columns"]:
+            if kind == "s":
+                ends = array("q")
+                ends.frombytes(file.read(sizes[0]))
+                columns.append(PackedStrings.from_buffers(ends, file.read(sizes[1])))
+            else:
+                values = array(kind)
+                values.frombytes(file.read(sizes[0]))
+                columns.append(values)
+        yield Columns(header["heads"], columns)
+
+
+def consumer_for(target: Any) -> Callable[[Columns], None]:
+    """
+    Returns the function filling a VirtualListWidget, a DataTable or their models with what an Importer reads.
+    A list gets the first column, a function is returned as it is.
+    """
+    model = getattr(target, "list_model", getattr(target, "table_model", target))
+    if isinstance(model, ColumnTableModel):
+        return lambda chunk: model.append_columns(chunk.columns, chunk.heads)
+    if isinstance(model, ListModel):
+        def append(chunk: Columns) -> None:
+            if not chunk.columns:
+                return
+            column = chunk.columns[0]
+            if isinstance(column, PackedStrings):
+                model.append(column if isinstance(model.items, PackedStrings) else column[:])
+            else:
+                model.append([str(value) for value in column])
+        return append
+    if callable(target):
+        return target
+    raise TypeError(f"cannot import into {type(target).__name__}")
+
+
+class Importer(BackgroundTask):
+    """
+    Reads a list or a table from a text, CSV, JSON or Excel file on a worker thread and hands it to a consumer
+    a batch of rows at a time, given column by column (see Columns), so views fill up while the file is read.
+
+    Text and CSV files are read in chunks cut at line boundaries and JSON documents are parsed at once then handed
+    out in batches. Excel workbooks are parsed in a worker process (see comps.workbooks) a batch of rows per call,
+    since parsing them is CPU-bound and a thread would hold the GIL away from the GUI.
+    What was read is also written to a binary columnar cache file keyed by the path, the size and the modification
+    time of the file: reopening an unchanged file reads the cache instead, which costs little more than its bytes.
+    The cache files are kept under `cache_size` bytes, the least recently read ones are removed first.
+
+    Args:
+    - path: The file to read.
+    - target: A function called with every Columns, or a VirtualListWidget, a DataTable or their models to fill.
+    - format: Optional. "text", "csv", "json" or "excel", by default the one of the path extension (see `format_of`).
+    - cache: Optional. Reads from and writes to the cache.
+    - batch_size: Optional. How many rows a batch holds at most, a batch of text or CSV holds a chunk of lines.
+    - parent: Optional. The parent object.
+
+    Example:
+        Importer("users.xlsx", data_table, parent=window).track(progress_bar).start()
+    """
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "comps", "imports")
+    cache_size = 1 << 30
+    """Bytes the cache files may take together, None for no limit"""
+    _pool: ProcessPoolExecutor | None = None
+
+    def __init__(self, path: str, target: Any, format: str | None = None, cache: bool = True,
+                 batch_size: int = 10000, parent: QObject | None = None) -> None:
+        super().__init__(self._read, consumer_for(target), parent)
+        self.path = path
+        self.format = format_of(path, format)
+        self.cache = cache
+        self.batch_size = batch_size
+        self.from_cache = False
+
+    def cache_path(self) -> str:
+        """
+        Returns the cache file of the current version of the file.
+        """
+        path = os.path.abspath(self.path)
+        stat = os.stat(path)
+        name = hashlib.sha1(path.encode()).hexdigest()[:16]
+        version = hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}:{self.format}".encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{version}.cols")
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Removes every cache file.
+        """
+        for path in glob.glob(os.path.join(Importer.cache_dir, "*.cols")):
+            os.remove(path)
+
+    @staticmethod
+    def trim_cache(size: int | None) -> None:
+        """
+        Removes the least recently read cache files until the others take at most a number of bytes.
+
+        Args:
+        - size: The bytes the cache files may take, None to keep them all.
+        """
+        if size is None:
+            return
+        files = []
+        for path in glob.glob(os.path.join(Importer.cache_dir, "*.cols")):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(length for _, length, _ in files)
+        for _, length, path in sorted(files):
+            if total <= size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= length
+
+    @staticmethod
+    def pool() -> ProcessPoolExecutor:
+        """
+        Returns the process reading Excel workbooks, started on first use and kept for the next ones.
+        """
+        if Importer._pool is None:
+            Importer._pool = ProcessPoolExecutor(1, multiprocessing.get_context("spawn"))
+        return Importer._pool
+
+    def _read(self, task: BackgroundTask) -> Iterator[Columns]:
+        if not self.cache:
+            yield from self._parse(task)
+            return
+        cache = self.cache_path()
+        if os.path.exists(cache):
+            self.from_cache = True
+            # the modification time of a cache file tells when it was last read
+            os.utime(cache)
+            try:
+                with open(cache, "rb") as file:
+                    for chunk in read_chunks(file):
+                        task.report(file.tell(), os.fstat(file.fileno()).st_size)
+                        yield chunk
+            except ValueError:
+                os.remove(cache)
+                raise
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(".tmp", os.path.basename(cache), self.cache_dir)
+        complete = False
+        try:
+            with open(descriptor, "wb") as file:
+                file.write(MAGIC)
+                for chunk in self._parse(task):
+                    write_chunk(file, chunk)
+                    yield chunk
+                if task.is_cancelled():
+                    return
+                header = json.dumps({"end": True}).encode()
+                file.write(struct.pack("<I", len(header)) + header)
+            # the caches of the previous versions of the file are of no use anymore
+            for stale in glob.glob(cache.rsplit("-", 1)[0] + "-*.cols"):
+                os.remove(stale)
+            os.replace(temporary, cache)
+            complete = True
+            Importer.trim_cache(self.cache_size)
+        finally:
+            if not complete and os.path.exists(temporary):
+                os.remove(temporary)
+
+    def _parse(self, task: BackgroundTask) -> Iterator[Columns]:
+        if self.format == "excel":
+            yield from self._excel(task)
+        elif self.format == "json":
+            yield from self._json(task)
+        elif self.format == "csv":
+            heads: List[str] | None = None
+            rows: List[List[str]] = []
+            sent = False
+            # small batches of rows, the reader holds the GIL for as long as it parses one
+            for batch in read_csv(task, self.path):
+                if heads is None:
+                    heads, batch = batch[0], batch[1:]
+                rows += batch
+                if len(rows) >= self.batch_size:
+                    yield Columns(heads, to_columns(rows, len(heads)))
+                    rows, sent = [], True
+            # a file with only a header still shows it
+            if heads is not None and (rows or not sent):
+                yield Columns(heads, to_columns(rows, len(heads)))
+        else:
+            for text in read_text(task, self.path):
+                yield Columns(None, [PackedStrings(line.strip() for line in text.splitlines())])
+
+    def _json(self, task: BackgroundTask) -> Iterator[Columns]:
+        with open(self.path, encoding="utf-8") as file:
+            heads, rows = json_rows(json.load(file))
+        width = len(heads) if heads else max(map(len, rows), default=0)
+        for start in range(0, len(rows), self.batch_size):
+            if task.is_cancelled():
+                return
+            yield Columns(heads, to_columns(rows[start:start + self.batch_size], width))
+            task.report(start + self.batch_size, len(rows))
+
+    def _excel(self, task: BackgroundTask) -> Iterator[Columns]:
+        pool = Importer.pool()
+        token, total = pool.submit(workbooks.open_sheet, self.path).result()
+        try:
+            heads: List[str] | None = None
+            done = 0
+            while not task.is_cancelled():
+                rows = pool.submit(workbooks.read_rows, token, self.batch_size).result()
+                if not rows:
+                    break
+                done += len(rows)
+                if heads is None:
+                    heads = [str(value) if value is not None else str(n + 1) for n, value in enumerate(rows[0])]
+                    rows = rows[1:]
+                task.report(done, total)
+                yield Columns(heads, to_columns(rows, len(heads)))
+        finally:
+            pool.submit(workbooks.close_sheet, token)
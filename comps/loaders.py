@@ -0,0 +1,295 @@
+import csv
+import io
+import os
+import queue
+import threading
+import time
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Self
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal as Signal
+from PyQt6.QtWidgets import QProgressBar
+
+_DONE = object()
+
+
+class BackgroundTask(QObject):
+    """
+    Runs a producer on a worker thread and hands what it yields to a consumer on the GUI thread.
+
+    The batches go through a bounded queue, so a fast producer waits for the GUI instead of piling up memory,
+    and the GUI only drains it once per frame for at most `budget` milliseconds, which keeps the event loop responsive.
+
+    Args:
+    - producer: A generator function receiving the task, it yields batches and may call `report` to publish progress.
+    - consumer: Called on the GUI thread with every batch.
+    - parent: Optional. The parent object.
+    - budget: Optional. Milliseconds per frame the consumer may use.
+    - interval: Optional. Milliseconds between two frames.
+    - backlog: Optional. How many batches may wait in the queue.
+
+    Signals:
+    - progressed(int): The progress in percent.
+    - finished(): Every batch was consumed.
+    - cancelled(): The task was cancelled.
+    - failed(str): The producer or the consumer raised an exception.
+    - ended(): Emitted after any of finished, cancelled and failed.
+    """
+    progressed = Signal(int)
+    finished = Signal()
+    cancelled = Signal()
+    failed = Signal(str)
+    ended = Signal()
+
+    def __init__(self, producer: Callable[["BackgroundTask"], Iterator[Any]], consumer: Callable[[Any], None],
+                 parent: QObject | None = None, budget: int = 4, interval: int = 16, backlog: int = 8) -> None:
+        super().__init__(parent)
+        self.producer = producer
+        self.consumer = consumer
+        self.budget = budget / 1000
+        self._queue: "queue.Queue[Any]" = queue.Queue(backlog)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._progress = 0
+        self._reported = -1
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._drain)
+        # a task deleted with its parent without being cancelled stops its worker all the same
+        stop = self._stop
+        self.destroyed.connect(lambda *_: stop.set())
+
+    def start(self) -> Self:
+        """
+        Starts the producer on a worker thread and the consumer on the GUI thread.
+
+        Returns:
+        - itself: Returns itself after starting.
+        """
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+        self._timer.start()
+        return self
+
+    def cancel(self) -> Self:
+        """
+        Stops the task, the batches not consumed yet are dropped.
+
+        Returns:
+        - itself: Returns itself after cancelling.
+        """
+        if self._stop.is_set():
+            return self
+        self._stop.set()
+        self._timer.stop()
+        self._discard()
+        self.cancelled.emit()
+        self.ended.emit()
+        return self
+
+    def track(self, bar: QProgressBar) -> Self:
+        """
+        Reports the progress of the task to a progress bar.
+
+        Args:
+        - bar: The progress bar to update.
+
+        Returns:
+        - itself: Returns itself after connecting the bar.
+        """
+        bar.setRange(0, 100)
+        bar.setValue(self._progress)
+        self.progressed.connect(bar.setValue)
+        return self
+
+    def is_running(self) -> bool:
+        """
+        Tells whether the task was started and has not ended yet.
+        """
+        return self._timer.isActive()
+
+    def is_cancelled(self) -> bool:
+        """
+        Tells whether the task was cancelled, producers should stop as soon as it is.
+        """
+        return self._stop.is_set()
+
+    def report(self, done: int, total: int) -> None:
+        """
+        Publishes the progress of the producer, it is safe to call from the worker thread.
+
+        Args:
+        - done: The amount of work done.
+        - total: The total amount of work.
+        """
+        self._progress = min(100, done * 100 // total) if total > 0 else 100
+
+    def _produce(self) -> None:
+        batches = None
+        try:
+            batches = self.producer(self)
+            for batch in batches:
+                if not self._put(batch):
+                    return
+            self._put(_DONE)
+        except Exception as e:
+            self._put(e)
+        finally:
+            # a cancelled generator runs its cleanup now rather than whenever it gets collected
+            close = getattr(batches, "close", None)
+            if close is not None:
+                close()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _discard(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _drain(self) -> None:
+        deadline = time.perf_counter() + self.budget
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is _DONE:
+                    self._end(None)
+                    return
+                if isinstance(batch, Exception):
+                    raise batch
+                self.consumer(batch)
+        except Exception as e:
+            self._end(e)
+            return
+        if self._progress != self._reported:
+            self._reported = self._progress
+            self.progressed.emit(self._progress)
+
+    def _end(self, error: Exception | None) -> None:
+        self._stop.set()
+        self._timer.stop()
+        self._discard()
+        if error is None:
+            self.progressed.emit(100)
+            self.finished.emit()
+        else:
+            self.failed.emit(str(error))
+        self.ended.emit()
+
+
+def read_text(task: BackgroundTask, path: str, chunk_size: int = 1 << 20, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Reads a file in chunks cut at line boundaries and reports the progress to the task.
+
+    Args:
+    - task: The task to report to, reading stops when it gets cancelled.
+    - path: The file to read.
+    - chunk_size: Optional. How many bytes to read at once.
+    - encoding: Optional. The encoding of the file, undecodable bytes are replaced.
+
+    Yields:
+    - The decoded text of each chunk, every chunk but the last one ends with a newline.
+    """
+    total = os.path.getsize(path)
+    rest = b""
+    with open(path, "rb") as file:
+        while not task.is_cancelled():
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            chunk = rest + chunk
+            cut = chunk.rfind(b"\n") + 1
+            rest = chunk[cut:]
+            if cut:
+                yield chunk[:cut].decode(encoding, errors="replace")
+            task.report(file.tell() - len(rest), total)
+    if rest and not task.is_cancelled():
+        yield rest.decode(encoding, errors="replace")
+
+
+def read_csv(task: BackgroundTask, path: str, batch_size: int = 2000,
+             encoding: str = "utf-8") -> Iterator[List[List[str]]]:
+    """
+    Reads the rows of a CSV file in batches and reports the progress to the task. Quoted fields may hold newlines.
+
+    Args:
+    - task: The task to report to, reading stops when it gets cancelled.
+    - path: The file to read.
+    - batch_size: Optional. How many rows a batch holds at most, the parser keeps the GIL for a whole batch.
+    - encoding: Optional. The encoding of the file, undecodable bytes are replaced.
+
+    Yields:
+    - The rows of each batch, the header being the first row of the first one.
+    """
+    total = os.path.getsize(path)
+    with open(path, "rb") as binary, io.TextIOWrapper(binary, encoding, errors="replace", newline="") as file:
+        reader = csv.reader(file)
+        while not task.is_cancelled():
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                break
+            yield rows
+            # the position of the bytes decoded so far, which run ahead of the parser by a buffer at most
+            task.report(binary.tell(), total)
+
+
+class LineLoader(BackgroundTask):
+    """
+    Streams the lines of a file, stripped, to a consumer in batches.
+
+    Args:
+    - path: The file to read.
+    - consumer: Called on the GUI thread with each list of lines, for example `ListWidget.add` through a lambda.
+    - batch_size: Optional. How many lines a batch holds at most.
+    - encoding: Optional. The encoding of the file.
+    - parent: Optional. The parent object.
+    """
+
+    def __init__(self, path: str, consumer: Callable[[List[str]], None], batch_size: int = 5000,
+                 encoding: str = "utf-8", parent: QObject | None = None) -> None:
+        super().__init__(self._lines, consumer, parent)
+        self.path = path
+        self.batch_size = batch_size
+        self.encoding = encoding
+
+    def _lines(self, task: BackgroundTask) -> Iterator[List[str]]:
+        for text in read_text(task, self.path, encoding=self.encoding):
+            lines = text.splitlines()
+            for i in range(0, len(lines), self.batch_size):
+                yield [line.strip() for line in lines[i:i + self.batch_size]]
+
+
+class TextLoader(BackgroundTask):
+    """
+    Streams the content of a file to a consumer in pieces of text.
+
+    Args:
+    - path: The file to read.
+    - consumer: Called on the GUI thread with each piece of text, for example `QTextCursor.insertText`.
+    - piece_size: Optional. How many characters a piece holds at most.
+    - encoding: Optional. The encoding of the file.
+    - parent: Optional. The parent object.
+    """
+
+    def __init__(self, path: str, consumer: Callable[[str], None], piece_size: int = 1 << 16,
+                 encoding: str = "utf-8", parent: QObject | None = None) -> None:
+        super().__init__(self._pieces, consumer, parent)
+        self.path = path
+        self.piece_size = piece_size
+        self.encoding = encoding
+
+    def _pieces(self, task: BackgroundTask) -> Iterator[str]:
+        for text in read_text(task, self.path, encoding=self.encoding):
+            for i in range(0, len(text), self.piece_size):
+                yield text[i:i + self.piece_size]
@@ -0,0 +1,827 @@
+import re
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, compress, count
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableSequence, Pattern, Sequence, Tuple, overload
+from PyQt6.QtCore import Qt, QAbstractTableModel, QAbstractListModel, QModelIndex
+
+
+class PackedStrings(MutableSequence[str]):
+    """
+    A mutable sequence of strings stored as utf-8 inside a single buffer, with one start and one end offset per entry.
+
+    Compared to a list of str (one Python object per entry) it costs the encoded length plus 16 bytes per entry.
+    Replaced and removed entries leave unused bytes behind, `compact` reclaims them.
+
+    Args:
+    - items: Optional. Initial strings of the sequence.
+    """
+
+    def __init__(self, items: Iterable[str] = ()) -> None:
+        self._buffer = bytearray()
+        self._starts = array("q")
+        self._ends = array("q")
+        self._garbage = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> str | List[str]:
+        if isinstance(index, slice):
+            view = memoryview(self._buffer)
+            return [str(view[s:e], "utf-8") for s, e in zip(self._starts[index], self._ends[index])]
+        return self._buffer[self._starts[index]:self._ends[index]].decode()
+
+    def __setitem__(self, index: int, value: str) -> None:  # type: ignore
+        self._garbage += self._ends[index] - self._starts[index]
+        self._starts[index], self._ends[index] = self._push(value)
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            self._garbage += sum(self._ends[index]) - sum(self._starts[index])
+        else:
+            self._garbage += self._ends[index] - self._starts[index]
+        del self._starts[index]
+        del self._ends[index]
+
+    def insert(self, index: int, value: str) -> None:
+        start, end = self._push(value)
+        self._starts.insert(index, start)
+        self._ends.insert(index, end)
+
+    def extend(self, values: Iterable[str]) -> None:
+        """
+        Appends many strings at once, encoding and computing their offsets in bulk.
+
+        Args:
+        - values: The strings to append, another PackedStrings is appended as a copy of its buffer.
+        """
+        if isinstance(values, PackedStrings):
+            shift = len(self._buffer)
+            self._buffer += values._buffer
+            self._starts.extend(start + shift for start in values._starts)
+            self._ends.extend(end + shift for end in values._ends)
+            self._garbage += values._garbage
+            return
+        encoded = [value.encode() for value in values]
+        if not encoded:
+            return
+        offsets = array("q", accumulate(map(len, encoded), initial=len(self._buffer)))
+        self._buffer += b"".join(encoded)
+        self._starts.extend(offsets[:-1])
+        self._ends.extend(offsets[1:])
+
+    def clear(self) -> None:
+        self._buffer = bytearray()
+        self._starts = array("q")
+        self._ends = array("q")
+        self._garbage = 0
+
+    def compact(self) -> None:
+        """
+        Rewrites the buffer without the bytes left behind by replaced or removed entries.
+        """
+        if self._garbage:
+            items = self[:]
+            self.clear()
+            self.extend(items)
+
+    def __copy__(self) -> "PackedStrings":
+        """
+        Copies the buffer and the offsets as they are, which costs a few memory copies whatever the number of entries.
+        """
+        copy = PackedStrings()
+        copy._buffer = bytearray(self._buffer)
+        copy._starts = array("q", self._starts)
+        copy._ends = array("q", self._ends)
+        copy._garbage = self._garbage
+        return copy
+
+    def buffers(self) -> Tuple[array, bytes]:
+        """
+        Returns the end offset of every entry and the buffer they point in, without the unused bytes,
+        from which `from_buffers` builds the same sequence.
+        """
+        # inserted entries are pushed at the end of the buffer, out of order
+        if self._garbage or self._starts[:1] not in (array("q"), array("q", [0])) or self._starts[1:] != self._ends[:-1]:
+            items = self[:]
+            self.clear()
+            self.extend(items)
+        return self._ends, bytes(self._buffer)
+
+    @staticmethod
+    def from_buffers(ends: array, buffer: bytes) -> "PackedStrings":
+        """
+        Returns the sequence of strings returned as buffers by `buffers`.
+
+        Args:
+        - ends: The end offset of every entry, each entry starting where the previous one ends.
+        - buffer: The utf-8 encoded entries.
+        """
+        strings = PackedStrings()
+        strings._buffer = bytearray(buffer)
+        strings._ends = array("q", ends)
+        strings._starts = array("q", [0])
+        strings._starts.extend(ends[:-1])
+        del strings._starts[len(ends):]
+        return strings
+
+    def nbytes(self) -> int:
+        """
+        Returns the memory used by the buffer and the offsets.
+        """
+        return len(self._buffer) + (len(self._starts) + len(self._ends)) * self._starts.itemsize
+
+    def _push(self, value: str) -> tuple[int, int]:
+        start = len(self._buffer)
+        self._buffer += value.encode()
+        return start, len(self._buffer)
+
+
+def pack(values: Sequence[Any]) -> MutableSequence:
+    """
+    Stores the values of a column in the most compact container able to hold them.
+
+    Args:
+    - values: The values of the column.
+
+    Returns:
+    - array('q') for integers, array('d') for floats, PackedStrings for strings and a list for anything else.
+    """
+    if values and all(type(value) is int for value in values):
+        try:
+            return array("q", values)
+        except OverflowError:
+            return list(values)
+    if values and all(type(value) is float for value in values):
+        return array("d", values)
+    if all(isinstance(value, str) for value in values):
+        return PackedStrings(values)
+    return list(values)
+
+
+def accepts(storage: MutableSequence, values: Sequence[Any]) -> bool:
+    """
+    Tells whether a storage returned by `pack` can hold the given values without being widened to a list.
+    """
+    if isinstance(values, (PackedStrings, array)) and type(values) is type(storage):
+        return not isinstance(values, array) or values.typecode == storage.typecode  # type: ignore
+    if isinstance(storage, PackedStrings):
+        return all(isinstance(value, str) for value in values)
+    if isinstance(storage, array):
+        kind = int if storage.typecode == "q" else float
+        return all(type(value) is kind for value in values)
+    return True
+
+
+class ColumnTableModel(QAbstractTableModel):
+    """
+    A table model keeping its data column by column in compact storage (see `pack`).
+
+    Display data is only produced for the cells the view asks for, so the cost of a row is the cost of its values.
+    Columns can have different lengths, missing cells are empty.
+
+    Args:
+    - parent: Optional. The parent object.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.heads: List[str | None] = []
+        self.columns: List[MutableSequence] = []
+        self._rows = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole and role != Qt.ItemDataRole.EditRole:
+            return None
+        column = self.columns[index.column()]
+        if index.row() >= len(column):
+            return None
+        return column[index.row()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal and self.heads[section] is not None:
+            return self.heads[section]
+        return str(section + 1)
+
+    def add_column(self, head: str | None, values: Sequence[Any]) -> int:
+        """
+        Appends a column, growing the row count if the column is longer than the others.
+
+        Args:
+        - head: The header text of the column.
+        - values: The values of the column.
+
+        Returns:
+        - The index of the new column.
+        """
+        index = len(self.columns)
+        self.beginInsertColumns(QModelIndex(), index, index)
+        self.heads.append(head)
+        self.columns.append(pack(values))
+        self.endInsertColumns()
+        self._grow(len(values))
+        return index
+
+    def add_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Appends rows at the bottom of the table, values beyond the last column are ignored.
+
+        Args:
+        - rows: The rows to append, each one a sequence of values in column order.
+        """
+        rows = list(rows)
+        if not rows or not self.columns:
+            return
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows + len(rows) - 1)
+        for column in range(len(self.columns)):
+            self._pad(column, self._rows)
+            values = [row[column] if column < len(row) else None for row in rows]
+            if not accepts(self.columns[column], values):
+                self.columns[column] = list(self.columns[column])
+            self.columns[column].extend(values)
+        self._rows += len(rows)
+        self.endInsertRows()
+
+    def append_columns(self, columns: Sequence[MutableSequence], heads: Sequence[str | None] | None = None) -> None:
+        """
+        Appends rows given column by column, as the Importer reads them. The columns of an empty model are taken
+        as they are, so they should be storages returned by `pack`, values beyond the last column are ignored.
+
+        Args:
+        - columns: The values of every column, all of the same length.
+        - heads: Optional. The header of every column, used when the model has no column yet.
+        """
+        if not columns:
+            return
+        if not self.columns:
+            self.beginInsertColumns(QModelIndex(), 0, len(columns) - 1)
+            self.heads = list(heads) if heads else [None] * len(columns)
+            self.columns = list(columns)
+            self.endInsertColumns()
+            self._grow(len(columns[0]))
+            return
+        count = len(columns[0])
+        if not count:
+            return
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows + count - 1)
+        for column in range(len(self.columns)):
+            self._pad(column, self._rows)
+            values = columns[column] if column < len(columns) else [None] * count
+            if not accepts(self.columns[column], values):
+                self.columns[column] = list(self.columns[column])
+            self.columns[column].extend(values)
+        self._rows += count
+        self.endInsertRows()
+
+    def set_cell_data(self, row: int, column: int, value: Any) -> None:
+        """
+        Sets the value of a single cell.
+
+        Args:
+        - row: The row of the cell.
+        - column: The column of the cell.
+        - value: The new value.
+        """
+        self._pad(column, row + 1)
+        if not accepts(self.columns[column], (value,)):
+            self.columns[column] = list(self.columns[column])
+        self.columns[column][row] = value
+        self._grow(row + 1)
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+    def _pad(self, column: int, length: int) -> None:
+        values = self.columns[column]
+        missing = length - len(values)
+        if missing <= 0:
+            return
+        if isinstance(values, PackedStrings):
+            values.extend([""] * missing)
+        else:
+            self.columns[column] = list(values) + [None] * missing
+
+    def _grow(self, rows: int) -> None:
+        if rows > self._rows:
+            self.beginInsertRows(QModelIndex(), self._rows, rows - 1)
+            self._rows = rows
+            self.endInsertRows()
+
+
+Edit = Tuple[str, int, Any]
+"""A step of a `diff`: ("remove", row, count), ("insert", row, values) or ("move", row, target)"""
+
+
+class _Counts:
+    """Counts per slot with prefix sums in logarithmic time (a Fenwick tree)"""
+
+    def __init__(self, size: int) -> None:
+        self.tree = [0] * (size + 1)
+
+    def add(self, slot: int, delta: int) -> None:
+        slot += 1
+        while slot < len(self.tree):
+            self.tree[slot] += delta
+            slot += slot & -slot
+
+    def before(self, slot: int) -> int:
+        total = 0
+        while slot > 0:
+            total += self.tree[slot]
+            slot -= slot & -slot
+        return total
+
+
+def _run(old: Sequence[str], start: int, new: Sequence[str], position: int) -> int:
+    # how many entries are the same from a row of each list, compared a slice at a time, twice as long every time
+    limit = min(len(old) - start, len(new) - position)
+    length, step = 0, 16
+    while length < limit:
+        size = min(step, limit - length)
+        before = old[start + length:start + length + size]
+        after = new[position + length:position + length + size]
+        if before != after:
+            return length + next(compress(count(), map(operator.ne, before, after)))
+        length += size
+        step *= 2
+    return length
+
+
+def _resync(old: Sequence[str], start: int, new: Sequence[str], position: int) -> Tuple[int, int]:
+    # the nearest equal entries after a difference, as offsets from the rows of each list, (-1, -1) when there is none
+    width = 8
+    while True:
+        seen: Dict[str, int] = {}
+        for offset, value in enumerate(new[position:position + width]):
+            seen.setdefault(value, offset)
+        best: Tuple[int, int] | None = None
+        for offset, value in enumerate(old[start:start + width]):
+            if best is not None and offset >= best[0] + best[1]:
+                break
+            found = seen.get(value)
+            if found is not None and (best is None or offset + found < best[0] + best[1]):
+                best = (offset, found)
+        if best is not None:
+            return best
+        if start + width >= len(old) and position + width >= len(new):
+            return -1, -1
+        width *= 4
+
+
+def diff(old: Sequence[str], new: Sequence[str]) -> List[Edit]:
+    """
+    Computes the edits turning a list of strings into another, each entry being its own key.
+
+    Both lists are walked together: runs of equal entries are skipped comparing slices, and after a difference
+    the nearest equal entries are looked for in a window growing until they are found. The entries of these runs
+    stay where they are, the others are paired by value: the ones of the old list without a pair are removed,
+    the ones of the new list without a pair are inserted and the pairs are moved.
+    Apart from the slice comparisons, which run in C, the cost is proportional to the number of edits.
+
+    Args:
+    - old: The current strings.
+    - new: The wanted strings.
+
+    Returns:
+    - The edits to apply in order, the rows of each one are the ones after the previous edits:
+      ("remove", row, count), ("insert", row, values) or ("move", row, target) where target is the row the entry
+      ends up at.
+    """
+    # slices of both are compared, so both have to give lists
+    if not isinstance(old, (list, PackedStrings)):
+        old = list(old)
+    if not isinstance(new, (list, PackedStrings)):
+        new = list(new)
+    if len(old) == len(new) and old == new:
+        return []
+    runs: List[Tuple[int, int, int]] = []
+    lost: List[int] = []
+    found: List[int] = []
+    start = position = 0
+    while start < len(old) and position < len(new):
+        length = _run(old, start, new, position)
+        if length:
+            runs.append((start, position, length))
+            start += length
+            position += length
+            continue
+        skip_old, skip_new = _resync(old, start, new, position)
+        if skip_old < 0:
+            break
+        lost += range(start, start + skip_old)
+        found += range(position, position + skip_new)
+        start += skip_old
+        position += skip_new
+    lost += range(start, len(old))
+    found += range(position, len(new))
+    # the entries left out of the runs are paired by value, in order
+    pairs: Dict[str, List[int]] = {}
+    for row in reversed(lost):
+        pairs.setdefault(old[row], []).append(row)
+    sources: Dict[int, int] = {}
+    for row in found:
+        rows = pairs.get(new[row])
+        if rows:
+            sources[row] = rows.pop()
+    moved = set(sources.values())
+    edits: List[Edit] = []
+    # the removals, from the last one so the rows of the others do not move
+    removed = [row for row in lost if row not in moved]
+    for row in reversed(removed):
+        if edits and edits[-1][1] == row + 1:
+            edits[-1] = ("remove", row, edits[-1][2] + 1)
+        else:
+            edits.append(("remove", row, 1))
+    if not found:
+        return edits
+    gone = _Counts(len(old))
+    for row in removed:
+        gone.add(row, 1)
+    # the other entries, in the new order: gone counts the entries of the old list removed or placed already by
+    # their old row, the others are still waiting where they were, placed counts the entries placed by their new row
+    placed = _Counts(len(new))
+    old_rows = [run[0] for run in runs]
+    new_rows = [run[1] for run in runs]
+    staying = list(accumulate((run[2] for run in runs), initial=0))
+    for row in found:
+        # right after the entries of the new list before it, and the entries waiting before them
+        run = bisect_right(new_rows, row) - 1
+        target = row
+        if run >= 0:
+            anchor = runs[run][0] + runs[run][2] - 1
+            target += anchor - gone.before(anchor) - (staying[run + 1] - 1)
+        source_row = sources.get(row)
+        if source_row is None:
+            last_edit = edits[-1] if edits else None
+            if last_edit is not None and last_edit[0] == "insert" and last_edit[1] + len(last_edit[2]) == target:
+                last_edit[2].append(new[row])
+            else:
+                edits.append(("insert", target, [new[row]]))
+        else:
+            # the moved entry is right before the first run after it in the old list
+            following = bisect_right(old_rows, source_row)
+            following_row = new_rows[following] if following < len(runs) else len(new)
+            source = source_row - gone.before(source_row) + placed.before(following_row)
+            if target > source:
+                target -= 1
+            if target != source:
+                edits.append(("move", source, target))
+            gone.add(source_row, 1)
+        placed.add(row, 1)
+    return edits
+
+
+class ListModel(QAbstractListModel):
+    """
+    A list model over a plain sequence of strings, no per-item object is created on the Qt side.
+
+    In unique mode the model also keeps a dictionary from every string to its row, which makes `contains` and
+    `index_of` constant time and lets every insertion skip the strings already present. Appended rows and rows
+    shifted by an insertion or a removal are only numbered when `index_of` first needs one of them.
+
+    Args:
+    - items: Optional. Initial strings of the model.
+    - storage: Optional. The mutable sequence holding the strings, a list by default (a PackedStrings trades
+      access speed for memory).
+    - parent: Optional. The parent object.
+    - unique: Optional. Keeps a single copy of every string.
+    """
+    removal_ranges = 16
+    """Removals spread over more ranges of rows than this are applied with a single reset"""
+    sync_edits = 2000
+    """`sync` applies the strings with a single reset when they take more edits than this"""
+
+    def __init__(self, items: Iterable[str] = (), storage: MutableSequence[str] | None = None, parent=None,
+                 unique: bool = False) -> None:
+        super().__init__(parent)
+        self.items: MutableSequence[str] = storage if storage is not None else []
+        self._rows: Dict[str, int] | None = None
+        self._stale = 0
+        if unique:
+            self.set_unique(True)
+        self.append(list(items))
+
+    @property
+    def unique(self) -> bool:
+        return self._rows is not None
+
+    def set_unique(self, unique: bool) -> None:
+        """
+        Turns the unique mode on or off, turning it on removes the strings present more than once.
+
+        Args:
+        - unique: Whether to keep a single copy of every string.
+        """
+        if not unique:
+            self._rows = None
+            return
+        if self._rows is not None:
+            return
+        rows = dict.fromkeys(self.items)
+        if len(rows) != len(self.items):
+            self.beginResetModel()
+            self.items.clear()
+            self.items.extend(rows)
+            self.endResetModel()
+        self._index(rows)
+
+    def contains(self, value: str) -> bool:
+        """
+        Tells whether the model holds a string, in constant time in unique mode.
+        """
+        if self._rows is not None:
+            return value in self._rows
+        return value in self.items
+
+    def index_of(self, value: str) -> int:
+        """
+        Returns the row of a string, -1 when the model does not hold it. Constant time in unique mode,
+        but for the first lookup of a row shifted by an insertion or a removal.
+        """
+        if self._rows is None:
+            try:
+                return self.items.index(value)
+            except ValueError:
+                return -1
+        row = self._rows.get(value)
+        if row is None:
+            return -1
+        if row < 0 or row >= self._stale:
+            for row in range(self._stale, len(self.items)):
+                self._rows[self.items[row]] = row
+            self._stale = len(self.items)
+            row = self._rows[value]
+        return row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            return self.items[index.row()]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return super().flags(index)
+        return super().flags(index) | Qt.ItemFlag.ItemIsDragEnabled
+
+    def append(self, values: Sequence[str]) -> None:
+        """
+        Appends strings at the end of the model with a single insertion, in unique mode the ones it already holds
+        are skipped.
+
+        Args:
+        - values: The strings to append.
+        """
+        if self._rows is not None:
+            rows = self._rows
+            values = [value for value in dict.fromkeys(values) if value not in rows]
+        if not values:
+            return
+        count = len(self.items)
+        self.beginInsertRows(QModelIndex(), count, count + len(values) - 1)
+        self.items.extend(values)
+        if self._rows is not None:
+            # numbered on the first lookup
+            self._rows.update(dict.fromkeys(values, -1))
+            self._stale = min(self._stale, count)
+        self.endInsertRows()
+
+    def insert(self, row: int, value: str) -> None:
+        """
+        Inserts a string before the given row, in unique mode nothing happens when the model already holds it.
+
+        Args:
+        - row: The row to insert at.
+        - value: The string to insert.
+        """
+        if self._rows is not None and value in self._rows:
+            return
+        row = max(0, min(row, len(self.items)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items.insert(row, value)
+        if self._rows is not None:
+            self._rows[value] = row
+            self._stale = min(self._stale, row)
+        self.endInsertRows()
+
+    def replace(self, row: int, value: str) -> None:
+        """
+        Replaces the string at the given row, in unique mode nothing happens when another row holds the new string.
+
+        Args:
+        - row: The row to replace.
+        - value: The new string.
+        """
+        if self._rows is not None:
+            if value in self._rows:
+                return
+            del self._rows[self.items[row]]
+            self._rows[value] = row
+        self.items[row] = value
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def take(self, row: int) -> str | None:
+        """
+        Removes the string at the given row.
+
+        Args:
+        - row: The row to remove.
+
+        Returns:
+        - The removed string, None if the row does not exist.
+        """
+        if not 0 <= row < len(self.items):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        value = self.items[row]
+        del self.items[row]
+        if self._rows is not None:
+            del self._rows[value]
+            self._stale = min(self._stale, row)
+        self.endRemoveRows()
+        return value
+
+    def remove_many(self, rows: Iterable[int]) -> int:
+        """
+        Removes the strings at the given rows at once: a removal per range of consecutive rows while they are few,
+        a single reset otherwise.
+
+        Args:
+        - rows: The rows to remove, in any order, the ones out of range are ignored.
+
+        Returns:
+        - The number of removed strings.
+        """
+        count = len(self.items)
+        rows = sorted({row for row in rows if 0 <= row < count})
+        if not rows:
+            return 0
+        ranges = [[rows[0], rows[0]]]
+        for row in rows[1:]:
+            if row == ranges[-1][1] + 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        if self._rows is not None:
+            for row in rows:
+                del self._rows[self.items[row]]
+            self._stale = min(self._stale, rows[0])
+        if len(ranges) <= self.removal_ranges:
+            # from the last range, so the rows of the next ones do not move
+            for first, last in reversed(ranges):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self.items[first:last + 1]
+                self.endRemoveRows()
+            return len(rows)
+        keep = bytearray(b"\x01") * count
+        for row in rows:
+            keep[row] = 0
+        self.beginResetModel()
+        values = list(compress(self.items, keep))
+        self.items.clear()
+        self.items.extend(values)
+        self.endResetModel()
+        return len(rows)
+
+    def remove_where(self, predicate: Callable[[str], Any] | str | Pattern[str]) -> int:
+        """
+        Removes at once the strings matching a predicate or a regular expression (see `remove_many`).
+
+        Args:
+        - predicate: A function called with every string, or a regular expression searched in every string.
+
+        Returns:
+        - The number of removed strings.
+        """
+        if isinstance(predicate, str):
+            predicate = re.compile(predicate)
+        if isinstance(predicate, re.Pattern):
+            predicate = predicate.search
+        return self.remove_many(compress(range(len(self.items)), map(predicate, self.items)))
+
+    def replace_all(self, mapping: Mapping[str, str]) -> int:
+        """
+        Replaces every string which is a key of a mapping by its value, with a single change notification.
+        In unique mode a string is kept when another row already holds its replacement.
+
+        Args:
+        - mapping: The replacement of every string to replace.
+
+        Returns:
+        - The number of replaced strings.
+        """
+        if not mapping:
+            return 0
+        if self._rows is not None and len(mapping) < len(self.items):
+            rows = sorted(row for row in map(self.index_of, mapping) if row >= 0)
+        else:
+            rows = list(compress(range(len(self.items)), map(mapping.__contains__, self.items)))
+        replaced = []
+        for row in rows:
+            value = self.items[row]
+            new = mapping[value]
+            if new == value:
+                continue
+            if self._rows is not None:
+                if new in self._rows:
+                    continue
+                del self._rows[value]
+                self._rows[new] = row
+            self.items[row] = new
+            replaced.append(row)
+        if replaced:
+            self.dataChanged.emit(self.index(replaced[0]), self.index(replaced[-1]))
+        return len(replaced)
+
+    def sync(self, values: Sequence[str]) -> int:
+        """
+        Makes the model hold the given strings with as few removals, insertions and moves as it takes (see `diff`),
+        so the selection, the current row and the scroll position follow the strings that stay. Falls back to
+        `reset` past `sync_edits` edits. In unique mode only the first copy of every string is kept.
+
+        Args:
+        - values: The new strings.
+
+        Returns:
+        - The number of edits applied, -1 when the model was reset.
+        """
+        values = list(dict.fromkeys(values)) if self._rows is not None else list(values)
+        edits = diff(self.items, values)
+        if len(edits) > self.sync_edits:
+            self.reset(values)
+            return -1
+        items = self.items
+        rows = self._rows
+        for kind, row, argument in edits:
+            if rows is not None:
+                # the rows before the first edit keep their numbers
+                self._stale = min(self._stale, min(row, argument) if kind == "move" else row)
+            if kind == "remove":
+                self.beginRemoveRows(QModelIndex(), row, row + argument - 1)
+                if rows is not None:
+                    for value in items[row:row + argument]:
+                        del rows[value]
+                del items[row:row + argument]
+                self.endRemoveRows()
+            elif kind == "insert":
+                self.beginInsertRows(QModelIndex(), row, row + len(argument) - 1)
+                if isinstance(items, list):
+                    items[row:row] = argument
+                else:
+                    for offset, value in enumerate(argument):
+                        items.insert(row + offset, value)
+                if rows is not None:
+                    rows.update(dict.fromkeys(argument, -1))
+                self.endInsertRows()
+            else:
+                # Qt takes the row the moved one goes before, counted before the move
+                self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), argument + 1 if argument > row else argument)
+                items.insert(argument, items.pop(row))
+                self.endMoveRows()
+        return len(edits)
+
+    def reset(self, values: Iterable[str]) -> None:
+        """
+        Replaces all the strings of the model with a single reset, in unique mode only the first copy of every
+        string is kept.
+
+        Args:
+        - values: The new strings.
+        """
+        self.beginResetModel()
+        self.items.clear()
+        if self._rows is not None:
+            rows = dict.fromkeys(values)
+            self.items.extend(rows)
+            self._index(rows)
+        else:
+            self.items.extend(values)
+        self.endResetModel()
+
+    def _index(self, rows: Dict[str, Any]) -> None:
+        # numbers the keys of a dictionary holding every string once, in the order of the rows
+        for row, value in enumerate(rows):
+            rows[value] = row
+        self._rows = rows  # type: ignore
+        self._stale = len(self.items)
@@ -0,0 +1,194 @@
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+_PACKAGE = os.path.dirname(os.path.abspath(__file__))
+
+
+class _Stat:
+    __slots__ = ("calls", "total", "sites")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0
+        self.sites: Counter = Counter()
+
+
+class Profiler:
+    """
+    Opt-in instrumentation of the fluent API: the methods of the mixins of `comps.Elements` and `BaseContainer.add`.
+
+    `enable` replaces those methods with timed wrappers and `disable` puts the originals back,
+    so nothing is measured, and nothing costs, unless profiling is on.
+    Every call records its duration and its calling site, the first frame outside of comps.
+
+    Example:
+        with Profiler.profile():
+            window = MainWindow()
+        print(Profiler.summary())
+        Profiler.export_trace("build.json")  # open with chrome://tracing or https://ui.perfetto.dev
+    """
+    max_events = 1_000_000
+    _stats: Dict[str, _Stat] = {}
+    _events: List[Tuple[str, int, int, int, str]] = []
+    _patched: List[Tuple[type, str, Callable]] = []
+    _active: Counter = Counter()
+    _files: Dict[Any, str] = {}
+    _origin = time.perf_counter_ns()
+
+    @staticmethod
+    def enable() -> None:
+        """
+        Starts recording the calls.
+        """
+        if Profiler._patched:
+            return
+        for owner, name, function in Profiler.targets():
+            Profiler._patched.append((owner, name, function))
+            setattr(owner, name, Profiler._wrap(f"{owner.__name__}.{name}", function))
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Stops recording the calls and restores the original methods, what was recorded is kept.
+        """
+        for owner, name, function in reversed(Profiler._patched):
+            setattr(owner, name, function)
+        Profiler._patched = []
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(Profiler._patched)
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Forgets what was recorded.
+        """
+        Profiler._stats = {}
+        Profiler._events = []
+
+    @staticmethod
+    @contextmanager
+    def profile() -> Iterator[None]:
+        """
+        Records the calls made inside the with block.
+        """
+        Profiler.enable()
+        try:
+            yield
+        finally:
+            Profiler.disable()
+
+    @staticmethod
+    def targets() -> List[Tuple[type, str, Callable]]:
+        """
+        Returns the methods to instrument: the plain functions of every class of `comps.Elements` which is not
+        a Qt class itself but is a base of a widget, and `BaseContainer.add`.
+        """
+        from PyQt6.QtCore import QObject
+        from PyQt6.QtWidgets import QWidget
+        from . import Elements
+        classes = [cls for cls in vars(Elements).values()
+                   if inspect.isclass(cls) and cls.__module__ == Elements.__name__]
+        widgets = [cls for cls in classes if issubclass(cls, QWidget)]
+        mixins = [cls for cls in classes if not issubclass(cls, QObject)
+                  and any(cls in widget.__mro__ for widget in widgets)]
+        targets = [(mixin, name, value) for mixin in mixins for name, value in vars(mixin).items()
+                   if inspect.isfunction(value) and not name.startswith("__")]
+        return targets + [(Elements.BaseContainer, "add", vars(Elements.BaseContainer)["add"])]
+
+    @staticmethod
+    def stats() -> Dict[str, Dict[str, Any]]:
+        """
+        Returns, for every method called, its call count, cumulative time in seconds and calling sites by count.
+        The cumulative time of a method includes the methods it calls, and counts recursive calls once.
+        """
+        return {name: {"calls": stat.calls, "time": stat.total / 1e9, "sites": dict(stat.sites.most_common())}
+                for name, stat in Profiler._stats.items()}
+
+    @staticmethod
+    def summary(limit: int = 30) -> str:
+        """
+        Returns a table of the methods taking the most cumulative time.
+
+        Args:
+        - limit: Optional. How many methods to list.
+        """
+        stats = sorted(Profiler._stats.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+        rows = [("method", "calls", "cumulative", "per call", "top calling site")]
+        for name, stat in stats:
+            site, count = stat.sites.most_common(1)[0]
+            rows.append((name, str(stat.calls), f"{stat.total / 1e6:.2f} ms", f"{stat.total / stat.calls / 1e3:.1f} us",
+                         f"{site} ({count}x)"))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in rows)
+
+    @staticmethod
+    def export_trace(path: str) -> None:
+        """
+        Writes the recorded calls as Chrome trace events, nested calls show up as nested slices.
+
+        Args:
+        - path: The JSON file to write.
+        """
+        pid = os.getpid()
+        events = [{"name": name, "cat": "comps", "ph": "X", "ts": start / 1e3, "dur": duration / 1e3,
+                   "pid": pid, "tid": thread, "args": {"site": site}}
+                  for name, start, duration, thread, site in Profiler._events]
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    @staticmethod
+    def _wrap(name: str, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            Profiler._active[name] += 1
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                end = time.perf_counter_ns()
+                Profiler._active[name] -= 1
+                Profiler._record(name, start, end, sys._getframe(1), Profiler._active[name] == 0)
+        return timed
+
+    @staticmethod
+    def _record(name: str, start: int, end: int, frame: Any, outermost: bool) -> None:
+        files = Profiler._files
+        while frame is not None:
+            code = frame.f_code
+            file = files.get(code)  # type: ignore
+            if file is None:
+                file = files[code] = Profiler._file(code.co_filename)
+            if file:
+                break
+            frame = frame.f_back
+        site = f"{file}:{frame.f_lineno}" if frame is not None else "?"
+        stat = Profiler._stats.get(name)
+        if stat is None:
+            stat = Profiler._stats[name] = _Stat()
+        stat.calls += 1
+        if outermost:
+            # recursive calls are already part of the outermost one
+            stat.total += end - start
+        stat.sites[site] += 1
+        if len(Profiler._events) < Profiler.max_events:
+            Profiler._events.append((name, start - Profiler._origin, end - start, threading.get_ident(), site))
+
+    @staticmethod
+    def _file(path: str) -> str:
+        # the path a calling site shows, empty inside comps, absolute when there is no relative one (another drive)
+        if path.startswith(_PACKAGE):
+            return ""
+        try:
+            return os.path.relpath(path)
+        except ValueError:
+            return path
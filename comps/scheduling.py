@@ -0,0 +1,156 @@
+import heapq
+import math
+import time
+from itertools import count
+from typing import Any, Callable, List, Tuple
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+
+def _now() -> float:
+    return time.monotonic() * 1000
+
+
+class Coalesced:
+    """
+    A callback called at most once per window of time, however many events arrive.
+
+    When debouncing, the callback is called once the events stopped coming for `ms` milliseconds.
+    When throttling, it is called at most once every `ms` milliseconds while the events keep coming.
+    With `leading` the first event of a burst is delivered right away. The last event of a burst is always delivered,
+    with the arguments it came with, unless it was that leading one.
+
+    Args:
+    - callback: The function to call.
+    - ms: The window, in milliseconds.
+    - throttle: Optional. Throttles instead of debouncing.
+    - leading: Optional. Delivers the first event of a burst right away, by default only when throttling.
+    - owner: Optional. The object the events come from, nothing is delivered once it is destroyed.
+    """
+    __slots__ = ("callback", "ms", "throttle", "leading", "owner", "pending", "deadline", "active", "token")
+
+    def __init__(self, callback: Callable, ms: int, throttle: bool = False, leading: bool | None = None,
+                 owner: QObject | None = None) -> None:
+        self.callback = callback
+        self.ms = ms
+        self.throttle = throttle
+        self.leading = throttle if leading is None else leading
+        self.owner = owner
+        self.pending: Tuple | None = None
+        # when debouncing, when the pending event is due, when throttling, the end of the current window
+        self.deadline = 0.0
+        self.active = False
+        self.token = 0
+
+    def __call__(self, *args: Any) -> None:
+        if self.active:
+            self.pending = args
+            if not self.throttle:
+                # the scheduler finds out the deadline moved when it reaches the previous one
+                self.deadline = _now() + self.ms
+            return
+        self.active = True
+        self.token += 1
+        self.deadline = _now() + self.ms
+        Scheduler.schedule(self)
+        if self.leading:
+            self.pending = None
+            self.callback(*args)
+        else:
+            self.pending = args
+
+    def cancel(self) -> None:
+        """
+        Drops the pending event.
+        """
+        self.active = False
+        self.pending = None
+        self.token += 1
+
+    def flush(self) -> None:
+        """
+        Delivers the pending event now, if any.
+        """
+        args, self.pending = self.pending, None
+        if args is None or self.owner is not None and sip.isdeleted(self.owner):
+            self.cancel()
+            return
+        if self.throttle:
+            # the delivered event opens a new window
+            self.deadline = _now() + self.ms
+            Scheduler.schedule(self)
+        else:
+            self.cancel()
+        self.callback(*args)
+
+
+class Scheduler:
+    """
+    The single timer behind every Coalesced callback: it sleeps until the earliest deadline and delivers what is due.
+    """
+    _queue: List[Tuple[float, int, int, Coalesced]] = []
+    _order = count()
+    _timer: QTimer | None = None
+
+    @staticmethod
+    def schedule(coalesced: Coalesced) -> None:
+        """
+        Delivers the pending event of a Coalesced callback once its deadline is reached.
+        """
+        entry = (coalesced.deadline, next(Scheduler._order), coalesced.token, coalesced)
+        heapq.heappush(Scheduler._queue, entry)
+        if Scheduler._queue[0] is entry:
+            Scheduler._arm()
+
+    @staticmethod
+    def pending() -> int:
+        """
+        Returns the number of callbacks waiting for their deadline.
+        """
+        return sum(1 for _, _, token, coalesced in Scheduler._queue if coalesced.active and token == coalesced.token)
+
+    @staticmethod
+    def _arm() -> None:
+        if Scheduler._timer is None:
+            Scheduler._timer = QTimer()
+            Scheduler._timer.setSingleShot(True)
+            Scheduler._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            Scheduler._timer.timeout.connect(Scheduler._fire)
+        if Scheduler._queue:
+            Scheduler._timer.start(max(0, math.ceil(Scheduler._queue[0][0] - _now())))
+        else:
+            Scheduler._timer.stop()
+
+    @staticmethod
+    def _fire() -> None:
+        now = _now()
+        try:
+            while Scheduler._queue and Scheduler._queue[0][0] <= now:
+                deadline, _, token, coalesced = heapq.heappop(Scheduler._queue)
+                if not coalesced.active or token != coalesced.token:
+                    continue
+                if coalesced.deadline > deadline:
+                    heapq.heappush(Scheduler._queue, (coalesced.deadline, next(Scheduler._order), token, coalesced))
+                    continue
+                coalesced.flush()
+        finally:
+            Scheduler._arm()
+
+
+def coalesce(callback: Callable, debounce: int = 0, throttle: int = 0, leading: bool | None = None,
+             owner: QObject | None = None) -> Callable:
+    """
+    Returns the callback debounced or throttled, or the callback itself when neither is asked.
+
+    Args:
+    - callback: The function to call.
+    - debounce: Optional. Calls the callback once the events stopped coming for this many milliseconds.
+    - throttle: Optional. Calls the callback at most once every this many milliseconds.
+    - leading: Optional. Delivers the first event of a burst right away, by default only when throttling.
+    - owner: Optional. The object the events come from, nothing is delivered once it is destroyed.
+    """
+    if debounce and throttle:
+        raise ValueError("debounce and throttle are exclusive")
+    if not debounce and not throttle:
+        return callback
+    return Coalesced(callback, debounce or throttle, bool(throttle), leading, owner)
@@ -0,0 +1,233 @@
+import csv
+import mmap
+import os
+from typing import Any, Dict, Iterator, List, Tuple
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("previewing files needs numpy (pip install numpy)") from None
+from PyQt6.QtCore import Qt, QObject, QAbstractTableModel, QModelIndex, pyqtSignal as Signal
+from .loaders import BackgroundTask
+
+
+class MappedLines(QObject):
+    """
+    A read-only sequence over the lines of a text or CSV file, read through a memory map.
+
+    The file is never loaded: `open` indexes it on a worker thread, one vectorized pass per chunk,
+    and only the start of every `stride`-th line is kept, so the index costs 8 bytes every `stride` lines.
+    Reading a line seeks to the closest mark and finds the remaining line breaks in the mapped memory,
+    which means scrolling only touches the pages of the visible lines.
+
+    A CSV field may hold line breaks between quotes. With `records`, a line is a CSV record: only the line breaks
+    after an even number of quotes end one, so `row` splits whole records.
+
+    Args:
+    - path: The file to read.
+    - encoding: Optional. The encoding of the file, undecodable bytes are replaced.
+    - delimiter: Optional. The delimiter used by `row`.
+    - stride: Optional. How many lines there are between two marks of the index.
+    - records: Optional. Reads CSV records rather than physical lines.
+    - parent: Optional. The parent object.
+
+    Signals:
+    - grown(int, int): The number of indexed lines went from the first to the second value.
+    - indexed(): The whole file is indexed.
+    """
+    grown = Signal(int, int)
+    indexed = Signal()
+    chunk_size = 1 << 26
+
+    def __init__(self, path: str, encoding: str = "utf-8", delimiter: str = ",", stride: int = 32,
+                 records: bool = False, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.path = path
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.stride = stride
+        self.records = records
+        self.size = os.path.getsize(path)
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._marks = np.zeros(1, dtype=np.int64)
+        self._count = 0
+        self._last: Tuple[int, int] = (0, 0)
+        self.task: BackgroundTask | None = None
+
+    def open(self) -> BackgroundTask:
+        """
+        Starts indexing the file on a worker thread, lines become available as their chunk is indexed.
+
+        Returns:
+        - The indexing task, to track or cancel it.
+        """
+        self.task = BackgroundTask(self._index, self._extend, self)
+        self.task.finished.connect(self.indexed.emit)
+        return self.task.start()
+
+    def close(self) -> None:
+        """
+        Stops indexing and releases the file.
+        """
+        if self.task is not None:
+            self.task.cancel()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+            self._map = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.span(index)
+        return self._map[start:end].decode(self.encoding, errors="replace").rstrip("\r")  # type: ignore
+
+    def row(self, index: int) -> List[str]:
+        """
+        Returns the line at the given index split into fields.
+        """
+        return next(csv.reader(self[index].splitlines(keepends=True), delimiter=self.delimiter), [])
+
+    def span(self, index: int) -> Tuple[int, int]:
+        """
+        Returns the byte offsets of the line at the given index, the line break excluded.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        line, start = self._last
+        if not line <= index < line + self.stride:
+            line = index - index % self.stride
+            start = int(self._marks[line // self.stride])
+        while line < index:
+            start = self._end(start) + 1
+            line += 1
+        self._last = (line, start)
+        end = self._end(start)
+        return start, end if end >= 0 else self.size
+
+    def _end(self, start: int) -> int:
+        # the line break ending the line from start, -1 for the last line, breaks between quotes go on with a record
+        end = self._map.find(b"\n", start)  # type: ignore
+        if self.records:
+            quotes = 0
+            while end >= 0:
+                quotes += self._map[start:end].count(b'"')  # type: ignore
+                if quotes % 2 == 0:
+                    break
+                start, end = end, self._map.find(b"\n", end + 1)  # type: ignore
+        return end
+
+    def _index(self, task: BackgroundTask) -> Iterator[Tuple[np.ndarray, int]]:
+        if self._map is None:
+            return
+        view = np.frombuffer(self._map, dtype=np.uint8)
+        newlines = quotes = 0
+        ended = False
+        try:
+            for offset in range(0, self.size, self.chunk_size):
+                if task.is_cancelled():
+                    return
+                chunk = view[offset:offset + self.chunk_size]
+                breaks = np.flatnonzero(chunk == 10)
+                if self.records:
+                    # the quotes counted mod 256 keep their parity, a break after an odd count is inside a field
+                    counts = np.cumsum(chunk == 34, dtype=np.uint8)
+                    inside = (counts[breaks] + quotes) % 2 == 1
+                    quotes = (quotes + int(counts[-1])) % 2
+                    breaks = breaks[~inside]
+                starts = breaks + (offset + 1)
+                ended = len(starts) > 0 and starts[-1] == self.size
+                numbers = np.arange(newlines + 1, newlines + 1 + len(starts))
+                newlines += len(starts)
+                yield starts[numbers % self.stride == 0], newlines
+                if hasattr(mmap, "MADV_DONTNEED"):
+                    # madvise takes a page aligned start
+                    start = offset - offset % mmap.PAGESIZE
+                    end = min(offset + self.chunk_size, self.size)
+                    self._map.madvise(mmap.MADV_DONTNEED, start, end - start)
+                task.report(offset + self.chunk_size, self.size)
+            if not ended:
+                yield np.empty(0, dtype=np.int64), newlines + 1
+        finally:
+            del view
+
+    def _extend(self, batch: Tuple[np.ndarray, int]) -> None:
+        marks, count = batch
+        self._marks = np.concatenate((self._marks, marks))
+        old, self._count = self._count, count
+        if count > old:
+            self.grown.emit(old, count)
+
+
+class SourceTableModel(QAbstractTableModel):
+    """
+    A read-only table model over a MappedLines source, growing while the source gets indexed.
+
+    Args:
+    - source: The source to show.
+    - columns: Optional. Splits the lines into fields and uses the first line as header,
+      otherwise every line is shown as a single cell.
+    - parent: Optional. The parent object.
+    """
+    cache_size = 512
+
+    def __init__(self, source: MappedLines, columns: bool = False, parent=None) -> None:
+        super().__init__(parent)
+        self.source = source
+        self.columns = columns
+        self.heads: List[str] = []
+        self._offset = 1 if columns else 0
+        self._rows = 0
+        self._cache: Dict[int, List[str]] = {}
+        source.grown.connect(self._grow)
+        self._grow(0, len(source))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.heads) if self.columns else 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if not self.columns:
+            return self.source[index.row()]
+        fields = self.row(index.row())
+        return fields[index.column()] if index.column() < len(fields) else None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.heads[section] if self.columns else None
+        return str(section + 1)
+
+    def row(self, row: int) -> List[str]:
+        """
+        Returns the fields of a row, the last rows read are cached since a view asks for each cell separately.
+        """
+        fields = self._cache.get(row)
+        if fields is None:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            fields = self._cache[row] = self.source.row(row + self._offset)
+        return fields
+
+    def _grow(self, old: int, new: int) -> None:
+        if self.columns and not self.heads and new > 0:
+            heads = self.source.row(0)
+            self.beginInsertColumns(QModelIndex(), 0, max(0, len(heads) - 1))
+            self.heads = heads
+            self.endInsertColumns()
+        rows = max(0, new - self._offset)
+        if rows > self._rows:
+            self.beginInsertRows(QModelIndex(), self._rows, rows - 1)
+            self._rows = rows
+            self.endInsertRows()
@@ -1,5 +1,60 @@
 from enum import Enum
-from typing import Any, Dict, Self
+from typing import Any, Dict, Self, Tuple
+
+
+class Properties(dict):
+    """
+    The properties of a style, remembering the text they compile to until they are mutated.
+    """
+    __slots__ = ("text",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.text: str | None = None
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.text = None
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.text = None
+
+    def __ior__(self, other) -> Self:
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.text = None
+
+    def pop(self, *args) -> Any:
+        self.text = None
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        self.text = None
+        return super().popitem()
+
+    def setdefault(self, key, default=None) -> Any:
+        self.text = None
+        return super().setdefault(key, default)
+
+    def clear(self) -> None:
+        super().clear()
+        self.text = None
+
+
+class FrozenProperties(Properties):
+    """
+    Properties which can not be mutated, see `Style.freeze`.
+    """
+    __slots__ = ()
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError("a frozen style can not be modified, merge it into a new Style instead")
+
+    __setitem__ = __delitem__ = __ior__ = update = pop = popitem = setdefault = clear = _frozen  # type: ignore
 
 
 class PropertyOwner:
@@ -112,18 +167,63 @@ class BackgroundChangeable(PropertyOwner):
 
 class QSS:
     def __init__(self) -> None:
-        self._styles = {}
+        self._styles: Dict[str, str] = {}
+        self._text: str | None = None
 
     def set(self, identifier: str, style: "Style") -> Self:
         self._styles[identifier] = style.to_str()
+        self._text = None
         return self
 
     def remove(self, identifier: str) -> Self:
         self._styles.pop(identifier)
+        self._text = None
         return self
 
     def to_str(self) -> str:
-        return "; ".join([f"{identifier} {{ {style} }}" for identifier, style in self._styles.items()])
+        """Compiles the rules, the text is kept until the rules change"""
+        if self._text is None:
+            self._text = "; ".join([f"{identifier} {{ {style} }}" for identifier, style in self._styles.items()])
+        return self._text
+
+    def freeze(self) -> "FrozenQSS":
+        """Returns an immutable and hashable copy of the rules, equal rules share the same instance"""
+        return FrozenQSS(self._styles)
+
+
+class FrozenQSS(QSS):
+    """
+    Immutable QSS rules, hashable and interned: freezing equal rules twice gives the same instance.
+    """
+    _interned: Dict[Tuple[Tuple[str, str], ...], "FrozenQSS"] = {}
+
+    def __new__(cls, styles: Dict[str, str]) -> "FrozenQSS":
+        key = tuple(styles.items())
+        interned = cls._interned.get(key)
+        if interned is None:
+            interned = cls._interned[key] = super().__new__(cls)
+            interned._key = key
+            interned._styles = dict(styles)
+            interned._text = None
+        return interned
+
+    def __init__(self, styles: Dict[str, str]) -> None:
+        pass
+
+    def set(self, identifier: str, style: "Style") -> Self:
+        raise TypeError("frozen QSS can not be modified")
+
+    def remove(self, identifier: str) -> Self:
+        raise TypeError("frozen QSS can not be modified")
+
+    def freeze(self) -> "FrozenQSS":
+        return self
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrozenQSS) and self._key == other._key
 
 
 class Style(AlignableStyle, Bordered, PaddedStyle, Margined, OpacityEditable, CursorEditable, BackgroundChangeable, FontEditable, FontColorizable, TextEditable, Displayable, Outlined):
@@ -212,15 +312,30 @@ class Style(AlignableStyle, Bordered, PaddedStyle, Margined, OpacityEditable, Cu
         else:
             self.properties = {}
 
+    @property
+    def properties(self) -> Properties:
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties: Dict[str, str]) -> None:
+        self._properties = properties if isinstance(properties, Properties) else Properties(properties)
+
     def add(self, qssIdentifier: str, value: str):
         self.properties[qssIdentifier] = value
         return self
 
     def to_str(self):
-        content = "\n".join(
-            [f"{k}:{v};" for k, v in self.properties.items()])
+        """Compiles the properties, the text is kept until a property changes"""
+        content = self.properties.text
+        if content is None:
+            content = self.properties.text = "\n".join(
+                [f"{k}:{v};" for k, v in self.properties.items()])
         return content
 
+    def freeze(self) -> "FrozenStyle":
+        """Returns an immutable and hashable copy of the style, equal styles share the same instance"""
+        return FrozenStyle(self.properties)
+
     def merge(self, other: "Style") -> "Style":
         copy = self.properties.copy()
         copy.update(other.properties)
@@ -231,6 +346,44 @@ class Style(AlignableStyle, Bordered, PaddedStyle, Margined, OpacityEditable, Cu
         return self
 
 
+class FrozenStyle(Style):
+    """
+    An immutable Style, hashable and interned: freezing equal styles twice gives the same instance,
+    so its text is compiled once however many widgets use it.
+    Setters raise a TypeError, `merge` still returns a new mutable Style.
+    """
+    _interned: Dict[Tuple[Tuple[str, Any], ...], "FrozenStyle"] = {}
+
+    def __new__(cls, properties: Dict[str, str] | None = None) -> "FrozenStyle":
+        key = tuple((properties or {}).items())
+        interned = cls._interned.get(key)
+        if interned is None:
+            interned = cls._interned[key] = super().__new__(cls)
+            interned._key = key
+            interned._properties = FrozenProperties(key)
+        return interned
+
+    def __init__(self, properties: Dict[str, str] | None = None) -> None:
+        pass
+
+    @property
+    def properties(self) -> Properties:
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties: Dict[str, str]) -> None:
+        raise TypeError("a frozen style can not be modified, merge it into a new Style instead")
+
+    def freeze(self) -> "FrozenStyle":
+        return self
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrozenStyle) and self._key == other._key
+
+
 class TextStyles:
     Title = Style().fontSize("40px")\
         .fontWeight(Style.FontWeightPolicy.Bold)
@@ -0,0 +1,292 @@
+import re
+import weakref
+from itertools import count
+from typing import Dict, List, Tuple
+from PyQt6 import sip
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication, QWidget
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+
+
+def parse_rules(style_sheet: str) -> List[Tuple[str, str]]:
+    """
+    Splits a stylesheet into its rules.
+
+    Declarations outside of any rule (an inline stylesheet such as `color:red;`) are returned with the `*` selector,
+    which is how Qt reads them.
+
+    Args:
+    - style_sheet: The stylesheet to split.
+
+    Returns:
+    - A list of (selector, declarations) pairs in the order of the stylesheet.
+    """
+    rules: List[Tuple[str, str]] = []
+    inline: List[str] = []
+    rest = _COMMENTS.sub("", style_sheet)
+    while rest:
+        opening = rest.find("{")
+        if opening < 0:
+            inline.append(rest)
+            break
+        closing = rest.find("}", opening)
+        if closing < 0:
+            closing = len(rest)
+        head = rest[:opening]
+        # declarations may precede the first rule when inline text was concatenated with rules
+        if ";" in head:
+            cut = head.rfind(";") + 1
+            inline.append(head[:cut])
+            head = head[cut:]
+        selector = " ".join(head.split())
+        if selector:
+            rules.append((selector, rest[opening + 1:closing].strip()))
+        rest = rest[closing + 1:]
+    declarations = " ".join(part.strip() for part in inline if part.strip(" \t\r\n;"))
+    if declarations:
+        rules.insert(0, ("*", declarations))
+    return rules
+
+
+def parse_declarations(declarations: str) -> Dict[str, str]:
+    """
+    Splits the declarations of a rule into a property map, a property declared twice keeps its last value.
+    """
+    properties: Dict[str, str] = {}
+    for declaration in declarations.split(";"):
+        name, colon, value = declaration.partition(":")
+        name = name.strip().lower()
+        if colon and name:
+            properties.pop(name, None)
+            properties[name] = value.strip()
+    return properties
+
+
+class StyleRules:
+    """
+    The rules of a widget stylesheet by selector, so that adding to it merges instead of appending text.
+
+    Merging a stylesheet updates the rules of the selectors it sets where they are, and only the properties a later
+    rule also sets move to a rule at the end, which gives the same result as appending it would, while the text stays
+    bounded by the number of distinct selectors and properties.
+
+    Args:
+    - style_sheet: Optional. The stylesheet to start from.
+    """
+
+    def __init__(self, style_sheet: str = "") -> None:
+        self.rules: List[Tuple[str, Dict[str, str]]] = []
+        """The selector and properties of every rule in order, a selector shows up again when properties moved"""
+        self.text = ""
+        self.merge(style_sheet)
+
+    def merge(self, style_sheet: str) -> str:
+        """
+        Merges a stylesheet into the rules.
+
+        Returns:
+        - The resulting stylesheet.
+        """
+        for selector, declarations in parse_rules(style_sheet):
+            properties = parse_declarations(declarations)
+            last = max((n for n, (other, _) in enumerate(self.rules) if other == selector), default=-1)
+            if last < 0:
+                self.rules.append((selector, properties))
+                continue
+            # a property set by a later rule must come after it, the others keep the position of the rule
+            later = {name for _, rule in self.rules[last + 1:] for name in rule}
+            for other, rule in self.rules:
+                if other == selector:
+                    for name in properties:
+                        rule.pop(name, None)
+            self.rules[last][1].update((name, value) for name, value in properties.items() if name not in later)
+            moved = {name: value for name, value in properties.items() if name in later}
+            if moved:
+                self.rules.append((selector, moved))
+            self.rules = [(other, rule) for other, rule in self.rules if rule]
+        self.text = self.to_str()
+        return self.text
+
+    def to_str(self) -> str:
+        """
+        Returns the stylesheet of the rules, inline when there are only declarations for the widget itself.
+        """
+        if len(self.rules) == 1 and self.rules[0][0] == "*":
+            return StyleRules._declarations(self.rules[0][1])
+        return "".join(f"{selector}{{{StyleRules._declarations(rule)}}}" for selector, rule in self.rules)
+
+    @staticmethod
+    def _declarations(rule: Dict[str, str]) -> str:
+        return "".join(f"{name}:{value};" for name, value in rule.items())
+
+
+def _subject(selector: str, attribute: str) -> str:
+    """Adds the attribute to the rightmost part of the selector, before its pseudo states and subcontrols"""
+    cut = max(selector.rfind(" "), selector.rfind(">")) + 1
+    head, last = selector[:cut], selector[cut:]
+    pseudo = last.find(":")
+    if pseudo < 0:
+        return f"{head}{last}{attribute}"
+    return f"{head}{last[:pseudo]}{attribute}{last[pseudo:]}"
+
+
+def apply_style_sheet(widget: QWidget, style_sheet: str) -> None:
+    """
+    Sets the stylesheet of any widget, through the StyleRegistry when it is enabled.
+    """
+    if StyleRegistry.enabled:
+        StyleRegistry.register(widget, style_sheet)
+    else:
+        widget.setStyleSheet(style_sheet)
+
+
+class StyleRegistry:
+    """
+    Collects the stylesheets of Stylable widgets into a single application stylesheet.
+
+    Setting a stylesheet on a widget makes Qt parse it and polish the widget on its own, for every widget.
+    Once the registry is enabled, `Stylable` hands it the stylesheet instead: widgets with the same stylesheet
+    share one key, stored in their `styleKey` property, and the rules of every key are compiled once, scoped
+    with that property so they keep applying to the widget and its children only.
+    The application stylesheet is rebuilt at most once per pass of the event loop, `flush` forces it.
+
+    The own rules of a widget are emitted after the rules it inherits from its parents so they take precedence,
+    as a widget stylesheet would.
+    The registry only handles widgets styled after `enable`, it should be enabled before building the interface.
+    """
+    enabled = False
+    property_name = "styleKey"
+    _keys: Dict[str, int] = {}
+    _texts: Dict[int, str] = {}
+    _rules: Dict[int, Tuple[str, str]] = {}
+    _users: Dict[int, int] = {}
+    _widgets: Dict[int, Tuple["weakref.ref[QWidget]", int]] = {}
+    _tokens = count()
+    _counter = count()
+    _base: str = ""
+    _compiled: str | None = None
+    _moved: List["weakref.ref[QWidget]"] = []
+    _pending = False
+
+    @staticmethod
+    def enable(enabled: bool = True) -> None:
+        """
+        Turns the registry on or off, the stylesheet already set on the application is kept in front of the rules.
+        """
+        if enabled and not StyleRegistry.enabled:
+            app = QApplication.instance()
+            StyleRegistry._base = app.styleSheet() if app is not None else ""  # type: ignore
+        StyleRegistry.enabled = enabled
+
+    @staticmethod
+    def register(widget: QWidget, style_sheet: str) -> None:
+        """
+        Sets the stylesheet of a widget through the application stylesheet.
+
+        Args:
+        - widget: The widget to style.
+        - style_sheet: Its stylesheet, as it would be passed to setStyleSheet.
+        """
+        token = getattr(widget, "_style_token", None)
+        if token is None:
+            if not style_sheet:
+                return
+            token = widget._style_token = next(StyleRegistry._tokens)  # type: ignore
+            widget.destroyed.connect(lambda *_: StyleRegistry._release(token))
+        else:
+            StyleRegistry._release(token)
+        widget._style_sheet = style_sheet  # type: ignore
+        if not style_sheet:
+            widget.setProperty(StyleRegistry.property_name, None)
+            StyleRegistry._moved.append(weakref.ref(widget))
+            StyleRegistry._schedule()
+            return
+        key = StyleRegistry._keys.get(style_sheet)
+        if key is None:
+            key = StyleRegistry._keys[style_sheet] = next(StyleRegistry._counter)
+            StyleRegistry._texts[key] = style_sheet
+            StyleRegistry._rules[key] = StyleRegistry.scope(style_sheet, key)
+            StyleRegistry._compiled = None
+        StyleRegistry._users[key] = StyleRegistry._users.get(key, 0) + 1
+        StyleRegistry._widgets[token] = (weakref.ref(widget), key)
+        widget.setProperty(StyleRegistry.property_name, str(key))
+        StyleRegistry._moved.append(weakref.ref(widget))
+        StyleRegistry._schedule()
+
+    @staticmethod
+    def style_sheet(widget: QWidget) -> str:
+        """
+        Returns the stylesheet registered for a widget, empty if there is none.
+        """
+        return getattr(widget, "_style_sheet", "")
+
+    @staticmethod
+    def scope(style_sheet: str, key: int) -> Tuple[str, str]:
+        """
+        Rewrites a widget stylesheet so that it only applies under the widgets holding the key.
+
+        Returns:
+        - The rules matching the children of those widgets and the rules matching the widgets themselves.
+        """
+        attribute = f'[{StyleRegistry.property_name}="{key}"]'
+        inherited, own = [], []
+        for selectors, declarations in parse_rules(style_sheet):
+            for selector in selectors.split(","):
+                selector = selector.strip()
+                inherited.append(f"{attribute} {selector}{{{declarations}}}")
+                own.append(f"{_subject(selector, attribute)}{{{declarations}}}")
+        return "\n".join(inherited), "\n".join(own)
+
+    @staticmethod
+    def compile() -> str:
+        """
+        Returns the application stylesheet made of the base stylesheet and the rules of every key in use.
+        """
+        if StyleRegistry._compiled is None:
+            for key in [key for key, users in StyleRegistry._users.items() if users <= 0]:
+                StyleRegistry._drop(key)
+            rules = StyleRegistry._rules.values()
+            StyleRegistry._compiled = "\n".join(
+                [StyleRegistry._base] + [inherited for inherited, _ in rules] + [own for _, own in rules])
+        return StyleRegistry._compiled
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Applies the pending changes now instead of waiting for the event loop.
+        """
+        StyleRegistry._pending = False
+        app = QApplication.instance()
+        if app is None:
+            return
+        style_sheet = StyleRegistry.compile()
+        moved, StyleRegistry._moved = StyleRegistry._moved, []
+        if app.styleSheet() != style_sheet:  # type: ignore
+            app.setStyleSheet(style_sheet)  # type: ignore
+            return
+        # the rules did not change, only the widgets which changed key need to be polished again
+        for ref in moved:
+            widget = ref()
+            if widget is not None and not sip.isdeleted(widget):
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
+
+    @staticmethod
+    def _schedule() -> None:
+        if not StyleRegistry._pending:
+            StyleRegistry._pending = True
+            QTimer.singleShot(0, StyleRegistry.flush)
+
+    @staticmethod
+    def _release(token: int) -> None:
+        entry = StyleRegistry._widgets.pop(token, None)
+        if entry is not None:
+            # the rules are dropped on the next compilation, no need to restyle the application for that alone
+            StyleRegistry._users[entry[1]] -= 1
+
+    @staticmethod
+    def _drop(key: int) -> None:
+        del StyleRegistry._rules[key]
+        del StyleRegistry._users[key]
+        del StyleRegistry._keys[StyleRegistry._texts.pop(key)]
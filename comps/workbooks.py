@@ -0,0 +1,48 @@
+"""
+Reads the rows of Excel workbooks, meant to run in a worker process (see comps.importers): parsing a workbook is
+CPU-bound, a thread would hold the GIL away from the GUI. It only depends on openpyxl so the process starts quickly.
+"""
+from itertools import count
+from typing import Any, Dict, Iterator, List, Tuple
+
+_sheets: Dict[int, Tuple[Any, Iterator[Tuple[Any, ...]]]] = {}
+_tokens = count()
+
+
+def open_sheet(path: str) -> Tuple[int, int]:
+    """
+    Opens the first sheet of a workbook in read-only mode.
+
+    Returns:
+    - The token to read the rows with, and the number of rows of the sheet as the workbook declares it.
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError("importing Excel workbooks needs openpyxl (pip install openpyxl)") from None
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    sheet = workbook.worksheets[0]
+    token = next(_tokens)
+    _sheets[token] = (workbook, sheet.iter_rows(values_only=True))
+    return token, sheet.max_row or 0
+
+
+def read_rows(token: int, size: int) -> List[Tuple[Any, ...]]:
+    """
+    Returns the next rows of a sheet opened by `open_sheet`, an empty list once they were all read.
+    """
+    rows = []
+    for row in _sheets[token][1]:
+        rows.append(row)
+        if len(rows) == size:
+            break
+    return rows
+
+
+def close_sheet(token: int) -> None:
+    """
+    Closes a sheet opened by `open_sheet`.
+    """
+    workbook, _ = _sheets.pop(token, (None, None))
+    if workbook is not None:
+        workbook.close()
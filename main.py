@@ -1,17 +1,21 @@
 import os
-import re
-from typing import Dict, List, Tuple
-from comps import *
-from PyQt6.QtWidgets import QApplication, QLayout, QMainWindow,QStyleFactory, QWidget,QAbstractItemView
-from pandas import DataFrame, read_excel, read_csv, read_json
-from csv import reader
 import sys
-import json
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QAbstractItemView, QApplication, QFileDialog, QSizePolicy, QStyleFactory
 
-from comps.Elements import GroupBox, Spacer, Stretch
-from comps.styles import Style
-import socket
-import re
+from comps import (Button, ButtonGroup, CheckBox, ComboBox, Field, FilterBar, Finder, GroupBox, HDivider, Heading,
+                   Horizontal, Label, MultilineAssistedField, NavigationBar, NavigationLink, ProgressBar, RadioButton,
+                   ScrollableContainer, SourceView, Spacer, SpinBox, Text, Toggle, Vertical, VirtualListWidget, Window)
+from comps.exporters import FILTERS, Exporter, format_of
+from comps.importers import Importer
+from comps.loaders import BackgroundTask
+from comps.models import ColumnTableModel
+
+if TYPE_CHECKING:
+    # comps.sources pulls in numpy, it is imported once a file is previewed
+    from comps.sources import MappedLines
 
 def matchTo(selection:int, values:List|Tuple) -> str:
     if selection >= len(values):
@@ -25,32 +29,46 @@ class FormField(Vertical):
     def get(self) -> str:
         return self.field.text()
 class ListBox(Vertical):
-    def __init__(self,title:str="",on_add:Callable[[ListWidget],None]|None=None):
+    def __init__(self,title:str="",on_add:Callable[[VirtualListWidget],None]|None=None):
         super().__init__()
         self.set_name("ListBox")
-        self.list = ListWidget()
+        self.list = VirtualListWidget(unique=True)
         self.list.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
+        self.filter = FilterBar(self.list)
+        self.loader: BackgroundTask | None = None
+        self.progress = ProgressBar()
+        self.loading = Horizontal(self.progress, Button("Cancel").action(self.cancel_task))
+        self.loading.hide()
         self.add(GroupBox(
             (
+                self.filter,
                 self.list,
-                [Button("Open").action(self.open),Button("Export").action(self.export),Spacer(),Button("+").action(lambda:on_add(self.list) if on_add is not None else None),Button("-")]
+                self.loading,
+                [Button("Open").action(self.open),Button("Export").action(self.export),Spacer(),Button("+").action(lambda:on_add(self.list) if on_add is not None else None),Button("-").action(self.remove_selected)]
             ),
             title
         ).expand(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
     def open(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select file", "", "All Files (*)")
         if path and os.path.isfile(path) or os.path.islink(path):
-            with open(path, "r") as file:
-                for line in file:
-                    self.list.add(line.strip())
+            # a list file holds an entry per line, a CSV one included, the other formats give their first column
+            self.run(Importer(path, self.list, format="text" if format_of(path) == "csv" else None, parent=self))
+    def remove_selected(self):
+        self.list.remove_many(self.list.selected_rows())
+    def cancel_task(self):
+        if self.loader is not None:
+            self.loader.cancel()
     def export(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Select destination", "", "Plain text file (*.txt);;All files (*.*)")
+        path, selected = QFileDialog.getSaveFileName(self, "Select destination", "", ";;".join(FILTERS.values()))
         if path:
-            with open(path, "w") as file:
-                for index in range(self.list.count()):
-                    item = self.list.item(index)
-                    if item is not None:
-                        file.write(item.text()+"\n")
+            # the extension typed wins over the selected filter
+            self.run(Exporter(self.list, path, None if os.path.splitext(path)[1] else selected, parent=self))
+    def run(self, task: BackgroundTask):
+        self.cancel_task()
+        self.loader = task.track(self.progress)
+        self.loader.ended.connect(self.loading.hide)
+        self.loading.show()
+        self.loader.start()
 
 class SendingValidator(Vertical):
     def __init__(self,text:str) -> None:
@@ -96,6 +114,8 @@ class MainWindow(Window):
         super().__init__()
 
         self.deviceType = ButtonGroup()
+        self.previews: Dict[str, "MappedLines | Importer"] = {}
+        self.exports: Dict[str, Exporter] = {}
         self.sendingParams=ButtonGroup()
 
         welcome_section = (
@@ -113,7 +133,30 @@ class MainWindow(Window):
             ),
             Spacer()
         )
-        configure_section = ScrollableContainer(
+        run_section = (
+            Heading("Select a script"),
+            HDivider(),
+            GroupBox([Button("Select").set_icon(QIcon("folder.png")), Label("Current: None"),Spacer()], "Load script"),
+            Spacer()
+        )
+        # Creating components using your library
+        main_layout = Vertical(
+            NavigationBar(
+                Heading("QINSTA"),
+                NavigationLink("HOME")   .target(welcome_section),
+                NavigationLink("SCRIPTS").target(self.configure_section),
+                NavigationLink("RUN")    .target(run_section)
+            ).id("navbar"),
+        ).pl(5).pr(5)
+
+        self.setCentralWidget(main_layout)
+
+        # Setting up the main window properties
+        self.setGeometry(100, 100, 800, 600)
+        self.setWindowTitle("QInsta")
+    def configure_section(self) -> ScrollableContainer:
+        # built the first time the SCRIPTS page is opened
+        return ScrollableContainer(
             Vertical(
                 #region TITLE PART
                 [Heading("Configure"),Spacer(),Button("Open"),Button("Save as"),Button("New")],
@@ -123,11 +166,13 @@ class MainWindow(Window):
                     (
                         GroupBox(
                             ([Text("Current:"), Text("None").id("currentUserList").wrap(True)],
-                            [Button("Open").action(self.load_user_list), Spacer(), Button("Export to"), ComboBox(["CSV", "JSON", "EXCEL", "PLAIN TEXT"]).id("exportType")]
+                            SourceView().id("userListPreview"),
+                            [Button("Open").action(self.load_user_list), Spacer(), Button("Export to").action(lambda: self.export_list("userListPreview", "currentUserList", "exportUserType")), ComboBox(["CSV", "JSON", "EXCEL", "PLAIN TEXT"]).id("exportUserType")]
                             ),"Users list"),
                         GroupBox(
                             ([Text("Current:"), Text("None").id("currentAccsList").wrap(True)],
-                            [Button("Open").action(self.load_accounts_list), Spacer(), Button("Export to"), ComboBox(["CSV", "JSON", "EXCEL", "PLAIN TEXT"]).id("exportType")]
+                            SourceView().id("accsListPreview"),
+                            [Button("Open").action(self.load_accounts_list), Spacer(), Button("Export to").action(lambda: self.export_list("accsListPreview", "currentAccsList", "exportAccsType")), ComboBox(["CSV", "JSON", "EXCEL", "PLAIN TEXT"]).id("exportAccsType")]
                             ),"Accounts list"),
 
                         ListBox("Proxy list",on_add=self.add_proxy),
@@ -145,14 +190,14 @@ class MainWindow(Window):
                                     Toggle().id("enablemsg").check(True).pl(5).pr(5).setW(35).setH(28),
                                     Spacer()
                                 ).align(Qt.AlignmentFlag.AlignTop),
-                                MultilineAssistedField("",True,["{username}","{name}","{followers}","{following}","{separator}"],"message").visible("enablemsg"),
+                                MultilineAssistedField("",True,["{username}","{name}","{followers}","{following}","{separator}"],"message", plain_text=True).visible("enablemsg"),
                                 Spacer()
                             ),
                             #endregion
                             #region COMMENTS
                             (
                                 Horizontal(Text("Send comments"),Toggle().id("enablecomment").check(True).pl(5).pr(5).setW(35).setH(28),Spacer()).align(Qt.AlignmentFlag.AlignTop),
-                                MultilineAssistedField("", True, ["{username}", "{name}", "{followers}", "{following}", "{separator}", "{likes}", "{comments}"], "comment").visible("enablecomment"),
+                                MultilineAssistedField("", True, ["{username}", "{name}", "{followers}", "{following}", "{separator}", "{likes}", "{comments}"], "comment", plain_text=True).visible("enablecomment"),
                                 Spacer()
                             )
                             # endregion
@@ -256,32 +301,11 @@ class MainWindow(Window):
                 Spacer(),
             ).align(Qt.AlignmentFlag.AlignTop)
         ).h(Qt.ScrollBarPolicy.ScrollBarAlwaysOff).v(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
-        run_section = (
-            Heading("Select a script"),
-            HDivider(),
-            GroupBox([Button("Select").set_icon(QIcon("folder.png")), Label("Current: None"),Spacer()], "Load script"),
-            Spacer()
-        )
-        # Creating components using your library
-        main_layout = Vertical(
-            NavigationBar(
-                Heading("QINSTA"),
-                NavigationLink("HOME")   .target(welcome_section),
-                NavigationLink("SCRIPTS").target(configure_section),
-                NavigationLink("RUN")    .target(run_section)
-            ).id("navbar"),
-        ).pl(5).pr(5)
-
-        self.setCentralWidget(main_layout)
-
-        # Setting up the main window properties
-        self.setGeometry(100, 100, 800, 600)
-        self.setWindowTitle("QInsta")
     def delete_selected_parameter(self, widget_id):
         idx = Finder.get(widget_id).currentIndex() # type: ignore
         if idx:
             Finder.get(widget_id).remove(idx.row()) # type: ignore
-    def add_proxy(self,lst:ListWidget):
+    def add_proxy(self,lst:VirtualListWidget):
         self.win = Vertical()
         self.win.setWindowTitle("Add Proxy")
         connection_type = ComboBox(["HTTP", "HTTPS"])
@@ -313,12 +337,63 @@ class MainWindow(Window):
             self, "Open file", "", "Plain text (*.txt);;Comma separated values (*.csv);;JSON dictionary (*.json);;Excel XML (>2016) (*.xlsx)")
         if path:
             Finder.get("currentUserList").setText(path)
+            self.preview(path, "userListPreview")
 
     def load_accounts_list(self):
         path, _ = QFileDialog.getOpenFileName(
             self, "Open file", "", "Plain text (*.txt);;Comma separated values (*.csv);;JSON dictionary (*.json);;Excel XML (>2016) (*.xlsx)")
         if path:
             Finder.get("currentAccsList").setText(path)
+            self.preview(path, "accsListPreview")
+    def export_list(self, view_id:str, current_id:str, format_id:str):
+        source = Finder.get(current_id).text()
+        if not os.path.isfile(source):
+            self.statusBar().showMessage("Open a list to export it", 5000)
+            return
+        if isinstance(self.previews.get(view_id), Importer):
+            # json and xlsx lists are exported from what was imported
+            source = Finder.get(view_id).source_model
+        format = format_of("", Finder.get(format_id).get())
+        path, _ = QFileDialog.getSaveFileName(self, "Export to", "", FILTERS[format])
+        if not path:
+            return
+        if format_id in self.exports:
+            self.exports.pop(format_id).cancel()
+        exporter = self.exports[format_id] = Exporter(source, path, format, parent=self)
+        exporter.finished.connect(lambda: self.statusBar().showMessage(f"Exported to {path}", 5000))
+        exporter.failed.connect(lambda error: self.statusBar().showMessage(f"Export failed: {error}"))
+        exporter.progressed.connect(lambda percent: self.statusBar().showMessage(f"Exporting to {path}: {percent}%"))
+        exporter.start()
+    def preview(self, path:str, view_id:str):
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in (".txt", ".csv", ".json", ".xlsx"):
+            # the current preview stays as it is
+            self.statusBar().showMessage(f"Cannot preview {path}", 5000)
+            return
+        if extension in (".txt", ".csv"):
+            try:
+                from comps.sources import MappedLines
+            except ImportError as error:
+                self.statusBar().showMessage(f"Cannot preview {path}: {error}", 5000)
+                return
+        if view_id in self.previews:
+            previous = self.previews.pop(view_id)
+            if isinstance(previous, Importer):
+                previous.cancel()
+            else:
+                previous.close()
+        if extension in (".json", ".xlsx"):
+            model = ColumnTableModel(self)
+            importer = self.previews[view_id] = Importer(path, model, parent=self)
+            importer.failed.connect(lambda error: self.statusBar().showMessage(f"Could not read {path}: {error}"))
+            importer.progressed.connect(lambda percent: self.statusBar().showMessage(f"Reading {path}: {percent}%"))
+            importer.finished.connect(self.statusBar().clearMessage)
+            Finder.get(view_id).set_source(model, columns=True)
+            importer.start()
+            return
+        self.previews[view_id] = MappedLines(path, records=extension == ".csv", parent=self)
+        Finder.get(view_id).set_source(self.previews[view_id], columns=extension == ".csv")
+        self.previews[view_id].open()
 
 
 if __name__ == "__main__":